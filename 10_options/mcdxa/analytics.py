@@ -1,8 +1,9 @@
 # core pricing functions
-from .bsm     import norm_cdf, bsm_price
+from .bsm     import norm_cdf, bsm_price, bsm_price_vec, bsm_greeks_vec, implied_vol_vec
 from .merton  import merton_price
 from .heston  import heston_price
 from .bates   import simulate_bates, bates_price
+from .fourier import lewis_price, carr_madan_price, cos_price
 
 # Test script with provided parameters
 if __name__ == "__main__":
@@ -1,6 +1,6 @@
 import numpy as np
-import math
-from scipy.integrate import quad
+
+from .fourier import bates_char_func, lewis_price
 from .models import Bates
 
 
@@ -29,9 +29,9 @@ def simulate_bates(
 
 
 def bates_price(
-    S0: float,
-    K: float,
-    T: float,
+    S0,
+    K,
+    T,
     r: float,
     kappa: float,
     theta: float,
@@ -44,43 +44,21 @@ def bates_price(
     q: float = 0.0,
     option_type: str = "call",
     integration_limit: float = 250,
-) -> float:
+    n_nodes: int = 256,
+):
     """
     Bates (1996) model price for European call or put via Lewis (2001) single-integral.
 
     Combines Heston stochastic volatility characteristic function
-    with log-normal jumps (Merton).
+    with log-normal jumps (Merton). S0, K and T may be arrays; the
+    characteristic function is evaluated once per maturity and shared by all
+    strikes, and kept across calls in mcdxa.fourier.CF_CACHE (see
+    mcdxa.fourier.lewis_price).
     """
-    def _char_heston(u):
-        d = np.sqrt((kappa - rho * xi * u * 1j) ** 2 + (u ** 2 + u * 1j) * xi ** 2)
-        g = (kappa - rho * xi * u * 1j - d) / (kappa - rho * xi * u * 1j + d)
-        # add jump drift compensator E[Y - 1]
-        kappa_j = math.exp(mu_j + 0.5 * sigma_j ** 2) - 1
-        C = (
-            (r - q - lam * kappa_j) * u * 1j * T
-            + (kappa * theta / xi ** 2)
-            * ((kappa - rho * xi * u * 1j - d) * T
-               - 2 * np.log((1 - g * np.exp(-d * T)) / (1 - g)))
-        )
-        D = ((kappa - rho * xi * u * 1j - d) / xi ** 2) * \
-            ((1 - np.exp(-d * T)) / (1 - g * np.exp(-d * T)))
-        return np.exp(C + D * v0)
-
-    def _char_bates(u):
-        # add jump component to characteristic function
-        jump_cf = np.exp(lam * T * (np.exp(1j * u * mu_j - 0.5 * u ** 2 * sigma_j ** 2) - 1))
-        return _char_heston(u) * jump_cf
-
-    def _lewis_integrand(u):
-        cf_val = _char_bates(u - 0.5j)
-        return (np.exp(1j * u * math.log(S0 / K)) * cf_val).real / (u ** 2 + 0.25)
-
-    integral_value = quad(_lewis_integrand, 0, integration_limit)[0]
-    call_price = S0 * math.exp(-q * T) - math.exp(-r * T) * math.sqrt(S0 * K) / math.pi * integral_value
-    if option_type == "call":
-        price = call_price
-    elif option_type == "put":
-        price = call_price - S0 * math.exp(-q * T) + K * math.exp(-r * T)
-    else:
-        raise ValueError("Option type must be 'call' or 'put'.")
-    return max(price, 0.0)
+    return lewis_price(
+        lambda u, t: bates_char_func(
+            u, t, r, kappa, theta, xi, rho, v0, lam, mu_j, sigma_j, q),
+        S0, K, T, r, q=q, option_type=option_type,
+        integration_limit=integration_limit, n_nodes=n_nodes,
+        cache_key=("bates", r, kappa, theta, xi, rho, v0, lam, mu_j, sigma_j, q),
+    )
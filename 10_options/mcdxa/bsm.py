@@ -1,5 +1,13 @@
 import math
 
+import numpy as np
+from scipy.special import ndtr
+
+from .utils import call_mask
+
+_SQRT_2PI = math.sqrt(2 * math.pi)
+
+
 def norm_cdf(x: float) -> float:
     """Standard normal cumulative distribution function."""
     return 0.5 * (1.0 + math.erf(x / math.sqrt(2)))
@@ -46,3 +54,160 @@ def bsm_price(
         return K * math.exp(-r * T) * norm_cdf(-d2) - S0 * math.exp(-q * T) * norm_cdf(-d1)
     else:
         raise ValueError("option_type must be 'call' or 'put'")
+
+
+def bsm_price_vec(S0, K, T, r, sigma, q=0.0, option_type="call"):
+    """
+    Vectorized Black-Scholes-Merton price for arrays of European options.
+
+    All numeric inputs broadcast against each other, e.g. a column of
+    maturities against a row of strikes prices a whole surface in one call.
+    Entries with zero volatility or zero maturity get the discounted forward
+    intrinsic value, as in bsm_price.
+
+    Parameters:
+    - S0: Spot price(s)
+    - K: Strike price(s)
+    - T: Time(s) to maturity (in years)
+    - r: Risk-free interest rate(s)
+    - sigma: Volatility(ies) of the underlying asset
+    - q: Dividend yield(s)
+    - option_type: 'call', 'put', an array of these strings, or a boolean
+      mask that is True for calls
+
+    Returns:
+    - price: Array of option prices (float for scalar inputs)
+    """
+    S0, K, T, r, sigma, q = (np.asarray(x, dtype=float) for x in (S0, K, T, r, sigma, q))
+    is_call = call_mask(option_type)
+    fwd_spot, pv_strike, live, vol_sqrt_t, d1, d2 = _bsm_terms(S0, K, T, r, sigma, q)
+
+    call = fwd_spot * ndtr(d1) - pv_strike * ndtr(d2)
+    put = pv_strike * ndtr(-d2) - fwd_spot * ndtr(-d1)
+    forward = fwd_spot - pv_strike
+    price = np.where(
+        live,
+        np.where(is_call, call, put),
+        np.where(is_call, np.maximum(forward, 0.0), np.maximum(-forward, 0.0)),
+    )
+    return price[()]
+
+
+def bsm_greeks_vec(S0, K, T, r, sigma, q=0.0, option_type="call"):
+    """
+    Vectorized Black-Scholes-Merton Greeks for arrays of European options.
+
+    Inputs broadcast as in bsm_price_vec. Vega and rho are per unit change
+    of sigma and r, theta is -dV/dT per year. Entries with zero volatility
+    or zero maturity get the Greeks of the discounted forward intrinsic
+    value (zero gamma and vega).
+
+    Parameters:
+    - S0: Spot price(s)
+    - K: Strike price(s)
+    - T: Time(s) to maturity (in years)
+    - r: Risk-free interest rate(s)
+    - sigma: Volatility(ies) of the underlying asset
+    - q: Dividend yield(s)
+    - option_type: 'call', 'put', an array of these strings, or a boolean
+      mask that is True for calls
+
+    Returns:
+    - greeks: Dict 'delta', 'gamma', 'vega', 'theta', 'rho' -> array of
+      values (float for scalar inputs)
+    """
+    S0, K, T, r, sigma, q = (np.asarray(x, dtype=float) for x in (S0, K, T, r, sigma, q))
+    is_call = call_mask(option_type)
+    fwd_spot, pv_strike, live, vol_sqrt_t, d1, d2 = _bsm_terms(S0, K, T, r, sigma, q)
+
+    # signed quantities: phi = +1 for calls, -1 for puts
+    phi = np.where(is_call, 1.0, -1.0)
+    # N(phi d1), N(phi d2) for live entries; exercise indicator otherwise
+    itm = phi * (fwd_spot - pv_strike) > 0
+    n1 = np.where(live, ndtr(phi * d1), itm)
+    n2 = np.where(live, ndtr(phi * d2), itm)
+    pdf = np.where(live, np.exp(-0.5 * d1 ** 2) / _SQRT_2PI, 0.0)
+    sqrt_t = np.sqrt(np.maximum(T, 0.0))
+
+    greeks = {
+        "delta": phi * np.exp(-q * T) * n1,
+        "gamma": np.exp(-q * T) * pdf / (S0 * vol_sqrt_t),
+        "vega": fwd_spot * pdf * sqrt_t,
+        "theta": (-fwd_spot * pdf * sigma / (2 * np.where(live, sqrt_t, 1.0))
+                  + phi * (q * fwd_spot * n1 - r * pv_strike * n2)),
+        "rho": phi * T * pv_strike * n2,
+    }
+    values = np.broadcast_arrays(*greeks.values())
+    return {name: np.array(value)[()] for name, value in zip(greeks, values)}
+
+
+def implied_vol_vec(price, S0, K, T, r, q=0.0, option_type="call",
+                    tol: float = 1e-10, max_iter: int = 100):
+    """
+    Vectorized Black-Scholes-Merton implied volatility of option quotes.
+
+    All quotes are inverted together by a safeguarded Newton iteration:
+    each entry starts at the Manaster-Koehler point sqrt(2 |ln(F/K)| / T)
+    (floored at 10%), keeps a bracket [lo, hi] updated from the sign of its
+    pricing error, and falls back to bisection whenever a Newton step would
+    leave the bracket. Quotes outside the no-arbitrage bounds, or with
+    T <= 0, give NaN.
+
+    Parameters:
+    - price: Option price(s)
+    - S0: Spot price(s)
+    - K: Strike price(s)
+    - T: Time(s) to maturity (in years)
+    - r: Risk-free interest rate(s)
+    - q: Dividend yield(s)
+    - option_type: 'call', 'put', an array of these strings, or a boolean
+      mask that is True for calls
+    - tol: Absolute price tolerance
+    - max_iter: Maximum number of iterations
+
+    Returns:
+    - sigma: Array of implied volatilities (float for scalar inputs)
+    """
+    price, S0, K, T, r, q = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (price, S0, K, T, r, q)))
+    is_call = np.broadcast_to(call_mask(option_type), price.shape)
+    fwd_spot = S0 * np.exp(-q * T)
+    pv_strike = K * np.exp(-r * T)
+    intrinsic = np.maximum(np.where(is_call, 1.0, -1.0) * (fwd_spot - pv_strike), 0.0)
+    upper = np.where(is_call, fwd_spot, pv_strike)
+    valid = (T > 0) & (price >= intrinsic) & (price < upper)
+    T_pos = np.where(T > 0, T, 1.0)
+
+    sigma = np.array(np.maximum(np.sqrt(2 * np.abs(np.log(fwd_spot / pv_strike)) / T_pos), 0.1))
+    lo = np.zeros(price.shape)
+    hi = np.full(price.shape, 10.0)
+    active = np.array(valid)
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        s = sigma[active]
+        args = (S0[active], K[active], T_pos[active], r[active], s, q[active])
+        diff = bsm_price_vec(*args, option_type=is_call[active]) - price[active]
+        done = np.abs(diff) <= tol
+        lo[active] = np.where(diff < 0, s, lo[active])
+        hi[active] = np.where(diff > 0, s, hi[active])
+        vega = bsm_greeks_vec(*args, option_type=is_call[active])["vega"]
+        step = np.divide(diff, vega, out=np.full(s.shape, np.inf), where=vega > 0)
+        new = s - step
+        outside = ~((new > lo[active]) & (new < hi[active]))
+        new = np.where(outside, 0.5 * (lo[active] + hi[active]), new)
+        sigma[active] = np.where(done, s, new)
+        active[active] = ~done & (hi[active] - lo[active] > tol)
+    return np.where(valid, sigma, np.nan)[()]
+
+
+def _bsm_terms(S0, K, T, r, sigma, q):
+    """Discounted forward, PV of strike, live mask, sigma*sqrt(T), d1, d2."""
+    fwd_spot = S0 * np.exp(-q * T)
+    pv_strike = K * np.exp(-r * T)
+    live = (sigma > 0) & (T > 0)
+    # dummy unit volatility in degenerate entries keeps d1/d2 finite
+    vol_sqrt_t = np.where(live, sigma * np.sqrt(np.maximum(T, 0.0)), 1.0)
+    d1 = (np.log(S0 / K) + (r - q + 0.5 * sigma ** 2) * T) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+    return fwd_spot, pv_strike, live, vol_sqrt_t, d1, d2
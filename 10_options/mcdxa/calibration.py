@@ -0,0 +1,236 @@
+"""
+Calibration of the Heston and Bates models to implied-volatility surfaces.
+
+Model prices come from the Lewis formula of mcdxa.fourier: per maturity the
+characteristic function and its parameter gradient are evaluated once on
+the Gauss-Legendre grid, and prices and Jacobian rows of all strikes of
+that maturity follow from matrix products. Residuals are price errors
+divided by the market BSM vega, i.e. approximately implied-volatility
+errors, and are minimized with scipy.optimize.least_squares using the
+Jacobian from the characteristic-function gradient.
+"""
+import math
+
+import numpy as np
+from scipy.optimize import least_squares
+
+from .bsm import bsm_greeks_vec, bsm_price_vec
+from .fourier import gauss_legendre_grid, heston_exponents, jump_exponent
+from .utils import call_mask, parallel_map, worker_pool
+
+HESTON_PARAMS = ("kappa", "theta", "xi", "rho", "v0")
+BATES_PARAMS = HESTON_PARAMS + ("lam", "mu_j", "sigma_j")
+
+DEFAULT_X0 = {
+    "kappa": 2.0, "theta": 0.04, "xi": 0.5, "rho": -0.5, "v0": 0.04,
+    "lam": 0.5, "mu_j": -0.1, "sigma_j": 0.1,
+}
+DEFAULT_BOUNDS = {
+    "kappa": (1e-3, 20.0), "theta": (1e-4, 2.0), "xi": (1e-3, 5.0),
+    "rho": (-0.999, 0.999), "v0": (1e-4, 2.0),
+    "lam": (0.0, 5.0), "mu_j": (-1.0, 1.0), "sigma_j": (1e-3, 1.0),
+}
+
+
+def heston_cf_gradient(u, T: float, r: float, params, q: float = 0.0) -> tuple:
+    """
+    Heston characteristic function and its gradient in HESTON_PARAMS.
+
+    The derivatives in theta and v0 are analytic; those in kappa, xi and
+    rho are central differences of the characteristic function exponents.
+
+    Returns:
+    - cf: Characteristic function values, shape of u
+    - grad: Derivatives, shape (5,) + shape of u
+    """
+    kappa, theta, xi, rho, v0 = params
+    C, D = heston_exponents(u, T, r, kappa, theta, xi, rho, q)
+    cf = np.exp(C + D * v0)
+
+    grad = np.empty((5,) + np.shape(u), dtype=complex)
+    drift = (r - q) * u * 1j * T
+    grad[1] = (C - drift) / theta * cf
+    grad[4] = D * cf
+    for i in (0, 2, 3):
+        h = 1e-6 * max(1.0, abs(params[i]))
+        up, down = list(params[:4]), list(params[:4])
+        up[i] += h
+        down[i] -= h
+        C_up, D_up = heston_exponents(u, T, r, *up, q)
+        C_down, D_down = heston_exponents(u, T, r, *down, q)
+        grad[i] = ((C_up - C_down) + (D_up - D_down) * v0) / (2 * h) * cf
+    return cf, grad
+
+
+def bates_cf_gradient(u, T: float, r: float, params, q: float = 0.0) -> tuple:
+    """
+    Bates characteristic function and its gradient in BATES_PARAMS.
+
+    The Heston part is differentiated as in heston_cf_gradient; the jump
+    parameter derivatives are analytic.
+
+    Returns:
+    - cf: Characteristic function values, shape of u
+    - grad: Derivatives, shape (8,) + shape of u
+    """
+    lam, mu_j, sigma_j = params[5:]
+    heston_cf, heston_grad = heston_cf_gradient(u, T, r, params[:5], q)
+    jumps = np.exp(jump_exponent(u, T, lam, mu_j, sigma_j))
+    cf = heston_cf * jumps
+
+    jump_cf = np.exp(1j * u * mu_j - 0.5 * u ** 2 * sigma_j ** 2)
+    mean_jump = math.exp(mu_j + 0.5 * sigma_j ** 2)
+    grad = np.empty((8,) + np.shape(u), dtype=complex)
+    grad[:5] = heston_grad * jumps
+    grad[5] = T * (jump_cf - 1 - 1j * u * (mean_jump - 1)) * cf
+    grad[6] = lam * T * 1j * u * (jump_cf - mean_jump) * cf
+    grad[7] = lam * T * sigma_j * (-u ** 2 * jump_cf - 1j * u * mean_jump) * cf
+    return cf, grad
+
+
+MODELS = {
+    "heston": (HESTON_PARAMS, heston_cf_gradient),
+    "bates": (BATES_PARAMS, bates_cf_gradient),
+}
+
+
+def maturity_prices(model: str, params, S0: float, K: np.ndarray, T: float,
+                    r: float, q: float = 0.0, integration_limit: float = 250,
+                    n_nodes: int = 256) -> tuple:
+    """
+    Lewis call prices and their parameter Jacobian for strikes of one maturity.
+
+    Parameters:
+    - model: 'heston' or 'bates'
+    - params: Parameter values in the order of HESTON_PARAMS/BATES_PARAMS
+    - S0: Spot price
+    - K: Strike prices, shape (m,)
+    - T: Time to maturity (in years)
+    - r: Risk-free interest rate
+    - q: Dividend yield
+    - integration_limit: Upper bound for numerical integration
+    - n_nodes: Number of Gauss-Legendre nodes
+
+    Returns:
+    - call: Call prices, shape (m,)
+    - jac: Derivatives of the call prices, shape (m, n_params)
+    """
+    nodes, weights = gauss_legendre_grid(float(integration_limit), n_nodes)
+    lewis_weights = weights / (nodes ** 2 + 0.25)
+    cf, grad = MODELS[model][1](nodes - 0.5j, T, r, params, q)
+
+    x = np.log(S0 / K)[:, None] * nodes
+    cos_x, sin_x = np.cos(x), np.sin(x)
+    scale = math.exp(-r * T) * np.sqrt(S0 * K) / np.pi
+    call = S0 * math.exp(-q * T) - scale * (
+        (cos_x * cf.real - sin_x * cf.imag) @ lewis_weights)
+    jac = -scale[:, None] * (
+        cos_x @ (grad.real * lewis_weights).T - sin_x @ (grad.imag * lewis_weights).T)
+    return call, jac
+
+
+def calibrate_heston(S0: float, K, T, r: float, market_iv, q: float = 0.0,
+                     option_type="call", x0: dict = None, bounds: dict = None,
+                     n_workers: int = None, backend: str = "process",
+                     integration_limit: float = 250, n_nodes: int = 256) -> tuple:
+    """
+    Calibrate Heston parameters to an implied-volatility surface.
+
+    See calibrate for the arguments and return values.
+    """
+    return calibrate("heston", S0, K, T, r, market_iv, q, option_type, x0,
+                     bounds, n_workers, backend, integration_limit, n_nodes)
+
+
+def calibrate_bates(S0: float, K, T, r: float, market_iv, q: float = 0.0,
+                    option_type="call", x0: dict = None, bounds: dict = None,
+                    n_workers: int = None, backend: str = "process",
+                    integration_limit: float = 250, n_nodes: int = 256) -> tuple:
+    """
+    Calibrate Bates parameters to an implied-volatility surface.
+
+    See calibrate for the arguments and return values.
+    """
+    return calibrate("bates", S0, K, T, r, market_iv, q, option_type, x0,
+                     bounds, n_workers, backend, integration_limit, n_nodes)
+
+
+def calibrate(model: str, S0: float, K, T, r: float, market_iv, q: float = 0.0,
+              option_type="call", x0: dict = None, bounds: dict = None,
+              n_workers: int = None, backend: str = "process",
+              integration_limit: float = 250, n_nodes: int = 256) -> tuple:
+    """
+    Calibrate a Fourier-priced model to an implied-volatility surface.
+
+    Parameters:
+    - model: 'heston' or 'bates'
+    - S0: Spot price
+    - K: Strike prices of the quotes
+    - T: Maturities of the quotes (in years)
+    - r: Risk-free interest rate
+    - market_iv: Market implied volatilities of the quotes
+    - q: Dividend yield
+    - option_type: 'call', 'put', an array of these, or a boolean call mask
+    - x0: Starting values by parameter name (defaults in DEFAULT_X0)
+    - bounds: (lower, upper) by parameter name (defaults in DEFAULT_BOUNDS)
+    - n_workers: If given, price the maturities in parallel on a pool of
+      this many workers kept open for the whole calibration
+    - backend: 'process' or 'thread' worker pool
+    - integration_limit: Upper bound for numerical integration
+    - n_nodes: Number of Gauss-Legendre nodes
+
+    Returns:
+    - params: Dict of calibrated parameters
+    - result: scipy.optimize.OptimizeResult; result.fun holds the
+      vega-scaled residuals (approximate implied-volatility errors)
+    """
+    if model not in MODELS:
+        raise ValueError(f"model must be one of {tuple(MODELS)}")
+    names = MODELS[model][0]
+    x0 = {**DEFAULT_X0, **(x0 or {})}
+    bounds = {**DEFAULT_BOUNDS, **(bounds or {})}
+
+    K, T, market_iv, is_call = (x.ravel() for x in np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (K, T, market_iv)), call_mask(option_type)))
+    market = bsm_price_vec(S0, K, T, r, market_iv, q, is_call)
+    vega = np.maximum(bsm_greeks_vec(S0, K, T, r, market_iv, q, is_call)["vega"], 1e-8)
+    # model puts are calls minus the parameter-free parity term
+    parity = np.where(is_call, 0.0, S0 * np.exp(-q * T) - K * np.exp(-r * T))
+    maturities = np.unique(T)
+    groups = [T == t for t in maturities]
+
+    cache = {}
+
+    def evaluate(x, executor):
+        key = tuple(x)
+        if key not in cache:
+            cache.clear()
+            args = [(model, x, S0, K[sel], t, r, q, integration_limit, n_nodes)
+                    for t, sel in zip(maturities, groups)]
+            if executor is None:
+                parts = [maturity_prices(*a) for a in args]
+            else:
+                parts = parallel_map(maturity_prices, args, n_workers, executor=executor)
+            price = np.empty(len(T))
+            jac = np.empty((len(T), len(names)))
+            for sel, (call, jac_t) in zip(groups, parts):
+                price[sel] = call
+                jac[sel] = jac_t
+            cache[key] = ((price - parity - market) / vega, jac / vega[:, None])
+        return cache[key]
+
+    def solve(executor):
+        return least_squares(
+            lambda x: evaluate(x, executor)[0],
+            [x0[n] for n in names],
+            jac=lambda x: evaluate(x, executor)[1],
+            bounds=([bounds[n][0] for n in names], [bounds[n][1] for n in names]),
+            x_scale="jac",
+        )
+
+    if n_workers is None:
+        result = solve(None)
+    else:
+        with worker_pool(n_workers, backend) as executor:
+            result = solve(executor)
+    return dict(zip(names, result.x)), result
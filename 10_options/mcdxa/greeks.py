@@ -0,0 +1,102 @@
+"""
+Monte Carlo Greeks from a single simulation run.
+
+Delta, gamma, vega and rho are estimated on the same paths as the price,
+either pathwise (differentiating the payoff along each path) or by the
+likelihood-ratio method (weighting the payoff by the score of the density),
+which also handles discontinuous payoffs such as digitals.
+
+Vega is the derivative with respect to the diffusion volatility sigma for
+BSM and Merton and with respect to the initial volatility sqrt(v0) for
+Heston. The pathwise gamma is the mixed estimator: the likelihood-ratio
+derivative of the pathwise delta. For Heston, the likelihood-ratio weights
+of S0 come from the first time step (their variance grows as n_steps
+increases), and vega and rho are always pathwise; the Heston Greeks run
+the Euler scheme in float64 NumPy whatever the model's dtype and backend.
+Antithetic pairs count as one sample each; QMC models are not supported.
+"""
+import math
+
+import numpy as np
+
+from .models import DEFAULT_CHUNK_SIZE, chunk_sizes
+from .monte_carlo import RunningStats
+
+GREEKS = ("price", "delta", "gamma", "vega", "rho")
+METHODS = ("pathwise", "likelihood_ratio")
+
+
+def mc_greeks(payoff, model, S0: float, T: float, r: float, n_paths: int,
+              n_steps: int = 1, rng: np.random.Generator = None,
+              method: str = "pathwise",
+              chunk_size: int = DEFAULT_CHUNK_SIZE) -> dict:
+    """
+    Price and Greeks of a terminal payoff from one Monte Carlo run.
+
+    Args:
+        payoff (callable): Payoff on terminal prices; the pathwise method
+            (and Heston vega and rho) also need payoff.derivative.
+        model: BSM, Merton or Heston model instance.
+        S0 (float): Initial asset price.
+        T (float): Time to maturity.
+        r (float): Risk-free rate.
+        n_paths (int): Number of Monte Carlo paths.
+        n_steps (int): Number of time steps per path (Heston only).
+        rng (np.random.Generator, optional): Random generator.
+        method (str): 'pathwise' or 'likelihood_ratio'.
+        chunk_size (int): Paths simulated per block.
+
+    Returns:
+        dict: Name ('price', 'delta', 'gamma', 'vega', 'rho') ->
+        (estimate, stderr).
+    """
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}")
+    if getattr(model, "qmc", False):
+        raise ValueError("Monte Carlo Greeks need a pseudo-random model (qmc=False)")
+    if rng is None:
+        rng = np.random.default_rng()
+    streams = model._streams(rng)
+    disc = math.exp(-r * T)
+
+    stats = RunningStats()
+    for n in chunk_sizes(n_paths, chunk_size):
+        g = model._greeks_block(S0, T, n, n_steps, streams)
+        ST = g["ST"]
+        f = payoff(ST)
+        score = g["a"] / (S0 * g["c"])
+        gamma_weight = (g["a"] ** 2 - g["a"] * g["c"] - g["k"]) / (S0 * g["c"]) ** 2
+        needs_derivative = (method == "pathwise" or g["vega_score"] is None
+                            or g["rho_score"] is None)
+        fd_S = _derivative(payoff, ST) * ST if needs_derivative else None
+
+        if method == "pathwise":
+            delta = fd_S / S0
+            gamma = delta * (score - 1 / S0)
+        else:
+            delta = f * score
+            gamma = f * gamma_weight
+        if method == "pathwise" or g["vega_score"] is None:
+            vega = fd_S * g["dlogS_dvol"]
+        else:
+            vega = f * g["vega_score"]
+        if method == "pathwise" or g["rho_score"] is None:
+            rho = T * (fd_S - f)
+        else:
+            rho = f * (g["rho_score"] - T)
+        samples = np.column_stack([f, delta, gamma, vega, rho])
+        if model.antithetic:
+            # each antithetic pair is one sample
+            samples = samples.reshape(-1, 2, len(GREEKS)).mean(axis=1)
+        stats.update(disc * samples)
+
+    return {name: (stats.mean[i], stats.stderr[i]) for i, name in enumerate(GREEKS)}
+
+
+def _derivative(payoff, ST):
+    """Payoff derivative, with a clear error for payoffs that lack one."""
+    try:
+        return payoff.derivative(ST)
+    except (AttributeError, NotImplementedError):
+        raise ValueError("pathwise Greeks need a payoff with a derivative method; "
+                         "use method='likelihood_ratio'") from None
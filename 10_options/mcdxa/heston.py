@@ -1,6 +1,4 @@
-import numpy as np
-from scipy.integrate import quad
-import math
+from .fourier import heston_char_func, lewis_price
 
 # the following Heston pricing implementation is from Gemini, after numerous tries with
 # different LLMs, basically none was able to provide a properly working implementation;
@@ -9,9 +7,9 @@ import math
 # none of the AI Assistants was able to provide a solution to such a quant finance problem
 
 def heston_price(
-    S0: float,
-    K: float,
-    T: float,
+    S0,
+    K,
+    T,
     r: float,
     kappa: float,
     theta: float,
@@ -21,15 +19,20 @@ def heston_price(
     q: float = 0.0,
     option_type: str = "call",
     integration_limit: float = 250,
-) -> float:
+    n_nodes: int = 256,
+):
     """
     Heston (1993) model price for European call or put option via Lewis (2001)
     single-integral formula. Negative prices are floored at zero.
 
+    S0, K and T may be arrays; the characteristic function is evaluated once
+    per maturity and shared by all strikes, and kept across calls in
+    mcdxa.fourier.CF_CACHE (see mcdxa.fourier.lewis_price).
+
     Parameters:
-    - S0: Initial stock price
-    - K: Strike price
-    - T: Time to maturity (in years)
+    - S0: Initial stock price(s)
+    - K: Strike price(s)
+    - T: Time(s) to maturity (in years)
     - r: Risk-free interest rate
     - kappa: Mean reversion rate of variance
     - theta: Long-term variance
@@ -39,58 +42,14 @@ def heston_price(
     - q: Dividend yield
     - option_type: 'call' or 'put'
     - integration_limit: Upper bound for numerical integration
+    - n_nodes: Number of Gauss-Legendre quadrature nodes
 
     Returns:
-    - price: Price of the European option (call or put)
+    - price: Price(s) of the European option (call or put)
     """
-
-    def _lewis_integrand(u, S0, K, T, r, q, kappa, theta, xi, rho, v0):
-        """The integrand for the Lewis (2001) single-integral formula."""
-
-        # Calculate the characteristic function value at the complex point u - i/2
-        char_func_val = _lewis_char_func(
-            u - 0.5j, T, r, q, kappa, theta, xi, rho, v0)
-
-        # The Lewis formula integrand
-        integrand = 1 / (u**2 + 0.25) * \
-            (np.exp(1j * u * np.log(S0 / K)) * char_func_val).real
-
-        return integrand
-
-    def _lewis_char_func(u, T, r, q, kappa, theta, xi, rho, v0):
-        """The Heston characteristic function of the log-price."""
-
-        d = np.sqrt((kappa - rho * xi * u * 1j)**2 + (u**2 + u * 1j) * xi**2)
-
-        g = (kappa - rho * xi * u * 1j - d) / (kappa - rho * xi * u * 1j + d)
-
-        C = (r - q) * u * 1j * T + (kappa * theta / xi**2) * (
-            (kappa - rho * xi * u * 1j - d) * T - 2 *
-            np.log((1 - g * np.exp(-d * T)) / (1 - g))
-        )
-
-        D = ((kappa - rho * xi * u * 1j - d) / xi**2) * \
-            ((1 - np.exp(-d * T)) / (1 - g * np.exp(-d * T)))
-
-        return np.exp(C + D * v0)
-
-    # Perform the integration
-    integral_value = quad(
-        lambda u: _lewis_integrand(
-            u, S0, K, T, r, q, kappa, theta, xi, rho, v0),
-        0,
-        integration_limit
-    )[0]
-
-    # Calculate the final call price using the Lewis formula
-    call_price = S0 * np.exp(-q * T) - np.exp(-r * T) * \
-        np.sqrt(S0 * K) / np.pi * integral_value
-
-    if option_type == "call":
-        price = call_price
-    elif option_type == "put":
-        price = call_price - S0 * math.exp(-q * T) + K * math.exp(-r * T)
-    else:
-        raise ValueError("Option type must be 'call' or 'put'.")
-
-    return max(price, 0.0)
+    return lewis_price(
+        lambda u, t: heston_char_func(u, t, r, kappa, theta, xi, rho, v0, q),
+        S0, K, T, r, q=q, option_type=option_type,
+        integration_limit=integration_limit, n_nodes=n_nodes,
+        cache_key=("heston", r, kappa, theta, xi, rho, v0, q),
+    )
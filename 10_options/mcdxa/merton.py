@@ -1,11 +1,16 @@
-import numpy as np
-from scipy.integrate import quad
 import math
 
+import numpy as np
+from scipy.stats import poisson
+
+from .bsm import bsm_price_vec
+from .fourier import merton_char_func, lewis_price
+
+
 def merton_price(
-    S0: float,
-    K: float,
-    T: float,
+    S0,
+    K,
+    T,
     r: float,
     sigma: float,
     lam: float = 0.0,
@@ -14,51 +19,108 @@ def merton_price(
     q: float = 0.0,
     option_type: str = "call",
     integration_limit: float = 250,
-) -> float:
+    n_nodes: int = 256,
+    method: str = "auto",
+    tol: float = 1e-12,
+    max_terms: int = 100,
+):
     """
-    European option price under the Merton (1976) jump-diffusion model via Lewis (2001)
-    single-integral formula.
+    European option price under the Merton (1976) jump-diffusion model.
+
+    S0, K and T may be arrays. By default the Poisson-weighted BSM series
+    (merton_series_price) is used, truncated where the Poisson tail mass
+    drops below tol; if that needs more than max_terms terms (very large
+    lam * T) the price falls back to the Lewis (2001) single-integral
+    formula, which evaluates the characteristic function once per maturity
+    and keeps it in mcdxa.fourier.CF_CACHE (see mcdxa.fourier.lewis_price).
 
     Parameters:
-    - S0: Initial stock price
-    - K: Strike price
-    - T: Time to maturity (in years)
+    - S0: Initial stock price(s)
+    - K: Strike price(s)
+    - T: Time(s) to maturity (in years)
     - r: Risk-free interest rate
     - sigma: Volatility of the diffusion component
     - lam: Jump intensity (lambda)
     - mu_j: Mean of log jump size
     - sigma_j: Standard deviation of log jump size
     - q: Dividend yield
-    - option_type: 'call' or 'put'
+    - option_type: 'call', 'put', an array of these, or a boolean call mask
     - integration_limit: Upper bound for numerical integration
+    - n_nodes: Number of Gauss-Legendre quadrature nodes
+    - method: 'auto', 'series' or 'lewis'
+    - tol: Poisson tail mass neglected by the series
+    - max_terms: Largest series length before 'auto' switches to 'lewis'
 
     Returns:
-    - price: Price of the European option (call or put)
+    - price: Price(s) of the European option (call or put)
+    """
+    if method not in ("auto", "series", "lewis"):
+        raise ValueError("method must be 'auto', 'series' or 'lewis'")
+    if method != "lewis":
+        n_terms = series_terms(lam, mu_j, sigma_j, np.max(T), tol)
+        if method == "series" or n_terms <= max_terms:
+            return merton_series_price(S0, K, T, r, sigma, lam, mu_j, sigma_j,
+                                       q, option_type, n_terms)
+    return lewis_price(
+        lambda u, t: merton_char_func(u, t, r, sigma, lam, mu_j, sigma_j, q),
+        S0, K, T, r, q=q, option_type=option_type,
+        integration_limit=integration_limit, n_nodes=n_nodes,
+        cache_key=("merton", r, sigma, lam, mu_j, sigma_j, q),
+    )
+
+
+def series_terms(lam: float, mu_j: float, sigma_j: float, T: float,
+                 tol: float = 1e-12) -> int:
+    """Number of series terms beyond n = 0 leaving Poisson tail mass below tol."""
+    intensity = lam * math.exp(mu_j + 0.5 * sigma_j ** 2) * max(T, 0.0)
+    return int(poisson.isf(tol, intensity)) + 1 if intensity > 0 else 0
+
+
+def merton_series_price(
+    S0,
+    K,
+    T,
+    r: float,
+    sigma: float,
+    lam: float,
+    mu_j: float,
+    sigma_j: float,
+    q: float = 0.0,
+    option_type: str = "call",
+    n_terms: int = 50,
+):
     """
-    def _char(u):
-        # Jump-diffusion characteristic function of log-returns under risk-neutral measure
-        kappa_j = math.exp(mu_j + 0.5 * sigma_j ** 2) - 1
-        drift = r - q - lam * kappa_j - 0.5 * sigma ** 2
-        return np.exp(
-            (1j * u * drift - 0.5 * u ** 2 * sigma ** 2) * T
-            + lam * T * (np.exp(1j * u * mu_j - 0.5 *
-                                u ** 2 * sigma_j ** 2) - 1)
-        )
+    Merton (1976) price as a Poisson-weighted series of BSM prices.
 
-    def _lewis_integrand(u):
-        # Lewis (2001) integrand for call under jump-diffusion
-        cf_val = _char(u - 0.5j)
-        return 1.0 / (u ** 2 + 0.25) * (np.exp(1j * u * math.log(S0 / K)) * cf_val).real
+    Conditional on n jumps the price is a BSM price with volatility
+    sqrt(sigma**2 + n * sigma_j**2 / T) and rate
+    r - lam * k + n * ln(1 + k) / T, where k = exp(mu_j + sigma_j**2 / 2) - 1;
+    the weights are Poisson(lam * (1 + k) * T) probabilities. All terms are
+    priced in one call of the vectorized BSM kernel.
 
-    integral_value = quad(_lewis_integrand, 0, integration_limit)[0]
-    call_price = S0 * np.exp(-q * T) - np.exp(-r * T) * \
-        np.sqrt(S0 * K) / np.pi * integral_value
+    Parameters:
+    - S0: Initial stock price(s)
+    - K: Strike price(s)
+    - T: Time(s) to maturity (in years)
+    - r: Risk-free interest rate
+    - sigma: Volatility of the diffusion component
+    - lam: Jump intensity (lambda)
+    - mu_j: Mean of log jump size
+    - sigma_j: Standard deviation of log jump size
+    - q: Dividend yield
+    - option_type: 'call', 'put', an array of these, or a boolean call mask
+    - n_terms: Highest jump count n in the series
 
-    if option_type == "call":
-        price = call_price
-    elif option_type == "put":
-        price = call_price - S0 * math.exp(-q * T) + K * math.exp(-r * T)
-    else:
-        raise ValueError("Option type must be 'call' or 'put'.")
+    Returns:
+    - price: Price(s) of the European option (call or put)
+    """
+    S0, K, T = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (S0, K, T)))
+    k = math.exp(mu_j + 0.5 * sigma_j ** 2) - 1
+    n = np.arange(n_terms + 1).reshape((-1,) + (1,) * T.ndim)
+    T_pos = np.where(T > 0, T, 1.0)
 
-    return max(price, 0.0)
+    weights = poisson.pmf(n, lam * (1 + k) * np.maximum(T, 0.0))
+    r_n = r - lam * k + n * math.log1p(k) / T_pos
+    sigma_n = np.sqrt(sigma ** 2 + n * sigma_j ** 2 / T_pos)
+    prices = bsm_price_vec(S0, K, T, r_n, sigma_n, q, option_type)
+    return (weights * prices).sum(axis=0)[()]
@@ -1,20 +1,69 @@
 import numpy as np
 import math
+import itertools
+from scipy.special import gammaincinv, ndtr
 
+from .bsm import bsm_price
+from .heston import heston_price
+from .kernels import check_backend, heston_euler_kernel, no_jumps
+from .merton import merton_price
+from .qmc import SobolNormals
 
-class BSM:
-    """
-    Black-Scholes-Merton model for risk-neutral asset price simulation.
 
-    Attributes:
-        r (float): Risk-free interest rate.
-        sigma (float): Volatility.
-        q (float): Dividend yield.
+# paths per block when simulate() fills the full path matrix
+DEFAULT_CHUNK_SIZE = 16_384
+
+
+def float_dtype(dtype) -> np.dtype:
+    """Validated simulation dtype: float32 or float64."""
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError("dtype must be float32 or float64")
+    return dtype
+
+
+def chunk_sizes(n_paths: int, chunk_size: int) -> list:
+    """Sizes of the consecutive path blocks that cover n_paths."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+    full, rest = divmod(n_paths, chunk_size)
+    return [chunk_size] * full + ([rest] if rest else [])
+
+
+class Model:
     """
-    def __init__(self, r: float, sigma: float, q: float = 0.0):
-        self.r = r
-        self.sigma = sigma
-        self.q = q
+    Base class for risk-neutral path simulation models.
+
+    Paths are generated block by block. Each block draws its random inputs
+    for all time steps in path-major order, and every distribution (diffusion
+    normals, jump counts, jump sizes) comes from its own stream spawned from
+    the generator. Splitting a run into chunks of any size therefore yields
+    exactly the paths of the monolithic run for the same generator state.
+
+    With antithetic sampling, paths come in adjacent pairs (rows 2i and
+    2i+1) driven by mirrored normal draws and identical jump counts, so
+    blocks must contain an even number of paths.
+
+    With qmc=True the diffusion normals come from a scrambled Sobol sequence
+    with Brownian-bridge construction across time steps (see mcdxa.qmc);
+    jump inputs stay pseudo-random. price_mc then reports the standard
+    error across independently scrambled replications.
+
+    dtype=np.float32 simulates in single precision, halving the memory of
+    random inputs, paths and scratch buffers; the _steps kernels update
+    preallocated buffers in place.
+
+    Subclasses set n_streams and implement _steps and vanilla_price; those
+    with an exactly sampled terminal distribution also override
+    _terminal_block.
+    """
+    n_streams = 1
+    antithetic = False
+    qmc = False
+    presample_jumps = False
+    dtype = np.dtype(np.float64)
+    # trailing shape of a price, (d,) for d assets
+    asset_shape = ()
 
     def simulate(self,
                  S0: float,
@@ -37,22 +86,405 @@ class BSM:
         """
         if rng is None:
             rng = np.random.default_rng()
+        streams = self._streams(rng)
+        dt = T / n_steps
+
+        paths = np.empty((n_paths, n_steps + 1) + self.asset_shape, dtype=self.dtype)
+        start = 0
+        for n in chunk_sizes(n_paths, DEFAULT_CHUNK_SIZE):
+            self._fill_block(S0, dt, streams, paths[start:start + n])
+            start += n
+        return paths
 
+    def simulate_terminal(self,
+                          S0: float,
+                          T: float,
+                          n_paths: int,
+                          n_steps: int = 1,
+                          rng: np.random.Generator = None) -> np.ndarray:
+        """
+        Simulate terminal asset prices only, without storing the paths.
+
+        Only the current state vector is kept while stepping; models whose
+        terminal distribution is known sample it exactly in one step.
+
+        Args:
+            S0 (float): Initial asset price.
+            T (float): Time to maturity.
+            n_paths (int): Number of simulation paths.
+            n_steps (int): Number of time steps per path.
+            rng (np.random.Generator, optional): Random generator.
+
+        Returns:
+            np.ndarray: Terminal asset prices, shape (n_paths,).
+        """
+        return np.concatenate(list(self.simulate_chunks(
+            S0, T, n_paths, n_steps, rng=rng, store_path=False)))
+
+    def simulate_statistics(self,
+                            S0: float,
+                            T: float,
+                            n_paths: int,
+                            n_steps: int,
+                            statistics: dict,
+                            rng: np.random.Generator = None) -> tuple:
+        """
+        Simulate paths while updating running path statistics step by step.
+
+        No path history is kept; memory is a few vectors of length n_paths.
+
+        Args:
+            S0 (float): Initial asset price.
+            T (float): Time to maturity.
+            n_paths (int): Number of simulation paths.
+            n_steps (int): Number of time steps per path.
+            statistics (dict): Name -> PathStatistic (see mcdxa.payoffs).
+            rng (np.random.Generator, optional): Random generator.
+
+        Returns:
+            tuple: Terminal prices, shape (n_paths,), and a dict mapping each
+            statistic name to its values, shape (n_paths,).
+
+        Raises:
+            ValueError: For multi-asset models.
+        """
+        if self.asset_shape:
+            raise ValueError("path statistics need a single-asset model")
+        blocks = list(self.simulate_chunks(S0, T, n_paths, n_steps, rng=rng,
+                                           statistics=statistics))
+        ST = np.concatenate([b[0] for b in blocks])
+        values = {name: np.concatenate([b[1][name] for b in blocks])
+                  for name in statistics}
+        return ST, values
+
+    def simulate_chunks(self,
+                        S0: float,
+                        T: float,
+                        n_paths: int,
+                        n_steps: int,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        rng: np.random.Generator = None,
+                        store_path: bool = True,
+                        statistics: dict = None):
+        """
+        Simulate asset price paths in blocks of at most chunk_size paths.
+
+        Memory is bounded by the block size rather than by n_paths, and the
+        concatenated blocks equal simulate(...) (or simulate_terminal(...)
+        if store_path is False, or simulate_statistics(...) if statistics
+        are given) for the same generator.
+
+        Args:
+            S0 (float): Initial asset price.
+            T (float): Time to maturity.
+            n_paths (int): Total number of simulation paths.
+            n_steps (int): Number of time steps per path.
+            chunk_size (int): Maximum number of paths per block.
+            rng (np.random.Generator, optional): Random generator.
+            store_path (bool): If False, yield terminal prices only.
+            statistics (dict, optional): Name -> PathStatistic; if given,
+                yield (terminal prices, statistic values) per block.
+
+        Yields:
+            np.ndarray: Path block of shape (n_chunk, n_steps+1), terminal
+            prices of shape (n_chunk,) if store_path is False, or a tuple of
+            terminal prices and a dict of statistic values.
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        streams = self._streams(rng)
         dt = T / n_steps
+
+        for n in chunk_sizes(n_paths, chunk_size):
+            if statistics is not None:
+                yield self._statistics_block(S0, dt, n, n_steps, streams, statistics)
+                continue
+            if not store_path:
+                yield self._terminal_block(S0, T, n, n_steps, streams)
+                continue
+            block = np.empty((n, n_steps + 1) + self.asset_shape, dtype=self.dtype)
+            self._fill_block(S0, dt, streams, block)
+            yield block
+
+    def _streams(self, rng: np.random.Generator) -> list:
+        """One independent generator per random input of the model."""
+        streams = [rng] if self.n_streams == 1 else rng.spawn(self.n_streams)
+        if self.qmc:
+            streams[0] = SobolNormals(streams[0])
+        return streams
+
+    def vanilla_price(self, S0: float, K: float, T: float,
+                      option_type: str = "call") -> float:
+        """Analytic price of a European call or put under the model."""
+        raise NotImplementedError
+
+    def _normals(self, stream: np.random.Generator, shape: tuple) -> np.ndarray:
+        """Standard normals of shape (n, ...), mirrored in pairs if antithetic."""
+        if isinstance(stream, SobolNormals):
+            def draw(size):
+                return stream.normals(size).astype(self.dtype, copy=False)
+        else:
+            def draw(size):
+                return stream.standard_normal(size, dtype=self.dtype)
+        if not self.antithetic:
+            return draw(shape)
+        if shape[0] % 2:
+            raise ValueError("antithetic sampling needs an even number of paths per block")
+        z = draw((shape[0] // 2,) + shape[1:])
+        return np.stack([z, -z], axis=1).reshape(shape)
+
+    def _counts(self, stream: np.random.Generator, lam: float, shape: tuple) -> np.ndarray:
+        """Poisson jump counts of shape (n, ...), shared within antithetic pairs."""
+        return self._paired(lambda size: stream.poisson(lam, size=size), shape)
+
+    def _paired(self, draw, shape: tuple) -> np.ndarray:
+        """Draws of shape (n, ...) from draw(size), shared within antithetic pairs."""
+        if not self.antithetic:
+            return draw(shape)
+        return np.repeat(draw((shape[0] // 2,) + shape[1:]), 2, axis=0)
+
+    def _jump_counts(self, streams: list, dt: float, shape: tuple) -> np.ndarray:
+        """
+        Jump counts per path and step, shape (n, n_steps), for models with
+        jump intensity lam.
+
+        With presample_jumps, each path draws its total count over the
+        horizon and places the jumps uniformly on the steps (times from the
+        stream following the model's base streams), instead of drawing a
+        Poisson count for every step.
+        """
+        if not self.presample_jumps:
+            return self._counts(streams[1], self.lam * dt, shape)
+        n_steps = shape[1]
+        times = streams[type(self).n_streams]
+
+        def draw(size):
+            total = streams[1].poisson(self.lam * dt * n_steps, size=size[0])
+            steps = (times.random(total.sum()) * n_steps).astype(np.intp)
+            flat = np.repeat(np.arange(size[0]) * n_steps, total) + steps
+            return np.bincount(flat, minlength=size[0] * n_steps).reshape(size)
+        return self._paired(draw, shape)
+
+    def _jump_log(self, stream: np.random.Generator, nj: np.ndarray) -> np.ndarray:
+        """
+        Log-return of nj log-normal jumps, N(nj * mu_j, nj * sigma_j**2),
+        for models with jump parameters mu_j and sigma_j.
+
+        Normals are drawn only for the entries with jumps, in path-major
+        order, and mirrored within antithetic pairs.
+        """
+        jump_log = np.zeros(nj.shape, dtype=self.dtype)
+        first = nj[::2] if self.antithetic else nj
+        jumped = np.nonzero(first)
+        k = first[jumped].astype(self.dtype)
+        mean = k * self.mu_j
+        spread = np.sqrt(k) * self.sigma_j * stream.standard_normal(k.size, dtype=self.dtype)
+        if self.antithetic:
+            rows = 2 * jumped[0]
+            jump_log[(rows,) + jumped[1:]] = mean + spread
+            jump_log[(rows + 1,) + jumped[1:]] = mean - spread
+        else:
+            jump_log[jumped] = mean + spread
+        return jump_log
+
+    def _set_presample_jumps(self, presample_jumps: bool):
+        self.presample_jumps = presample_jumps
+        if presample_jumps:
+            # uniform jump times
+            self.n_streams = self.n_streams + 1
+
+    def _fill_block(self, S0: float, dt: float, streams: list, out: np.ndarray):
+        """Write a block of paths into out, shape (n, n_steps+1) + asset_shape."""
+        n, n_cols = out.shape[:2]
+        out[:, 0] = S0
+        for t, S in enumerate(self._steps(S0, dt, n, n_cols - 1, streams), 1):
+            out[:, t] = S
+
+    def _terminal_block(self, S0: float, T: float, n: int, n_steps: int,
+                        streams: list) -> np.ndarray:
+        """Terminal prices of a block of n paths."""
+        for S in self._steps(S0, T / n_steps, n, n_steps, streams):
+            pass
+        return S
+
+    def _statistics_block(self, S0: float, dt: float, n: int, n_steps: int,
+                          streams: list, statistics: dict) -> tuple:
+        """Terminal prices and running statistics of a block of n paths."""
+        if self.asset_shape:
+            raise ValueError("path statistics need a single-asset model")
+        observed = {name: stat.observed(n_steps) for name, stat in statistics.items()}
+        acc = {name: stat.start(n) for name, stat in statistics.items()}
+        S = np.full((n,) + self.asset_shape, S0, dtype=self.dtype)
+        for t, S in enumerate(itertools.chain([S], self._steps(S0, dt, n, n_steps, streams))):
+            for name, stat in statistics.items():
+                if observed[name][t]:
+                    acc[name] = stat.update(acc[name], S)
+        values = {name: stat.finish(acc[name], np.count_nonzero(observed[name]))
+                  for name, stat in statistics.items()}
+        return S.copy(), values
+
+    def _greeks_block(self, S0: float, T: float, n: int, n_steps: int,
+                      streams: list) -> dict:
+        """
+        Terminal prices of a block of n paths with the sensitivities used by
+        mcdxa.greeks.
+
+        Returns a dict with
+        - 'ST': terminal prices
+        - 'dlogS_dvol': pathwise derivative of ln(S_T) w.r.t. the volatility
+        - 'a', 'c', 'k': likelihood-ratio weights of S0; with the conditional
+          density of S_T (or of the first step) normal in ln S, the score is
+          a / (S0 c) and score**2 + d(score)/dS0 = (a**2 - a c - k) / (S0 c)**2
+        - 'vega_score', 'rho_score': likelihood-ratio scores of the
+          volatility and the rate, or None if not available.
+        """
+        raise NotImplementedError("Monte Carlo Greeks are not available for this model")
+
+    def _steps(self, S0: float, dt: float, n: int, n_steps: int, streams: list):
+        """
+        Advance a block of n paths through n_steps time steps.
+
+        Yields the price vector after each step; the yielded array may be
+        reused by the next step and must be consumed immediately.
+        """
+        raise NotImplementedError
+
+
+def _lognormal_greeks(ST, z, sigma, T):
+    """Greek weights for ln(S_T) = const + sigma * sqrt(T) * z, z ~ N(0, 1)."""
+    sqrt_T = math.sqrt(T)
+    return {
+        "ST": ST,
+        "dlogS_dvol": sqrt_T * z - sigma * T,
+        "a": z,
+        "c": sigma * sqrt_T,
+        "k": 1.0,
+        "vega_score": (z ** 2 - 1) / sigma - sqrt_T * z,
+        "rho_score": sqrt_T * z / sigma,
+    }
+
+
+class BSM(Model):
+    """
+    Black-Scholes-Merton model for risk-neutral asset price simulation.
+
+    Attributes:
+        r (float): Risk-free interest rate.
+        sigma (float): Volatility.
+        q (float): Dividend yield.
+        antithetic (bool): Use antithetic variates.
+        qmc (bool): Draw diffusion normals from a scrambled Sobol sequence.
+        dtype: Floating-point type of the simulation, np.float64 or np.float32.
+    """
+    def __init__(self, r: float, sigma: float, q: float = 0.0,
+                 antithetic: bool = False,
+                 qmc: bool = False,
+                 dtype=np.float64):
+        self.r = r
+        self.sigma = sigma
+        self.q = q
+        self.antithetic = antithetic
+        self.qmc = qmc
+        self.dtype = float_dtype(dtype)
+
+    def vanilla_price(self, S0, K, T, option_type="call"):
+        return bsm_price(S0, K, T, self.r, self.sigma, self.q, option_type)
+
+    def _steps(self, S0, dt, n, n_steps, streams):
         drift = (self.r - self.q - 0.5 * self.sigma ** 2) * dt
         diffusion = self.sigma * np.sqrt(dt)
 
-        paths = np.empty((n_paths, n_steps + 1))
-        paths[:, 0] = S0
+        # per-step growth factors, computed in place in the normals buffer
+        growth = self._normals(streams[0], (n, n_steps))
+        growth *= diffusion
+        growth += drift
+        np.exp(growth, out=growth)
+        S = np.full(n, S0, dtype=self.dtype)
+        for t in range(n_steps):
+            S *= growth[:, t]
+            yield S
 
-        for t in range(1, n_steps + 1):
-            z = rng.standard_normal(n_paths)
-            paths[:, t] = paths[:, t - 1] * np.exp(drift + diffusion * z)
+    def _terminal_block(self, S0, T, n, n_steps, streams):
+        return self._exact_terminal(S0, T, n, streams)[0]
 
-        return paths
+    def _greeks_block(self, S0, T, n, n_steps, streams):
+        return _lognormal_greeks(*self._exact_terminal(S0, T, n, streams), self.sigma, T)
 
+    def _exact_terminal(self, S0, T, n, streams):
+        """Terminal prices and their driving normals."""
+        # log-normal terminal distribution sampled exactly in one step
+        z = self._normals(streams[0], (n,))
+        ST = S0 * np.exp((self.r - self.q - 0.5 * self.sigma ** 2) * T
+                         + self.sigma * math.sqrt(T) * z)
+        return ST, z
 
-class Merton:
+
+class MultiAssetBSM(Model):
+    """
+    Correlated geometric Brownian motions for d assets.
+
+    dS_i / S_i = (r - q_i) dt + sigma_i dW_i,    corr(dW_i, dW_j) = corr[i, j]
+
+    Prices have shape (..., d): paths (n_paths, n_steps+1, d) and terminal
+    prices (n_paths, d); simulate_chunks streams path blocks of the same
+    layout. The Cholesky factor of corr is computed once at construction,
+    and each block of independent normals is correlated by a single batched
+    matrix product over all paths and steps. Terminal prices are sampled
+    exactly in one step. S0 may be a scalar or an array of shape (d,).
+
+    Attributes:
+        r (float): Risk-free interest rate.
+        sigma (np.ndarray): Volatilities, shape (d,).
+        corr (np.ndarray): Correlation matrix, shape (d, d).
+        q (float or np.ndarray): Dividend yield(s).
+        antithetic (bool): Use antithetic variates.
+        qmc (bool): Draw normals from a scrambled Sobol sequence.
+        dtype: Floating-point type of the simulation, np.float64 or np.float32.
+        cholesky (np.ndarray): Lower Cholesky factor of corr.
+    """
+    def __init__(self, r: float, sigma, corr, q=0.0,
+                 antithetic: bool = False,
+                 qmc: bool = False,
+                 dtype=np.float64):
+        self.r = r
+        self.sigma = np.asarray(sigma, dtype=float)
+        self.corr = np.asarray(corr, dtype=float)
+        self.q = q
+        self.antithetic = antithetic
+        self.qmc = qmc
+        self.dtype = float_dtype(dtype)
+        d = len(self.sigma)
+        if self.sigma.ndim != 1 or self.corr.shape != (d, d):
+            raise ValueError("sigma must have shape (d,) and corr shape (d, d)")
+        if not (np.allclose(self.corr, self.corr.T) and np.allclose(np.diag(self.corr), 1.0)):
+            raise ValueError("corr must be symmetric with unit diagonal")
+        try:
+            self.cholesky = np.linalg.cholesky(self.corr)
+        except np.linalg.LinAlgError:
+            raise ValueError("corr must be positive definite") from None
+        self.asset_shape = (d,)
+        # correlated log-return shocks per unit time: z @ factor
+        self._factor = (self.cholesky.T * self.sigma).astype(self.dtype)
+        self._drift = (r - np.asarray(q, dtype=float) - 0.5 * self.sigma ** 2).astype(self.dtype)
+
+    def _steps(self, S0, dt, n, n_steps, streams):
+        z = self._normals(streams[0], (n, n_steps) + self.asset_shape)
+        growth = z @ (self._factor * self.dtype.type(math.sqrt(dt)))
+        growth += self._drift * self.dtype.type(dt)
+        np.exp(growth, out=growth)
+        S = np.full((n,) + self.asset_shape, S0, dtype=self.dtype)
+        for t in range(n_steps):
+            S *= growth[:, t]
+            yield S
+
+    def _terminal_block(self, S0, T, n, n_steps, streams):
+        z = self._normals(streams[0], (n, 1) + self.asset_shape)[:, 0]
+        growth = z @ (self._factor * self.dtype.type(math.sqrt(T)))
+        growth += self._drift * self.dtype.type(T)
+        return np.asarray(S0, dtype=self.dtype) * np.exp(growth, out=growth)
+
+
+class Merton(Model):
     """
     Merton jump-diffusion model for risk-neutral asset price simulation.
 
@@ -66,76 +498,327 @@ class Merton:
         mu_j (float): Mean of jump size log-normal distribution.
         sigma_j (float): Volatility of jump size log-normal distribution.
         q (float): Dividend yield.
+        antithetic (bool): Use antithetic variates.
+        qmc (bool): Draw diffusion normals from a scrambled Sobol sequence.
+        dtype: Floating-point type of the simulation, np.float64 or np.float32.
+        presample_jumps (bool): Draw each path's jump count over the horizon
+            and uniform jump times instead of a Poisson count per step.
     """
+    # diffusion normals, jump counts, jump sizes
+    n_streams = 3
+
     def __init__(self,
                  r: float,
                  sigma: float,
                  lam: float,
                  mu_j: float,
                  sigma_j: float,
-                 q: float = 0.0):
+                 q: float = 0.0,
+                 antithetic: bool = False,
+                 qmc: bool = False,
+                 dtype=np.float64,
+                 presample_jumps: bool = False):
         self.r = r
         self.sigma = sigma
         self.lam = lam
         self.mu_j = mu_j
         self.sigma_j = sigma_j
         self.q = q
+        self.antithetic = antithetic
+        self.qmc = qmc
+        self.dtype = float_dtype(dtype)
+        self._set_presample_jumps(presample_jumps)
         # compensator to keep martingale: E[Y - 1]
         self.kappa = math.exp(mu_j + 0.5 * sigma_j ** 2) - 1
 
-    def simulate(self,
-                 S0: float,
-                 T: float,
-                 n_paths: int,
-                 n_steps: int = 1,
-                 rng=None) -> np.ndarray:
-        """
-        Simulate asset price paths under risk-neutral Merton jump-diffusion.
+    def vanilla_price(self, S0, K, T, option_type="call"):
+        return merton_price(S0, K, T, self.r, self.sigma, self.lam, self.mu_j,
+                            self.sigma_j, q=self.q, option_type=option_type)
 
-        Args:
-            S0 (float): Initial asset price.
-            T (float): Time to maturity.
-            n_paths (int): Number of simulation paths.
-            n_steps (int): Number of time steps per path.
-            rng (np.random.Generator, optional): Random number generator.
+    def _steps(self, S0, dt, n, n_steps, streams):
+        drift = (self.r - self.q - self.lam * self.kappa - 0.5 * self.sigma ** 2) * dt
+        diff_coeff = self.sigma * math.sqrt(dt)
 
-        Returns:
-            np.ndarray: Simulated asset prices, shape (n_paths, n_steps+1).
+        # diffusion component
+        growth = self._normals(streams[0], (n, n_steps))
+        # jumps: number of jumps ~ Poisson(lam dt)
+        nj = self._jump_counts(streams, dt, (n, n_steps))
+        # aggregate jump-size log-return: sum of nj iid normals
+        # (zero where nj = 0, since the scale is then zero as well)
+        jump_log = self._jump_log(streams[2], nj)
+
+        # per-step growth factors, computed in place in the normals buffer
+        growth *= diff_coeff
+        growth += drift
+        growth += jump_log
+        np.exp(growth, out=growth)
+        S = np.full(n, S0, dtype=self.dtype)
+        for t in range(n_steps):
+            S *= growth[:, t]
+            yield S
+
+    def _terminal_block(self, S0, T, n, n_steps, streams):
+        return self._exact_terminal(S0, T, n, streams)[0]
+
+    def _greeks_block(self, S0, T, n, n_steps, streams):
+        # conditional on the jumps, ln(S_T) is normal as under BSM
+        return _lognormal_greeks(*self._exact_terminal(S0, T, n, streams), self.sigma, T)
+
+    def _exact_terminal(self, S0, T, n, streams):
+        """Terminal prices and their diffusion normals."""
+        # exact: total jump count over [0, T] is Poisson(lam T)
+        drift = (self.r - self.q - self.lam * self.kappa - 0.5 * self.sigma ** 2) * T
+        z = self._normals(streams[0], (n,))
+        nj = self._counts(streams[1], self.lam * T, (n,))
+        jump_log = self._jump_log(streams[2], nj)
+        return S0 * np.exp(drift + self.sigma * math.sqrt(T) * z + jump_log), z
+
+
+SCHEMES = ("euler", "qe", "exact")
+
+
+def _poisson_inverse(u: np.ndarray, mean: np.ndarray) -> np.ndarray:
+    """Poisson(mean) quantiles at u by sequential search of the CDF."""
+    k = np.zeros(u.shape)
+    pmf = np.exp(-mean)
+    cdf = pmf.copy()
+    active = np.flatnonzero(u > cdf)
+    while active.size:
+        k[active] += 1
+        pmf[active] *= mean[active] / k[active]
+        cdf[active] += pmf[active]
+        active = active[(u[active] > cdf[active]) & (pmf[active] > 0)]
+    return k
+
+
+class StochasticVolatility(Model):
+    """
+    Base class for Heston-type models, simulated with one of three schemes.
+
+    - 'euler': Euler full truncation of (ln S, v); needs many steps per
+      year to control the bias.
+    - 'qe': Andersen's (2008) quadratic-exponential scheme for v with the
+      martingale-corrected central discretization of ln S.
+    - 'exact': Broadie-Kaya-style scheme: v is sampled exactly from its
+      scaled noncentral chi-squared transition law, and ln S from its exact
+      conditional law given the integrated variance, which is taken as the
+      trapezoidal (v_t + v_{t+dt}) dt / 2. For 4 kappa theta / xi**2 <= 1
+      the variance needs a Poisson mixture sampled by inversion, which is
+      slower.
+
+    QE and exact are accurate with a handful of steps per year. The exact
+    scheme draws its chi-squared inputs from two extra random streams.
+
+    With backend='numba' the Euler scheme runs in a compiled kernel that
+    fuses the variance, price and jump updates per path and runs paths in
+    parallel (see mcdxa.kernels); it consumes the same random inputs as the
+    NumPy kernel.
+
+    Subclasses implement _drift_and_jumps.
+    """
+    scheme = "euler"
+    backend = "numpy"
+
+    def _set_scheme(self, scheme: str):
+        if scheme not in SCHEMES:
+            raise ValueError(f"scheme must be one of {SCHEMES}")
+        self.scheme = scheme
+        if scheme == "exact":
+            # chi-squared variates and Poisson-mixture uniforms
+            self.n_streams = self.n_streams + 2
+
+    def _set_backend(self, backend: str):
+        self.backend = check_backend(backend)
+        if backend == "numba" and self.scheme != "euler":
+            raise ValueError("backend='numba' supports scheme='euler' only")
+
+    def _drift_and_jumps(self, streams: list, dt: float, n: int, n_steps: int) -> tuple:
+        """Drift rate of ln S before the -0.5 v term and jump log-returns (or None)."""
+        raise NotImplementedError
+
+    def _steps(self, S0, dt, n, n_steps, streams):
+        mu, jump_log = self._drift_and_jumps(streams, dt, n, n_steps)
+        if self.backend == "numba":
+            paths = np.empty((n, n_steps + 1), dtype=self.dtype)
+            self._compiled_block(S0, dt, streams, mu, jump_log, paths)
+            for t in range(1, n_steps + 1):
+                yield paths[:, t]
+        else:
+            yield from self._variance_steps(S0, dt, n, n_steps, streams, mu, jump_log)
+
+    def _fill_block(self, S0, dt, streams, out):
+        if self.backend == "numpy":
+            return super()._fill_block(S0, dt, streams, out)
+        n, n_cols = out.shape
+        mu, jump_log = self._drift_and_jumps(streams, dt, n, n_cols - 1)
+        self._compiled_block(S0, dt, streams, mu, jump_log, out)
+
+    def _terminal_block(self, S0, T, n, n_steps, streams):
+        if self.backend == "numpy":
+            return super()._terminal_block(S0, T, n, n_steps, streams)
+        dt = T / n_steps
+        mu, jump_log = self._drift_and_jumps(streams, dt, n, n_steps)
+        out = np.empty((n, 1), dtype=self.dtype)
+        self._compiled_block(S0, dt, streams, mu, jump_log, out, n_steps)
+        return out[:, 0]
+
+    def _compiled_block(self, S0, dt, streams, mu, jump_log, out, n_steps=None):
+        """Run the compiled Euler kernel, writing full paths or terminal prices to out."""
+        n = len(out)
+        n_steps = out.shape[1] - 1 if n_steps is None else n_steps
+        z = self._normals(streams[0], (n, n_steps, 2))
+        heston_euler_kernel()(
+            float(S0), float(self.v0), dt, mu, self.kappa, self.theta, self.xi,
+            self.rho, z, no_jumps(self.dtype) if jump_log is None else jump_log, out)
+
+    def _variance_steps(self, S0: float, dt: float, n: int, n_steps: int,
+                        streams: list, mu: float, jump_log: np.ndarray = None):
         """
-        if rng is None:
-            rng = np.random.default_rng()
+        Joint steps of (S, v) under the model's scheme.
 
-        dt = T / n_steps
-        drift = (self.r - self.q - self.lam * self.kappa - 0.5 * self.sigma ** 2) * dt
-        diff_coeff = self.sigma * math.sqrt(dt)
-        jump_mu = self.mu_j
-        jump_sigma = self.sigma_j
-
-        paths = np.empty((n_paths, n_steps + 1))
-        paths[:, 0] = S0
-
-        for t in range(1, n_steps + 1):
-            # diffusion component
-            z = rng.standard_normal(n_paths)
-            # jumps: number of jumps ~ Poisson(lam dt)
-            nj = rng.poisson(self.lam * dt, size=n_paths)
-            # aggregate jump-size log-return: sum of nj iid normals
-            # if nj=0, jump_log = 0
-            jump_log = np.where(
-                nj > 0,
-                rng.normal(nj * jump_mu, np.sqrt(nj) * jump_sigma),
-                0.0,
-            )
-            paths[:, t] = (
-                paths[:, t - 1]
-                * np.exp(drift + diff_coeff * z + jump_log)
-            )
-        return paths
+        Args:
+            streams (list): Random streams; the first drives the diffusion
+                normals and, for the exact scheme, the last two the
+                chi-squared variates.
+            mu (float): Drift rate of ln S before the -0.5 v convexity term.
+            jump_log (np.ndarray, optional): Jump log-returns added per step,
+                shape (n, n_steps).
+        """
+        z = self._normals(streams[0], (n, n_steps, 2))
+        S = np.full(n, S0, dtype=self.dtype)
+        v = np.full(n, self.v0, dtype=self.dtype)
+        if self.scheme == "euler":
+            steps = self._euler_steps(S, v, dt, z, mu)
+        elif self.scheme == "qe":
+            steps = self._qe_steps(S, v, dt, z, mu)
+        else:
+            steps = self._exact_steps(S, v, dt, z, mu, *streams[-2:])
+        for t, log_return in enumerate(steps):
+            if jump_log is not None:
+                log_return += jump_log[:, t]
+            S *= np.exp(log_return, out=log_return)
+            yield S
+
+    def _euler_steps(self, S, v, dt, z, mu):
+        """
+        Euler full truncation, updating v in place and yielding the log-return
+        of S per step. All per-step work happens in preallocated buffers.
+        """
+        n = len(S)
+        rho_c = math.sqrt(1 - self.rho ** 2)
+        sqrt_dt = math.sqrt(dt)
+        sq, w, tmp = (np.empty(n, dtype=self.dtype) for _ in range(3))
+
+        for t in range(z.shape[1]):
+            # sq = sqrt(max(v, 0) * dt); tmp = log-return of S
+            np.maximum(v, 0.0, out=sq)
+            np.multiply(sq, -0.5 * dt, out=tmp)
+            tmp += mu * dt
+            np.sqrt(sq, out=sq)
+            sq *= sqrt_dt
+            np.multiply(sq, z[:, t, 0], out=w)
+            tmp += w
+
+            # v += kappa (theta - v) dt + xi sq w2, w2 = rho z1 + rho_c z2
+            np.multiply(z[:, t, 0], self.rho, out=w)
+            w += rho_c * z[:, t, 1]
+            w *= sq
+            w *= self.xi
+            v *= 1 - self.kappa * dt
+            v += self.kappa * self.theta * dt
+            v += w
+            yield tmp
+
+    def _qe_steps(self, S, v, dt, z, mu):
+        """
+        Andersen's QE scheme (switching at psi = 1.5, gamma1 = gamma2 = 0.5)
+        with martingale correction where it exists, updating v and yielding
+        log-returns.
+        """
+        kappa, theta, xi, rho = self.kappa, self.theta, self.xi, self.rho
+        e = math.exp(-kappa * dt)
+        c1 = xi ** 2 * e * (1 - e) / kappa
+        c2 = theta * xi ** 2 * (1 - e) ** 2 / (2 * kappa)
+        K1 = 0.5 * dt * (kappa * rho / xi - 0.5) - rho / xi
+        K2 = 0.5 * dt * (kappa * rho / xi - 0.5) + rho / xi
+        K3 = 0.5 * dt * (1 - rho ** 2)
+        A = K2 + 0.5 * K3
+        K0_plain = -rho * kappa * theta / xi * dt
+
+        for t in range(z.shape[1]):
+            zv, zs = z[:, t, 0], z[:, t, 1]
+            m = theta + (v - theta) * e
+            psi = (c1 * v + c2) / m ** 2
+            quadratic = psi <= 1.5
+            with np.errstate(divide="ignore", invalid="ignore"):
+                # quadratic branch: v' = a (b + zv)**2
+                inv = 2 / psi
+                b2 = np.maximum(inv - 1 + np.sqrt(inv) * np.sqrt(np.maximum(inv - 1, 0)), 0)
+                a = m / (1 + b2)
+                # exponential branch: point mass p at 0, exponential tail
+                p = (psi - 1) / (psi + 1)
+                beta = (1 - p) / m
+                u = ndtr(zv)
+                tail = np.log((1 - p) / (1 - u)) / beta
+                v_next = np.where(quadratic, a * (np.sqrt(b2) + zv) ** 2,
+                                  np.where(u <= p, 0.0, tail))
+                # K0 making E[exp(log-return)] = exp(mu dt) exact; the moment
+                # generating function of v' is finite only if 2 A a < 1
+                # (quadratic) or A < beta (exponential), elsewhere fall back
+                # to the uncorrected drift
+                K0 = np.where(
+                    quadratic,
+                    -A * b2 * a / (1 - 2 * A * a) + 0.5 * np.log(1 - 2 * A * a),
+                    -np.log(p + beta * (1 - p) / (beta - A)),
+                ) - (K1 + 0.5 * K3) * v
+                corrected = np.where(quadratic, 2 * A * a < 1, A < beta)
+                K0 = np.where(corrected, K0, K0_plain)
+            log_return = (mu * dt + K0 + K1 * v + K2 * v_next
+                          + np.sqrt(K3 * (v + v_next)) * zs).astype(self.dtype, copy=False)
+            v[:] = v_next
+            yield log_return
+
+    def _exact_steps(self, S, v, dt, z, mu, gamma_stream, uniform_stream):
+        """
+        Exact variance transition and conditional log-price given the
+        trapezoidal integrated variance, updating v and yielding log-returns.
+        """
+        kappa, theta, xi, rho = self.kappa, self.theta, self.xi, self.rho
+        n, n_steps = z.shape[:2]
+        e = math.exp(-kappa * dt)
+        c = xi ** 2 * (1 - e) / (4 * kappa)
+        df = 4 * kappa * theta / xi ** 2
+        rho_c2 = 1 - rho ** 2
+        # ncx2(df, lam) = (zv + sqrt(lam))**2 + chi2(df - 1) for df > 1 and
+        # chi2(df) + chi2(2 N), N ~ Poisson(lam / 2), otherwise
+        chi2 = self._paired(lambda size: gamma_stream.standard_gamma(
+            0.5 * (df - 1 if df > 1 else df), size=size, dtype=self.dtype), (n, n_steps))
+        chi2 *= 2
+        if df <= 1:
+            eps = np.finfo(float).eps
+            u = np.clip(self._paired(lambda size: uniform_stream.random(size), (n, n_steps, 2)),
+                        eps, 1 - eps)
+
+        for t in range(n_steps):
+            lam = v * (e / c)
+            if df > 1:
+                v_next = c * ((z[:, t, 0] + np.sqrt(lam)) ** 2 + chi2[:, t])
+            else:
+                N = _poisson_inverse(u[:, t, 0], 0.5 * lam)
+                jumped = N > 0
+                v_next = c * chi2[:, t]
+                v_next[jumped] += (2 * c) * gammaincinv(N[jumped], u[jumped, t, 1])
+            integrated = 0.5 * dt * (v + v_next)
+            log_return = (mu * dt + rho / xi * (v_next - v - kappa * theta * dt)
+                          + (kappa * rho / xi - 0.5) * integrated
+                          + np.sqrt(rho_c2 * integrated) * z[:, t, 1]).astype(self.dtype, copy=False)
+            v[:] = v_next
+            yield log_return
 
 
 # This class has been corrected by Gemini with regard to the discretization
 # approach to yield better convergence and valuation results.
-class Heston:
+class Heston(StochasticVolatility):
     """
     Heston stochastic volatility model.
 
@@ -151,6 +834,11 @@ class Heston:
         rho (float): Correlation between asset and variance.
         v0 (float): Initial variance.
         q (float): Dividend yield.
+        antithetic (bool): Use antithetic variates.
+        qmc (bool): Draw diffusion normals from a scrambled Sobol sequence.
+        dtype: Floating-point type of the simulation, np.float64 or np.float32.
+        scheme (str): 'euler', 'qe' or 'exact' (see StochasticVolatility).
+        backend (str): 'numpy' or 'numba' (compiled Euler kernel, needs numba).
     """
     def __init__(self,
                  r: float,
@@ -159,7 +847,12 @@ class Heston:
                  xi: float,
                  rho: float,
                  v0: float,
-                 q: float = 0.0):
+                 q: float = 0.0,
+                 antithetic: bool = False,
+                 qmc: bool = False,
+                 dtype=np.float64,
+                 scheme: str = "euler",
+                 backend: str = "numpy"):
         self.r = r
         self.kappa = kappa
         self.theta = theta
@@ -167,6 +860,15 @@ class Heston:
         self.rho = rho
         self.v0 = v0
         self.q = q
+        self.antithetic = antithetic
+        self.qmc = qmc
+        self.dtype = float_dtype(dtype)
+        self._set_scheme(scheme)
+        self._set_backend(backend)
+
+    def vanilla_price(self, S0, K, T, option_type="call"):
+        return heston_price(S0, K, T, self.r, self.kappa, self.theta, self.xi,
+                            self.rho, self.v0, q=self.q, option_type=option_type)
 
     def simulate(self,
                  S0: float,
@@ -175,41 +877,74 @@ class Heston:
                  n_steps: int = 50,
                  rng: np.random.Generator = None) -> np.ndarray:
         """
-        Simulate asset price under Heston model via Euler full-truncation.
+        Simulate asset price under Heston model with the chosen variance scheme.
 
         Returns:
             np.ndarray: Asset paths shape (n_paths, n_steps+1).
         """
-        if rng is None:
-            rng = np.random.default_rng()
-
+        return super().simulate(S0, T, n_paths, n_steps, rng=rng)
+
+    def _drift_and_jumps(self, streams, dt, n, n_steps):
+        return self.r - self.q, None
+
+    def _greeks_block(self, S0, T, n, n_steps, streams):
+        if self.scheme != "euler":
+            raise NotImplementedError("Monte Carlo Greeks need scheme='euler'")
+        if self.v0 <= 0 or abs(self.rho) >= 1:
+            # the likelihood-ratio weights divide by sqrt(v0) and 1 - rho**2
+            raise ValueError("Monte Carlo Greeks need v0 > 0 and |rho| < 1")
+        # Euler full truncation with the tangent of (ln S, v) w.r.t. the
+        # initial volatility sqrt(v0) propagated alongside; always float64
+        # NumPy, whatever the model's dtype and backend
         dt = T / n_steps
-        S = np.full((n_paths, n_steps + 1), S0, dtype=float)
-        v = np.full(n_paths, self.v0, dtype=float)
-
-        for t in range(1, n_steps + 1):
-            z1 = rng.standard_normal(n_paths)
-            z2 = rng.standard_normal(n_paths)
-            w1 = z1
-            w2 = self.rho * z1 + math.sqrt(1 - self.rho ** 2) * z2
-
-            v_pos = np.maximum(v, 0)
-
-            S[:, t] = (
-                S[:, t - 1]
-                * np.exp((self.r - self.q - 0.5 * v_pos) * dt + np.sqrt(v_pos * dt) * w1)
-            )
-
-            v = v + self.kappa * (self.theta - v) * dt + self.xi * np.sqrt(v_pos * dt) * w2
-        return S
-
-
-class Bates:
+        z = self._normals(streams[0], (n, n_steps, 2))
+        rho_c = math.sqrt(1 - self.rho ** 2)
+        logS = np.full(n, math.log(S0))
+        v = np.full(n, self.v0, dtype=float)
+        dlogS = np.zeros(n)
+        dv = np.full(n, 2 * math.sqrt(self.v0))
+
+        for t in range(n_steps):
+            w1 = z[:, t, 0]
+            w2 = self.rho * z[:, t, 0] + rho_c * z[:, t, 1]
+            positive = v > 0
+            v_pos = np.where(positive, v, 0.0)
+            sq = np.sqrt(v_pos * dt)
+            dv_pos = np.where(positive, dv, 0.0)
+            dsq = np.divide(dv_pos * dt, 2 * sq, out=np.zeros(n), where=positive)
+
+            logS += (self.r - self.q - 0.5 * v_pos) * dt + sq * w1
+            dlogS += -0.5 * dv_pos * dt + dsq * w1
+            v = v + self.kappa * (self.theta - v) * dt + self.xi * sq * w2
+            dv = dv * (1 - self.kappa * dt) + self.xi * dsq * w2
+
+        # S0 enters the density only through the first step
+        return {
+            "ST": np.exp(logS),
+            "dlogS_dvol": dlogS,
+            "a": z[:, 0, 0] - self.rho / rho_c * z[:, 0, 1],
+            "c": math.sqrt(self.v0 * dt),
+            "k": 1 / rho_c ** 2,
+            "vega_score": None,
+            "rho_score": None,
+        }
+
+
+class Bates(StochasticVolatility):
     """
     Bates (1996) jump-diffusion with stochastic volatility (Heston + Merton jumps).
 
     Simulates dS_t and v_t dynamics with correlated diffusion and Poisson jumps.
+    Set antithetic=True to use antithetic variates, qmc=True for
+    scrambled Sobol diffusion normals, dtype=np.float32 for single
+    precision, scheme='qe' or 'exact' for few-step discretizations and
+    presample_jumps=True to place each path's jumps on the time grid from
+    its total count over the horizon (see Merton); backend='numba' runs the
+    Euler scheme in a compiled kernel.
     """
+    # diffusion normals, jump counts, jump sizes
+    n_streams = 3
+
     def __init__(self,
                  r: float,
                  kappa: float,
@@ -220,7 +955,13 @@ class Bates:
                  lam: float,
                  mu_j: float,
                  sigma_j: float,
-                 q: float = 0.0):
+                 q: float = 0.0,
+                 antithetic: bool = False,
+                 qmc: bool = False,
+                 dtype=np.float64,
+                 scheme: str = "euler",
+                 presample_jumps: bool = False,
+                 backend: str = "numpy"):
         self.r = r
         self.kappa = kappa
         self.theta = theta
@@ -231,9 +972,22 @@ class Bates:
         self.mu_j = mu_j
         self.sigma_j = sigma_j
         self.q = q
+        self.antithetic = antithetic
+        self.qmc = qmc
+        self.dtype = float_dtype(dtype)
+        self._set_presample_jumps(presample_jumps)
+        self._set_scheme(scheme)
+        self._set_backend(backend)
         # jump compensator E[Y - 1]
         self.kappa_j = math.exp(mu_j + 0.5 * sigma_j ** 2) - 1
 
+    def vanilla_price(self, S0, K, T, option_type="call"):
+        # imported here: mcdxa.bates imports this module
+        from .bates import bates_price
+        return bates_price(S0, K, T, self.r, self.kappa, self.theta, self.xi,
+                           self.rho, self.v0, self.lam, self.mu_j, self.sigma_j,
+                           q=self.q, option_type=option_type)
+
     def simulate(self,
                  S0: float,
                  T: float,
@@ -241,43 +995,14 @@ class Bates:
                  n_steps: int = 50,
                  rng: np.random.Generator = None) -> np.ndarray:
         """
-        Simulate asset paths for the Bates model via Euler full-truncation plus jumps.
+        Simulate asset paths for the Bates model (variance scheme plus jumps).
 
         Returns:
             np.ndarray: Simulated paths (n_paths, n_steps+1).
         """
-        if rng is None:
-            rng = np.random.default_rng()
-
-        dt = T / n_steps
-        S = np.full((n_paths, n_steps + 1), S0, dtype=float)
-        v = np.full(n_paths, self.v0, dtype=float)
-
-        for t in range(1, n_steps + 1):
-            z1 = rng.standard_normal(n_paths)
-            z2 = rng.standard_normal(n_paths)
-            w1 = z1
-            w2 = self.rho * z1 + math.sqrt(1 - self.rho ** 2) * z2
-
-            v_pos = np.maximum(v, 0.0)
-
-            S[:, t] = (
-                S[:, t - 1]
-                * np.exp((self.r - self.q - self.lam * self.kappa_j - 0.5 * v_pos) * dt
-                         + np.sqrt(v_pos * dt) * w1)
-            )
-            v = (
-                v
-                + self.kappa * (self.theta - v) * dt
-                + self.xi * np.sqrt(v_pos * dt) * w2
-            )
-
-            Nj = rng.poisson(self.lam * dt, size=n_paths)
-            jump_log = np.where(
-                Nj > 0,
-                rng.normal(Nj * self.mu_j, np.sqrt(Nj) * self.sigma_j),
-                0.0,
-            )
-            S[:, t] *= np.exp(jump_log)
+        return super().simulate(S0, T, n_paths, n_steps, rng=rng)
 
-        return S
+    def _drift_and_jumps(self, streams, dt, n, n_steps):
+        Nj = self._jump_counts(streams, dt, (n, n_steps))
+        jump_log = self._jump_log(streams[2], Nj)
+        return self.r - self.q - self.lam * self.kappa_j, jump_log
@@ -1,14 +1,88 @@
+import time
+
 import numpy as np
 
+from .utils import parallel_map, split_paths
+
+
+class RunningStats:
+    """
+    Online mean and (co)variance of samples arriving in batches.
+
+    Batches are merged with the pairwise update of Chan, Golub and LeVeque,
+    which stays accurate for many large batches. Batches of shape (n,) give
+    scalar statistics; batches of shape (n, k) give a mean vector and a
+    k x k co-moment matrix.
+
+    Attributes:
+        count (int): Number of samples seen.
+        mean (float or np.ndarray): Sample mean.
+        m2 (float or np.ndarray): Sum of squared deviations (co-moments)
+            from the mean.
+    """
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, values: np.ndarray) -> "RunningStats":
+        """Add a batch of samples."""
+        values = np.asarray(values, dtype=float)
+        if values.ndim != 2:
+            values = values.ravel()
+        if len(values):
+            mean = values.mean(axis=0)
+            dev = values - mean
+            m2 = dev.T @ dev if values.ndim == 2 else np.square(dev).sum()
+            self._merge(len(values), mean, m2)
+        return self
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """Add the samples summarized by another RunningStats."""
+        if other.count:
+            self._merge(other.count, other.mean, other.m2)
+        return self
+
+    def _merge(self, count: int, mean, m2):
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean = self.mean + delta * count / total
+        self.m2 = self.m2 + m2 + np.multiply.outer(delta, delta) * self.count * count / total
+        self.count = total
+
+    @property
+    def variance(self):
+        """Unbiased sample variance (covariance matrix for vector samples)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stderr(self):
+        """Standard error of the mean (per component for vector samples)."""
+        if not self.count:
+            return 0.0
+        return np.sqrt(np.diagonal(self.variance) if np.ndim(self.variance) == 2
+                       else self.variance) / np.sqrt(self.count)
+
 
 def price_mc(payoff, model, S0: float, T: float, r: float,
              n_paths: int, n_steps: int = 1,
-             rng: np.random.Generator = None) -> tuple:
+             rng: np.random.Generator = None,
+             chunk_size: int = None,
+             n_workers: int = None,
+             backend: str = "process",
+             control: tuple = None,
+             n_replications: int = 16) -> tuple:
     """
     Generic Monte Carlo pricer.
 
+    The model simulates only what the payoff needs (see simulate_payoffs):
+    terminal prices for terminal-only payoffs, running path statistics for
+    payoffs that declare them, and full paths otherwise. For models with
+    antithetic sampling the two payoffs of each antithetic pair are averaged
+    before the standard error is computed.
+
     Args:
-        payoff (callable): Payoff function on terminal prices.
+        payoff (callable): Payoff function on terminal prices or paths.
         model: Model instance with a simulate method.
         S0 (float): Initial asset price.
         T (float): Time to maturity.
@@ -16,15 +90,212 @@ def price_mc(payoff, model, S0: float, T: float, r: float,
         n_paths (int): Number of Monte Carlo paths.
         n_steps (int): Number of time steps per path.
         rng (np.random.Generator, optional): Random generator.
+        chunk_size (int, optional): If given, simulate at most chunk_size
+            paths at a time via model.simulate_chunks and aggregate mean and
+            variance online, so memory is bounded by the chunk size.
+        n_workers (int, optional): If given, split the paths across this many
+            workers, each with its own generator from rng.spawn (i.e.
+            SeedSequence.spawn), and merge their means and variances. A given
+            seed and worker count gives bit-identical results.
+        backend (str): 'process' or 'thread' pool for n_workers; the process
+            backend requires a picklable payoff and model.
+        control (tuple, optional): Control variate (control_payoff,
+            control_price): a payoff on terminal prices evaluated on the same
+            paths and its known discounted price. The estimate is adjusted
+            with the variance-minimizing coefficient.
+        n_replications (int): For models with qmc=True, the paths are split
+            into this many independently scrambled replications (one
+            generator each from rng.spawn); the price is their average and
+            the standard error is taken across replications. Replications
+            are distributed over n_workers if given.
 
     Returns:
         price (float): Discounted Monte Carlo price.
         stderr (float): Standard error of the estimate.
     """
-    paths = model.simulate(S0, T, n_paths, n_steps, rng=rng)
-    ST = paths[:, -1]
-    payoffs = payoff(ST)
-    discounted = np.exp(-r * T) * payoffs
-    price = discounted.mean()
-    stderr = discounted.std(ddof=1) / np.sqrt(n_paths)
-    return price, stderr
\ No newline at end of file
+    if getattr(model, "qmc", False):
+        return _price_qmc(payoff, model, S0, T, r, n_paths, n_steps, rng,
+                          chunk_size, n_workers, backend, control,
+                          n_replications)
+    if n_workers is not None:
+        if rng is None:
+            rng = np.random.default_rng()
+        pair = 2 if getattr(model, "antithetic", False) else 1
+        if n_paths % pair:
+            raise ValueError("antithetic sampling needs an even number of paths")
+        args = [
+            (payoff, model, S0, T, r, pair * n, n_steps, child, chunk_size, control)
+            for n, child in zip(split_paths(n_paths // pair, n_workers), rng.spawn(n_workers))
+            if n > 0
+        ]
+        stats = RunningStats()
+        for part in parallel_map(_price_share, args, n_workers, backend):
+            stats.merge(part)
+    else:
+        stats = _price_share(payoff, model, S0, T, r, n_paths, n_steps, rng,
+                             chunk_size, control)
+    return _estimate(stats, control)
+
+
+def price_mc_adaptive(payoff, model, S0: float, T: float, r: float,
+                      abs_tol: float = None, rel_tol: float = None,
+                      time_budget: float = None, max_paths: int = 10_000_000,
+                      batch_size: int = 16_384, n_steps: int = 1,
+                      rng: np.random.Generator = None,
+                      control: tuple = None) -> tuple:
+    """
+    Monte Carlo pricer that simulates batches until a target accuracy.
+
+    After each batch of batch_size paths the running estimate is checked;
+    simulation stops as soon as the standard error is at most abs_tol, or
+    at most rel_tol times the absolute price, or time_budget seconds have
+    elapsed, or max_paths paths have been used.
+
+    Args:
+        payoff (callable): Payoff function on terminal prices or paths.
+        model: Model instance (QMC models are not supported).
+        S0 (float): Initial asset price.
+        T (float): Time to maturity.
+        r (float): Risk-free rate.
+        abs_tol (float, optional): Target standard error.
+        rel_tol (float, optional): Target standard error relative to price.
+        time_budget (float, optional): Wall-clock limit in seconds.
+        max_paths (int): Maximum number of paths.
+        batch_size (int): Paths per batch (batch_size and max_paths must be
+            even for antithetic models).
+        n_steps (int): Number of time steps per path.
+        rng (np.random.Generator, optional): Random generator.
+        control (tuple, optional): Control variate, as in price_mc.
+
+    Returns:
+        price (float): Discounted Monte Carlo price.
+        stderr (float): Standard error of the estimate.
+        n_paths (int): Number of paths simulated.
+        elapsed (float): Wall-clock time in seconds.
+    """
+    if getattr(model, "qmc", False):
+        raise ValueError("adaptive pricing needs a pseudo-random model (qmc=False)")
+    if rng is None:
+        rng = np.random.default_rng()
+    start = time.perf_counter()
+    stats = RunningStats()
+    n_paths = 0
+    while True:
+        n = min(batch_size, max_paths - n_paths)
+        stats.merge(_price_share(payoff, model, S0, T, r, n, n_steps, rng, None, control))
+        n_paths += n
+        price, stderr = _estimate(stats, control)
+        elapsed = time.perf_counter() - start
+        if ((abs_tol is not None and stderr <= abs_tol)
+                or (rel_tol is not None and stderr <= rel_tol * abs(price))
+                or (time_budget is not None and elapsed >= time_budget)
+                or n_paths >= max_paths):
+            return price, stderr, n_paths, elapsed
+
+
+def _price_share(payoff, model, S0, T, r, n_paths, n_steps, rng, chunk_size,
+                 control=None):
+    """Discounted payoff statistics of one worker's share of the paths."""
+    control_payoff = None if control is None else control[0]
+    antithetic = getattr(model, "antithetic", False)
+    stats = RunningStats()
+    for payoffs in simulate_payoffs(payoff, model, S0, T, n_paths, n_steps,
+                                    rng=rng, chunk_size=chunk_size,
+                                    control_payoff=control_payoff):
+        if antithetic:
+            payoffs = payoffs.reshape((-1, 2) + payoffs.shape[1:]).mean(axis=1)
+        stats.update(np.exp(-r * T) * payoffs)
+    return stats
+
+
+def _price_qmc(payoff, model, S0, T, r, n_paths, n_steps, rng, chunk_size,
+               n_workers, backend, control, n_replications):
+    """Average and standard error of randomized QMC replications."""
+    if n_paths % n_replications:
+        raise ValueError("n_paths must be a multiple of n_replications")
+    if rng is None:
+        rng = np.random.default_rng()
+    args = [
+        (payoff, model, S0, T, r, n_paths // n_replications, n_steps, child,
+         chunk_size, control)
+        for child in rng.spawn(n_replications)
+    ]
+    if n_workers is None:
+        parts = [_price_share(*a) for a in args]
+    else:
+        parts = parallel_map(_price_share, args, n_workers, backend)
+    stats = RunningStats().update([_estimate(part, control)[0] for part in parts])
+    return stats.mean, stats.stderr
+
+
+def _estimate(stats: RunningStats, control: tuple = None) -> tuple:
+    """Price and standard error, adjusted by the control variate if given."""
+    if control is None:
+        return stats.mean, stats.stderr
+    cov = stats.variance
+    if np.ndim(cov) != 2 or cov[1, 1] <= 0:
+        return stats.mean[0], stats.stderr[0]
+    beta = cov[0, 1] / cov[1, 1]
+    price = stats.mean[0] - beta * (stats.mean[1] - control[1])
+    variance = max(cov[0, 0] - beta * cov[0, 1], 0.0)
+    return price, np.sqrt(variance / stats.count)
+
+
+def simulate_payoffs(payoff, model, S0: float, T: float, n_paths: int,
+                     n_steps: int, rng: np.random.Generator = None,
+                     chunk_size: int = None, control_payoff=None):
+    """
+    Yield undiscounted payoffs, simulating only what the payoff needs.
+
+    Payoffs flagged terminal_only (and plain callables, which receive
+    terminal prices) use model.simulate_terminal; payoffs declaring path
+    statistics use model.simulate_statistics and from_statistics; all others
+    are applied to the full path matrix. Models offering only simulate()
+    fall back to the full path matrix.
+
+    Args:
+        payoff (callable): Payoff function or Payoff instance.
+        model: Model instance.
+        S0 (float): Initial asset price.
+        T (float): Time to maturity.
+        n_paths (int): Number of Monte Carlo paths.
+        n_steps (int): Number of time steps per path.
+        rng (np.random.Generator, optional): Random generator.
+        chunk_size (int, optional): Paths per yielded block; a single block
+            of n_paths payoffs is yielded if None.
+        control_payoff (callable, optional): Payoff on terminal prices
+            evaluated on the same paths as a second column.
+
+    Yields:
+        np.ndarray: Payoffs of one block of paths, shape (n,), or (n, 2)
+        with the control payoff values in the second column.
+    """
+    terminal_only = getattr(payoff, "terminal_only", True)
+    statistics = None if terminal_only else getattr(payoff, "statistics", None)
+
+    def evaluate(block):
+        if statistics:
+            ST, values = block
+            payoffs = payoff.from_statistics(ST, values)
+        else:
+            ST = block if terminal_only else block[:, -1]
+            payoffs = payoff(block)
+        if control_payoff is None:
+            return payoffs
+        return np.column_stack([payoffs, control_payoff(ST)])
+
+    if not hasattr(model, "simulate_chunks"):
+        paths = model.simulate(S0, T, n_paths, n_steps, rng=rng)
+        yield evaluate(paths[:, -1] if terminal_only else paths)
+    elif chunk_size is not None:
+        for block in model.simulate_chunks(S0, T, n_paths, n_steps,
+                                           chunk_size=chunk_size, rng=rng,
+                                           store_path=not terminal_only,
+                                           statistics=statistics):
+            yield evaluate(block)
+    elif terminal_only:
+        yield evaluate(model.simulate_terminal(S0, T, n_paths, n_steps, rng=rng))
+    elif statistics:
+        yield evaluate(model.simulate_statistics(S0, T, n_paths, n_steps, statistics, rng=rng))
+    else:
+        yield evaluate(model.simulate(S0, T, n_paths, n_steps, rng=rng))
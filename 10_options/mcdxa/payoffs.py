@@ -1,11 +1,134 @@
 import numpy as np
 
 
+class PathStatistic:
+    """
+    Running statistic of a price path, updated one time step at a time.
+
+    Simulators call start once per block of paths, update with the price
+    vector at every observed time step, and finish at maturity, so that
+    path-dependent payoffs never need the full path matrix. Statistics
+    track a single asset, so multi-asset models do not support them.
+
+    Args:
+        steps (array-like of int, optional): Time-step indices at which the
+            path is observed (0 is the start, n_steps or -1 the maturity);
+            every step by default.
+    """
+    def __init__(self, steps=None):
+        self.steps = None if steps is None else np.atleast_1d(steps).astype(int)
+
+    def observed(self, n_steps: int) -> np.ndarray:
+        """Boolean mask over the n_steps+1 time points."""
+        mask = np.zeros(n_steps + 1, dtype=bool)
+        mask[slice(None) if self.steps is None else self.steps] = True
+        return mask
+
+    def start(self, n: int) -> np.ndarray:
+        """Initial accumulator for n paths."""
+        raise NotImplementedError
+
+    def update(self, acc: np.ndarray, S: np.ndarray) -> np.ndarray:
+        """Fold the prices S of one time step into the accumulator."""
+        raise NotImplementedError
+
+    def finish(self, acc: np.ndarray, n_obs: int) -> np.ndarray:
+        """Final statistic from the accumulator and the number of observations."""
+        return acc
+
+
+class RunningSum(PathStatistic):
+    """Sum of the observed prices."""
+    def start(self, n):
+        return np.zeros(n)
+
+    def update(self, acc, S):
+        acc += S
+        return acc
+
+
+class RunningMean(RunningSum):
+    """Arithmetic average of the observed prices."""
+    def finish(self, acc, n_obs):
+        return acc / n_obs
+
+
+class RunningMax(PathStatistic):
+    """Maximum of the observed prices."""
+    def start(self, n):
+        return np.full(n, -np.inf)
+
+    def update(self, acc, S):
+        return np.maximum(acc, S, out=acc)
+
+
+class RunningMin(PathStatistic):
+    """Minimum of the observed prices."""
+    def start(self, n):
+        return np.full(n, np.inf)
+
+    def update(self, acc, S):
+        return np.minimum(acc, S, out=acc)
+
+
+class BarrierHit(PathStatistic):
+    """
+    Flag whether an observed price touched a barrier.
+
+    Args:
+        level (float): Barrier level.
+        direction (str): 'up' (hit if S >= level) or 'down' (S <= level).
+        steps (array-like of int, optional): Monitoring time-step indices.
+    """
+    def __init__(self, level: float, direction: str = "up", steps=None):
+        if direction not in ("up", "down"):
+            raise ValueError("direction must be 'up' or 'down'")
+        super().__init__(steps)
+        self.level = level
+        self.direction = direction
+
+    def start(self, n):
+        return np.zeros(n, dtype=bool)
+
+    def update(self, acc, S):
+        acc |= (S >= self.level) if self.direction == "up" else (S <= self.level)
+        return acc
+
+    def hit(self, S: np.ndarray) -> np.ndarray:
+        """Barrier flags from a full path matrix."""
+        S = S[:, self.observed(S.shape[1] - 1)]
+        if self.direction == "up":
+            return (S >= self.level).any(axis=1)
+        return (S <= self.level).any(axis=1)
+
+
 class Payoff:
-    """Base class for payoff definitions."""
+    """
+    Base class for payoff definitions.
+
+    Attributes:
+        terminal_only (bool): True if the payoff depends on the terminal
+            price alone, so pricers may simulate terminal prices only.
+        statistics (dict): Name -> PathStatistic needed by from_statistics,
+            or None if the payoff must see the full path matrix.
+    """
+    terminal_only = False
+    statistics = None
+
     def __call__(self, S: np.ndarray) -> np.ndarray:
         raise NotImplementedError
 
+    def from_statistics(self, ST: np.ndarray, values: dict) -> np.ndarray:
+        """Payoff from terminal prices and the values of self.statistics."""
+        raise NotImplementedError
+
+    def derivative(self, ST: np.ndarray) -> np.ndarray:
+        """
+        Derivative of a terminal payoff with respect to the terminal price,
+        used by pathwise Greeks.
+        """
+        raise NotImplementedError
+
 
 class CustomPayoff(Payoff):
     """
@@ -20,6 +143,8 @@ class CustomPayoff(Payoff):
         # payoff = max(sqrt(S_T) - K, 0)
         payoff = CustomPayoff(lambda s: np.maximum(np.sqrt(s) - K, 0))
     """
+    terminal_only = True
+
     def __init__(self, func):
         if not callable(func):
             raise TypeError(f"func must be callable, got {type(func)}")
@@ -35,6 +160,8 @@ class CustomPayoff(Payoff):
 
 class CallPayoff(Payoff):
     """European call option payoff."""
+    terminal_only = True
+
     def __init__(self, strike: float):
         self.strike = strike
 
@@ -44,9 +171,14 @@ class CallPayoff(Payoff):
         S_end = S[:, -1] if S.ndim == 2 else S
         return np.maximum(S_end - self.strike, 0.0)
 
+    def derivative(self, ST: np.ndarray) -> np.ndarray:
+        return (np.asarray(ST) > self.strike).astype(float)
+
 
 class PutPayoff(Payoff):
     """European put option payoff."""
+    terminal_only = True
+
     def __init__(self, strike: float):
         self.strike = strike
 
@@ -55,32 +187,59 @@ class PutPayoff(Payoff):
         S_end = S[:, -1] if S.ndim == 2 else S
         return np.maximum(self.strike - S_end, 0.0)
 
+    def derivative(self, ST: np.ndarray) -> np.ndarray:
+        return -(np.asarray(ST) < self.strike).astype(float)
+
 
 class AsianCallPayoff(Payoff):
-    """Arithmetic Asian (path-dependent) European call payoff."""
-    def __init__(self, strike: float):
+    """
+    Arithmetic Asian (path-dependent) European call payoff.
+
+    Args:
+        strike (float): Strike price.
+        steps (array-like of int, optional): Averaging time-step indices;
+            every step of the path (including the start) by default.
+    """
+    def __init__(self, strike: float, steps=None):
         self.strike = strike
+        self.statistics = {"average": RunningMean(steps)}
 
     def __call__(self, S: np.ndarray) -> np.ndarray:
         S = np.asarray(S)
-        # average price over the path
-        avg = S.mean(axis=1) if S.ndim == 2 else S
+        # average price over the (sampled) path
+        avg = _sampled(S, self.statistics["average"]).mean(axis=1) if S.ndim == 2 else S
         return np.maximum(avg - self.strike, 0.0)
 
+    def from_statistics(self, ST, values):
+        return np.maximum(values["average"] - self.strike, 0.0)
+
 
 class AsianPutPayoff(Payoff):
-    """Arithmetic Asian (path-dependent) European put payoff."""
-    def __init__(self, strike: float):
+    """
+    Arithmetic Asian (path-dependent) European put payoff.
+
+    Args:
+        strike (float): Strike price.
+        steps (array-like of int, optional): Averaging time-step indices;
+            every step of the path (including the start) by default.
+    """
+    def __init__(self, strike: float, steps=None):
         self.strike = strike
+        self.statistics = {"average": RunningMean(steps)}
 
     def __call__(self, S: np.ndarray) -> np.ndarray:
         S = np.asarray(S)
-        avg = S.mean(axis=1) if S.ndim == 2 else S
+        avg = _sampled(S, self.statistics["average"]).mean(axis=1) if S.ndim == 2 else S
         return np.maximum(self.strike - avg, 0.0)
 
+    def from_statistics(self, ST, values):
+        return np.maximum(self.strike - values["average"], 0.0)
+
 
 class LookbackCallPayoff(Payoff):
     """Lookback (path-dependent) European call payoff (max(S) - strike)."""
+    statistics = {"high": RunningMax()}
+
     def __init__(self, strike: float):
         self.strike = strike
 
@@ -89,9 +248,14 @@ class LookbackCallPayoff(Payoff):
         high = S.max(axis=1) if S.ndim == 2 else S
         return np.maximum(high - self.strike, 0.0)
 
+    def from_statistics(self, ST, values):
+        return np.maximum(values["high"] - self.strike, 0.0)
+
 
 class LookbackPutPayoff(Payoff):
     """Lookback (path-dependent) European put payoff (strike - min(S))."""
+    statistics = {"low": RunningMin()}
+
     def __init__(self, strike: float):
         self.strike = strike
 
@@ -99,3 +263,113 @@ class LookbackPutPayoff(Payoff):
         S = np.asarray(S)
         low = S.min(axis=1) if S.ndim == 2 else S
         return np.maximum(self.strike - low, 0.0)
+
+    def from_statistics(self, ST, values):
+        return np.maximum(self.strike - values["low"], 0.0)
+
+
+class BarrierPayoff(Payoff):
+    """
+    Knock-in or knock-out European call or put on a discretely monitored barrier.
+
+    Args:
+        strike (float): Strike price.
+        barrier (float): Barrier level.
+        option_type (str): 'call' or 'put'.
+        direction (str): 'up' or 'down' barrier.
+        knock (str): 'out' (pays unless the barrier is hit) or 'in'
+            (pays only if it is hit).
+        steps (array-like of int, optional): Monitoring time-step indices;
+            every step of the path by default.
+    """
+    def __init__(self, strike: float, barrier: float, option_type: str = "call",
+                 direction: str = "down", knock: str = "out", steps=None):
+        if option_type not in ("call", "put"):
+            raise ValueError("option_type must be 'call' or 'put'")
+        if knock not in ("in", "out"):
+            raise ValueError("knock must be 'in' or 'out'")
+        self.strike = strike
+        self.option_type = option_type
+        self.knock = knock
+        self.statistics = {"hit": BarrierHit(barrier, direction, steps)}
+
+    def __call__(self, S: np.ndarray) -> np.ndarray:
+        S = np.asarray(S)
+        return self.from_statistics(S[:, -1], {"hit": self.statistics["hit"].hit(S)})
+
+    def from_statistics(self, ST, values):
+        if self.option_type == "call":
+            vanilla = np.maximum(ST - self.strike, 0.0)
+        else:
+            vanilla = np.maximum(self.strike - ST, 0.0)
+        alive = values["hit"] if self.knock == "in" else ~values["hit"]
+        return np.where(alive, vanilla, 0.0)
+
+
+class BasketPayoff(Payoff):
+    """
+    European call or put on a weighted basket of d assets,
+    max(+/-(sum_i w_i S_i(T) - K), 0).
+
+    Negative weights give spread options, e.g. weights (1, -1) for an
+    option on S_1 - S_2.
+
+    Args:
+        strike (float): Strike price.
+        weights (array-like): Basket weights, shape (d,).
+        option_type (str): 'call' or 'put'.
+    """
+    terminal_only = True
+
+    def __init__(self, strike: float, weights, option_type: str = "call"):
+        if option_type not in ("call", "put"):
+            raise ValueError("option_type must be 'call' or 'put'")
+        self.strike = strike
+        self.weights = np.asarray(weights, dtype=float)
+        self.option_type = option_type
+
+    def __call__(self, S: np.ndarray) -> np.ndarray:
+        basket = _terminal_assets(S) @ self.weights
+        if self.option_type == "call":
+            return np.maximum(basket - self.strike, 0.0)
+        return np.maximum(self.strike - basket, 0.0)
+
+
+class RainbowPayoff(Payoff):
+    """
+    European call or put on the best or worst of d assets, e.g.
+    max(max_i S_i(T) - K, 0) for a best-of call.
+
+    Args:
+        strike (float): Strike price.
+        option_type (str): 'call' or 'put'.
+        rank (str): 'best' (maximum) or 'worst' (minimum) of the assets.
+    """
+    terminal_only = True
+
+    def __init__(self, strike: float, option_type: str = "call", rank: str = "best"):
+        if option_type not in ("call", "put"):
+            raise ValueError("option_type must be 'call' or 'put'")
+        if rank not in ("best", "worst"):
+            raise ValueError("rank must be 'best' or 'worst'")
+        self.strike = strike
+        self.option_type = option_type
+        self.rank = rank
+
+    def __call__(self, S: np.ndarray) -> np.ndarray:
+        ST = _terminal_assets(S)
+        extreme = ST.max(axis=-1) if self.rank == "best" else ST.min(axis=-1)
+        if self.option_type == "call":
+            return np.maximum(extreme - self.strike, 0.0)
+        return np.maximum(self.strike - extreme, 0.0)
+
+
+def _terminal_assets(S: np.ndarray) -> np.ndarray:
+    """Terminal prices (n, d) from terminal prices or paths (n, n_steps+1, d)."""
+    S = np.asarray(S)
+    return S[:, -1] if S.ndim == 3 else S
+
+
+def _sampled(S: np.ndarray, stat: PathStatistic) -> np.ndarray:
+    """Columns of the path matrix S observed by stat."""
+    return S if stat.steps is None else S[:, stat.observed(S.shape[1] - 1)]
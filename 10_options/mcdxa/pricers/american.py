@@ -1,11 +1,19 @@
 import math
 import numpy as np
 
+from ..models import DEFAULT_CHUNK_SIZE
+from ..monte_carlo import RunningStats
+from ..regression import design_matrix, least_squares
+from ..utils import call_mask, parallel_map, split_paths
+
 
 class AmericanBinomialPricer:
     """
     Cox-Ross-Rubinstein binomial pricer for American options.
 
+    The backward induction works on NumPy arrays one time slice at a time,
+    so the payoff must be vectorized over arrays of spot prices.
+
     Attributes:
         model: Asset price model with attributes r, sigma, q.
         payoff: Payoff callable.
@@ -40,15 +48,76 @@ class AmericanBinomialPricer:
         disc = math.exp(-r * dt)
         p = (math.exp((r - q) * dt) - d) / (u - d)
 
-        prices = [S0 * (u ** (n - j)) * (d ** j) for j in range(n + 1)]
-        values = [float(self.payoff(price)) for price in prices]
+        # backward induction one time slice at a time; node j of layer i
+        # has price S0 * u**(i - j) * d**j = S0 * u**(i - 2j), so every layer
+        # is a strided view of one price ladder
+        ladder = S0 * u ** np.arange(n, -n - 1, -1)
+        values = np.asarray(self.payoff(ladder[::2]), dtype=float)
+        for i in range(n - 1, -1, -1):
+            cont = disc * (p * values[:-1] + (1 - p) * values[1:])
+            exercise = self.payoff(ladder[n - i:n + i + 1:2])
+            values = np.maximum(exercise, cont)
+        return float(values[0])
+
+
+def binomial_price_batch(model, S0, K, T, r: float, option_type="put",
+                         n_steps: int = 200) -> np.ndarray:
+    """
+    Price many American vanilla options in one CRR lattice sweep per maturity.
+
+    Options sharing a maturity share the CRR parameters and price ladder;
+    their backward inductions run together, in place, on one
+    (nodes x options) array. Each option pays max(S - K, 0) or
+    max(K - S, 0), as AmericanBinomialPricer.price does with a CallPayoff
+    or PutPayoff.
+
+    Parameters:
+    - model: Asset price model with attributes sigma and (optionally) q
+    - S0: Initial asset price(s)
+    - K: Strike price(s)
+    - T: Time(s) to maturity
+    - r: Risk-free rate
+    - option_type: 'call', 'put', an array of these, or a boolean call mask
+    - n_steps: Number of binomial steps
+
+    Returns:
+    - prices: American option prices, broadcast shape of the inputs
+    """
+    S0, K, T = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (S0, K, T)))
+    sign = np.where(np.broadcast_to(call_mask(option_type), S0.shape), 1.0, -1.0)
+    sigma = model.sigma
+    q = getattr(model, 'q', 0.0)
+    n = n_steps
+
+    # degenerate zero-volatility or expired: immediate exercise
+    prices = np.array(np.maximum(sign * (S0 - K), 0.0), dtype=float, ndmin=1).reshape(S0.shape)
+    if sigma <= 0:
+        return prices[()]
+    for t in np.unique(T[T > 0]):
+        sel = T == t
+        s0, k, phi = S0[sel], K[sel], sign[sel]
+        dt = t / n
+        u = math.exp(sigma * math.sqrt(dt))
+        d = 1 / u
+        disc = math.exp(-r * dt)
+        p = (math.exp((r - q) * dt) - d) / (u - d)
 
+        # (nodes x options) so every time slice is a contiguous block
+        ladder = u ** np.arange(n, -n - 1, -1)[:, None]
+        values = np.maximum(phi * (ladder[::2] * s0 - k), 0.0)
+        # layer i occupies the first i + 1 rows; updated in place
+        work = np.empty_like(values)
         for i in range(n - 1, -1, -1):
-            for j in range(i + 1):
-                cont = disc * (p * values[j] + (1 - p) * values[j + 1])
-                exercise = float(self.payoff(S0 * (u ** (i - j)) * (d ** j)))
-                values[j] = max(exercise, cont)
-        return values[0]
+            cont, exercise = values[:i + 1], work[:i + 1]
+            np.multiply(values[1:i + 2], disc * (1 - p), out=exercise)
+            cont *= disc * p
+            cont += exercise
+            np.multiply(ladder[n - i:n + i + 1:2], s0, out=exercise)
+            exercise -= k
+            exercise *= phi
+            np.maximum(cont, exercise, out=cont)
+        prices[sel] = values[0]
+    return prices[()]
 
 
 class LongstaffSchwartzPricer:
@@ -61,52 +130,171 @@ class LongstaffSchwartzPricer:
         n_paths: Number of Monte Carlo paths.
         n_steps: Number of time steps per path.
         rng: numpy random generator.
+        n_workers: Number of workers simulating the paths in parallel, each
+            with its own generator from rng.spawn, or None for a single
+            stream. The regression itself runs on all paths.
+        backend: 'thread' or 'process' worker pool; threads avoid copying
+            the path matrices between processes.
+        basis: Regression basis, 'monomial', 'laguerre' or 'hermite'.
+        degree: Polynomial degree of the regression basis.
+        chunk_size: Paths simulated per block when pricing with a fitted
+            policy, or None for the default block size.
     """
     def __init__(self, model, payoff, n_paths: int = 100_000,
-                 n_steps: int = 50, seed: int = None):
+                 n_steps: int = 50, seed: int = None,
+                 n_workers: int = None, backend: str = "thread",
+                 basis: str = "monomial", degree: int = 2,
+                 chunk_size: int = None):
         self.model = model
         self.payoff = payoff
         self.n_paths = n_paths
         self.n_steps = n_steps
         self.rng = None if seed is None else np.random.default_rng(seed)
+        self.n_workers = n_workers
+        self.backend = backend
+        self.basis = basis
+        self.degree = degree
+        self.chunk_size = chunk_size
 
-    def price(self, S0: float, T: float, r: float) -> tuple:
+    def price(self, S0: float, T: float, r: float,
+              policy: "ExercisePolicy" = None) -> tuple:
         """
         Price the American option via Least-Squares Monte Carlo.
 
+        Without a policy, continuation values are regressed on the
+        standardized in-the-money spot prices of the pricing paths
+        themselves (in-sample, biased high); the cashflows are kept
+        discounted to the current date by one multiplication per step.
+        With a policy from fit, fresh paths are simulated in chunks of
+        chunk_size and exercised by the stored rule without refitting
+        (out-of-sample, biased low).
+
         Args:
             S0: Initial asset price.
             T: Time to maturity.
             r: Risk-free rate.
+            policy: Fitted ExercisePolicy to apply, or None.
 
         Returns:
             (price, stderr): discounted price and its standard error.
         """
-        dt = T / self.n_steps
-        paths = self.model.simulate(S0, T, self.n_paths, self.n_steps, rng=self.rng)
-        n_paths, _ = paths.shape
-        cashflow = self.payoff(paths[:, -1])
-        tau = np.full(n_paths, self.n_steps, dtype=int)
+        if policy is not None:
+            return self._price_with_policy(S0, T, r, policy)
+        discounted = self._backward(self._simulate(S0, T), T, r)
+        price = discounted.mean()
+        stderr = discounted.std(ddof=1) / np.sqrt(self.n_paths)
+        return price, stderr
 
-        disc = math.exp(-r * dt)
+    def fit(self, S0: float, T: float, r: float) -> "ExercisePolicy":
+        """
+        Fit the exercise rule on a training set of n_paths paths.
+
+        The returned policy can price fresh path sets, including under
+        bumped spot or model parameters, via price(..., policy=policy).
+
+        Args:
+            S0: Initial asset price.
+            T: Time to maturity.
+            r: Risk-free rate.
+
+        Returns:
+            ExercisePolicy: Regression coefficients per exercise date.
+        """
+        policy = ExercisePolicy(self.basis, self.degree, self.n_steps)
+        self._backward(self._simulate(S0, T), T, r, policy)
+        return policy
+
+    def _backward(self, paths: np.ndarray, T: float, r: float,
+                  policy: "ExercisePolicy" = None) -> np.ndarray:
+        """Backward induction; returns each path's cashflow discounted to 0."""
+        disc = math.exp(-r * T / self.n_steps)
+        cashflow = self.payoff(paths[:, -1]).astype(float)
         for t in range(self.n_steps - 1, 0, -1):
+            # cashflow: value of each path's exercise, discounted to date t
+            cashflow *= disc
             St = paths[:, t]
             immediate = self.payoff(St)
-            itm = immediate > 0
-            if not np.any(itm):
+            itm = np.flatnonzero(immediate > 0)
+            if not len(itm):
                 continue
-            Y = cashflow[itm] * (disc ** (tau[itm] - t))
             X = St[itm]
-            A = np.vstack([np.ones_like(X), X, X**2]).T
-            coeffs, *_ = np.linalg.lstsq(A, Y, rcond=None)
-            continuation = coeffs[0] + coeffs[1] * X + coeffs[2] * X**2
-            exercise = immediate[itm] > continuation
-            idx = np.where(itm)[0][exercise]
+            center, scale = X.mean(), X.std()
+            if scale == 0:
+                scale = 1.0
+            A = design_matrix((X - center) / scale, self.basis, self.degree)
+            coeffs = least_squares(A, cashflow[itm])
+            if policy is not None:
+                policy.rules[t] = (center, scale, coeffs)
+            idx = itm[immediate[itm] > A @ coeffs]
             cashflow[idx] = immediate[idx]
-            tau[idx] = t
+        return cashflow * disc
 
-        discounts = np.exp(-r * dt * tau)
-        discounted = cashflow * discounts
-        price = discounted.mean()
-        stderr = discounted.std(ddof=1) / np.sqrt(self.n_paths)
-        return price, stderr
+    def _price_with_policy(self, S0, T, r, policy):
+        """Out-of-sample price on fresh chunked paths under a fixed policy."""
+        if policy.n_steps != self.n_steps:
+            raise ValueError("policy was fitted with a different number of exercise dates")
+        dt = T / self.n_steps
+        stats = RunningStats()
+        for paths in self.model.simulate_chunks(S0, T, self.n_paths, self.n_steps,
+                                                chunk_size=self.chunk_size or DEFAULT_CHUNK_SIZE,
+                                                rng=self.rng):
+            # exercise at the first date where the policy says so
+            value = np.zeros(len(paths))
+            alive = np.ones(len(paths), dtype=bool)
+            for t in range(1, self.n_steps):
+                St = paths[:, t]
+                immediate = self.payoff(St)
+                idx = np.flatnonzero(alive & (immediate > 0))
+                idx = idx[immediate[idx] > policy.continuation(t, St[idx])]
+                value[idx] = immediate[idx] * math.exp(-r * dt * t)
+                alive[idx] = False
+            value[alive] = self.payoff(paths[alive, -1]) * math.exp(-r * T)
+            stats.update(value)
+        return stats.mean, stats.stderr
+
+    def _simulate(self, S0: float, T: float) -> np.ndarray:
+        """Simulate all paths, split across workers if n_workers is set."""
+        if self.n_workers is None:
+            return self.model.simulate(S0, T, self.n_paths, self.n_steps, rng=self.rng)
+        rng = self.rng if self.rng is not None else np.random.default_rng()
+        args = [
+            (self.model, S0, T, n, self.n_steps, child)
+            for n, child in zip(split_paths(self.n_paths, self.n_workers),
+                                rng.spawn(self.n_workers))
+            if n > 0
+        ]
+        return np.concatenate(parallel_map(_simulate_share, args, self.n_workers, self.backend))
+
+
+class ExercisePolicy:
+    """
+    Exercise rule of a fitted Longstaff-Schwartz regression.
+
+    For each exercise date t the rule stores the standardization (center,
+    scale) of the in-the-money spots and the regression coefficients; an
+    in-the-money path is exercised when the payoff exceeds the regressed
+    continuation value. Dates without a fit are never exercised.
+
+    Attributes:
+        basis (str): Regression basis.
+        degree (int): Polynomial degree of the basis.
+        n_steps (int): Number of time steps of the fitted grid.
+        rules (dict): Exercise date -> (center, scale, coefficients).
+    """
+    def __init__(self, basis: str, degree: int, n_steps: int):
+        self.basis = basis
+        self.degree = degree
+        self.n_steps = n_steps
+        self.rules = {}
+
+    def continuation(self, t: int, S: np.ndarray) -> np.ndarray:
+        """Regressed continuation value at exercise date t for spots S."""
+        if t not in self.rules:
+            return np.full(len(S), np.inf)
+        center, scale, coeffs = self.rules[t]
+        return design_matrix((S - center) / scale, self.basis, self.degree) @ coeffs
+
+
+def _simulate_share(model, S0, T, n_paths, n_steps, rng):
+    """Paths of one worker's share."""
+    return model.simulate(S0, T, n_paths, n_steps, rng=rng)
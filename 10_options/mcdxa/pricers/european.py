@@ -1,6 +1,10 @@
 import numpy as np
 
-from ..monte_carlo import price_mc
+from ..greeks import mc_greeks
+from ..models import DEFAULT_CHUNK_SIZE
+from ..monte_carlo import price_mc, price_mc_adaptive
+from ..payoffs import CallPayoff
+from ..risk import RiskEngine
 
 
 class EuropeanPricer:
@@ -13,14 +17,31 @@ class EuropeanPricer:
         n_paths (int): Number of simulation paths.
         n_steps (int): Number of time steps per path.
         rng: numpy random generator.
+        chunk_size (int): Paths simulated per block, or None to simulate all
+            paths at once (see price_mc).
+        n_workers (int): Number of parallel workers, or None to run in the
+            calling thread (see price_mc).
+        backend (str): 'process' or 'thread' worker pool.
+        control_variate (bool): Use the vanilla call at the payoff's strike
+            (S0 if it has none), priced analytically by the model, as control
+            variate.
+        n_replications (int): Randomized replications for QMC models
+            (see price_mc).
     """
     def __init__(self, model, payoff, n_paths: int = 100_000,
-                 n_steps: int = 1, seed: int = None):
+                 n_steps: int = 1, seed: int = None, chunk_size: int = None,
+                 n_workers: int = None, backend: str = "process",
+                 control_variate: bool = False, n_replications: int = 16):
         self.model = model
         self.payoff = payoff
         self.n_paths = n_paths
         self.n_steps = n_steps
         self.rng = None if seed is None else np.random.default_rng(seed)
+        self.chunk_size = chunk_size
+        self.n_workers = n_workers
+        self.backend = backend
+        self.control_variate = control_variate
+        self.n_replications = n_replications
 
     def price(self, S0: float, T: float, r: float) -> tuple:
         """
@@ -36,5 +57,73 @@ class EuropeanPricer:
         """
         return price_mc(
             self.payoff, self.model, S0, T, r,
-            self.n_paths, self.n_steps, rng=self.rng
+            self.n_paths, self.n_steps, rng=self.rng,
+            chunk_size=self.chunk_size, n_workers=self.n_workers,
+            backend=self.backend, control=self._control(S0, T),
+            n_replications=self.n_replications
         )
+
+    def price_adaptive(self, S0: float, T: float, r: float,
+                       abs_tol: float = None, rel_tol: float = None,
+                       time_budget: float = None) -> tuple:
+        """
+        Price in batches until a target standard error or time budget.
+
+        Batches have chunk_size paths (the default block size if None) and
+        at most n_paths paths are used (see price_mc_adaptive).
+
+        Args:
+            S0 (float): Initial asset price.
+            T (float): Time to maturity.
+            r (float): Risk-free rate.
+            abs_tol (float, optional): Target standard error.
+            rel_tol (float, optional): Target standard error relative to price.
+            time_budget (float, optional): Wall-clock limit in seconds.
+
+        Returns:
+            tuple: (price, stderr, n_paths used, elapsed seconds)
+        """
+        return price_mc_adaptive(
+            self.payoff, self.model, S0, T, r, abs_tol=abs_tol,
+            rel_tol=rel_tol, time_budget=time_budget, max_paths=self.n_paths,
+            batch_size=self.chunk_size or DEFAULT_CHUNK_SIZE,
+            n_steps=self.n_steps, rng=self.rng, control=self._control(S0, T)
+        )
+
+    def greeks(self, S0: float, T: float, r: float,
+               method: str = "pathwise") -> dict:
+        """
+        Price, delta, gamma, vega and rho from a single simulation run.
+
+        Args:
+            S0 (float): Initial asset price.
+            T (float): Time to maturity.
+            r (float): Risk-free rate.
+            method (str): 'pathwise' or 'likelihood_ratio' (see mcdxa.greeks).
+
+        Returns:
+            dict: Name -> (estimate, stderr).
+        """
+        return mc_greeks(
+            self.payoff, self.model, S0, T, r, self.n_paths, self.n_steps,
+            rng=self.rng, method=method,
+            chunk_size=self.chunk_size or DEFAULT_CHUNK_SIZE
+        )
+
+    def risk_engine(self) -> RiskEngine:
+        """
+        Scenario pricer reusing one set of random inputs (see mcdxa.risk).
+
+        Returns:
+            RiskEngine: Engine with this pricer's model, payoff, path count
+            and generator.
+        """
+        return RiskEngine(self.model, self.payoff, self.n_paths, self.n_steps,
+                          rng=self.rng, chunk_size=self.chunk_size or DEFAULT_CHUNK_SIZE)
+
+    def _control(self, S0: float, T: float):
+        """Control variate for price_mc, or None."""
+        if not self.control_variate:
+            return None
+        K = getattr(self.payoff, "strike", S0)
+        return CallPayoff(K), self.model.vanilla_price(S0, K, T, "call")
@@ -0,0 +1,92 @@
+"""
+Quasi-Monte Carlo normal draws: scrambled Sobol points with Brownian-bridge
+construction across time steps.
+"""
+import warnings
+from functools import lru_cache
+
+import numpy as np
+from scipy.special import ndtri
+from scipy.stats import qmc
+
+
+@lru_cache(maxsize=32)
+def bridge_schedule(n_steps: int) -> tuple:
+    """
+    Brownian-bridge construction order on the grid 1..n_steps.
+
+    Returns one (index, left, right, left_weight, right_weight, scale) tuple
+    per point, in the order the points are generated: the terminal point
+    first, then successive midpoints. A left or right index of 0 denotes
+    W_0 = 0.
+    """
+    schedule = [(n_steps, 0, 0, 0.0, 0.0, np.sqrt(n_steps))]
+    intervals = [(0, n_steps)]
+    while intervals:
+        next_intervals = []
+        for left, right in intervals:
+            if right - left < 2:
+                continue
+            mid = (left + right) // 2
+            span = right - left
+            schedule.append((mid, left, right, (right - mid) / span,
+                             (mid - left) / span,
+                             np.sqrt((mid - left) * (right - mid) / span)))
+            next_intervals += [(left, mid), (mid, right)]
+        intervals = next_intervals
+    return tuple(schedule)
+
+
+def brownian_bridge(z: np.ndarray) -> np.ndarray:
+    """
+    Map iid normals to Brownian increments via the Brownian bridge.
+
+    Column t of z (axis 1) drives the t-th point of bridge_schedule, so the
+    leading columns, which carry the best-distributed Sobol coordinates,
+    determine the terminal value and the coarse shape of each path.
+
+    Args:
+        z (np.ndarray): Standard normals, shape (n, n_steps, ...).
+
+    Returns:
+        np.ndarray: Unit-variance increments W_t - W_{t-1}, same shape.
+    """
+    n_steps = z.shape[1]
+    W = np.zeros((z.shape[0], n_steps + 1) + z.shape[2:])
+    for k, (i, left, right, wl, wr, scale) in enumerate(bridge_schedule(n_steps)):
+        W[:, i] = wl * W[:, left] + wr * W[:, right] + scale * z[:, k]
+    return np.diff(W, axis=1)
+
+
+class SobolNormals:
+    """
+    Stream of scrambled Sobol normals, one Sobol dimension per random input
+    of a path.
+
+    Successive draws continue the same sequence, so drawing a run in blocks
+    gives the same points as drawing it at once. Sobol points are best
+    balanced for power-of-two numbers of paths.
+
+    Attributes:
+        rng (np.random.Generator): Generator seeding the scrambling.
+    """
+    def __init__(self, rng: np.random.Generator):
+        self.rng = rng
+        self._engine = None
+
+    def normals(self, shape: tuple) -> np.ndarray:
+        """
+        Standard normals of shape (n, n_steps, ...) with Brownian-bridge
+        ordering along axis 1; shape (n,) gives plain one-dimensional draws.
+        """
+        d = int(np.prod(shape[1:]))
+        if self._engine is None:
+            self._engine = qmc.Sobol(d, scramble=True, seed=self.rng)
+        elif self._engine.d != d:
+            raise ValueError("Sobol stream used with a different dimension")
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message=".*balance properties")
+            u = self._engine.random(shape[0])
+        eps = np.finfo(float).eps
+        z = ndtri(np.clip(u, eps, 1 - eps)).reshape(shape)
+        return brownian_bridge(z) if len(shape) > 1 else z
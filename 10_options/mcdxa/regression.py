@@ -0,0 +1,63 @@
+"""
+Least-squares regression layer for Longstaff-Schwartz continuation values.
+"""
+import numpy as np
+from scipy.linalg import LinAlgError, cho_factor, cho_solve
+
+BASES = ("monomial", "laguerre", "hermite")
+
+
+def design_matrix(x: np.ndarray, basis: str = "monomial", degree: int = 2) -> np.ndarray:
+    """
+    Regression design matrix of polynomial basis functions.
+
+    Columns are built by the three-term recurrence of the chosen family.
+    All families of a given degree span the same polynomials, so they give
+    the same fit in exact arithmetic; Laguerre and Hermite columns are less
+    collinear on standardized inputs.
+
+    Parameters:
+    - x: Regressor values, shape (n,)
+    - basis: 'monomial', 'laguerre' or 'hermite' (probabilists')
+    - degree: Highest polynomial degree
+
+    Returns:
+    - A: Design matrix, shape (n, degree + 1)
+    """
+    if basis not in BASES:
+        raise ValueError(f"basis must be one of {BASES}")
+    if degree < 0:
+        raise ValueError("degree must be non-negative")
+    A = np.empty((len(x), degree + 1))
+    A[:, 0] = 1.0
+    if degree == 0:
+        return A
+    A[:, 1] = 1.0 - x if basis == "laguerre" else x
+    for k in range(1, degree):
+        if basis == "monomial":
+            A[:, k + 1] = A[:, k] * x
+        elif basis == "laguerre":
+            A[:, k + 1] = ((2 * k + 1 - x) * A[:, k] - k * A[:, k - 1]) / (k + 1)
+        else:
+            A[:, k + 1] = x * A[:, k] - k * A[:, k - 1]
+    return A
+
+
+def least_squares(A: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Least-squares coefficients from the Cholesky-factored normal equations.
+
+    Falls back to an SVD solve when A'A is singular (e.g. when all
+    regressors coincide).
+
+    Parameters:
+    - A: Design matrix, shape (n, k)
+    - y: Regressand, shape (n,)
+
+    Returns:
+    - coeffs: Coefficients, shape (k,)
+    """
+    try:
+        return cho_solve(cho_factor(A.T @ A), A.T @ y)
+    except LinAlgError:
+        return np.linalg.lstsq(A, y, rcond=None)[0]
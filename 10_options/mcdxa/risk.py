@@ -0,0 +1,198 @@
+"""
+Bump-and-reprice risk with common random numbers.
+
+RiskEngine draws the random inputs of a simulation once and replays them
+for every scenario, so prices under bumped spot, volatility, rates or any
+other model parameter differ only through the parameters and not through
+sampling noise; finite-difference Greeks and P&L ladders are then smooth
+in the bump size.
+
+The single-asset mcdxa models are homogeneous in S0 (paths scale with the
+initial price), so for terminal and full-path payoffs the paths of each
+parameter set are simulated once at S0 = 1 and rescaled to every spot of a
+ladder. Payoffs built on path statistics (barriers, averages) are simulated
+per spot, still on the cached random inputs. Multi-asset models are not
+supported.
+"""
+import inspect
+import itertools
+
+import numpy as np
+
+from .models import DEFAULT_CHUNK_SIZE, chunk_sizes
+from .monte_carlo import RunningStats
+
+
+class ShockCache:
+    """
+    Record the draws of a random stream once and replay them on demand.
+
+    Calls are matched by position after each rewind. A call with the same
+    method and arguments as the recorded one returns a copy of the recorded
+    draw; a call with different arguments (e.g. Poisson counts under a
+    bumped jump intensity) is redrawn from the generator state recorded
+    before the original draw, so it still uses common random numbers.
+
+    Attributes:
+        stream (np.random.Generator): Wrapped generator.
+        draws (list): (key, generator state, values) per recorded call.
+    """
+    def __init__(self, stream: np.random.Generator):
+        self.stream = stream
+        self.draws = []
+        self._position = 0
+
+    def rewind(self) -> "ShockCache":
+        """Replay from the first recorded draw."""
+        self._position = 0
+        return self
+
+    def standard_normal(self, *args, **kwargs) -> np.ndarray:
+        return self._draw("standard_normal", args, kwargs)
+
+    def poisson(self, *args, **kwargs) -> np.ndarray:
+        return self._draw("poisson", args, kwargs)
+
+    def standard_gamma(self, *args, **kwargs) -> np.ndarray:
+        return self._draw("standard_gamma", args, kwargs)
+
+    def random(self, *args, **kwargs) -> np.ndarray:
+        return self._draw("random", args, kwargs)
+
+    def _draw(self, method: str, args: tuple, kwargs: dict) -> np.ndarray:
+        key = (method, repr(args), repr(sorted(kwargs.items())))
+        if self._position == len(self.draws):
+            state = self.stream.bit_generator.state
+            values = getattr(self.stream, method)(*args, **kwargs)
+            self.draws.append((key, state, values))
+        recorded, state, values = self.draws[self._position]
+        self._position += 1
+        if recorded == key:
+            # the simulation kernels may modify their inputs in place
+            return values.copy()
+        replay = np.random.Generator(type(self.stream.bit_generator)())
+        replay.bit_generator.state = state
+        return getattr(replay, method)(*args, **kwargs)
+
+
+class RiskEngine:
+    """
+    Monte Carlo scenario pricing on cached common random numbers.
+
+    Attributes:
+        model: Base model instance (BSM, Merton, Heston or Bates).
+        payoff: Payoff callable or Payoff instance.
+        n_paths (int): Number of simulation paths.
+        n_steps (int): Number of time steps per path.
+        chunk_size (int): Paths per cached block.
+    """
+    def __init__(self, model, payoff, n_paths: int = 100_000, n_steps: int = 1,
+                 rng: np.random.Generator = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if getattr(model, "qmc", False):
+            raise ValueError("the risk engine needs a pseudo-random model (qmc=False)")
+        if model.asset_shape:
+            raise ValueError("the risk engine needs a single-asset model")
+        if rng is None:
+            rng = np.random.default_rng()
+        self.model = model
+        self.payoff = payoff
+        self.n_paths = n_paths
+        self.n_steps = n_steps
+        self.chunk_size = chunk_size
+        self._streams = [ShockCache(s) for s in model._streams(rng)]
+
+    def price(self, S0: float, T: float, r: float, **params) -> tuple:
+        """
+        Price under one scenario.
+
+        Args:
+            S0 (float): Initial asset price.
+            T (float): Time to maturity.
+            r (float): Risk-free rate (also the model's drift rate).
+            **params: Model parameters overriding those of the base model,
+                e.g. sigma=0.25.
+
+        Returns:
+            tuple: (price, stderr)
+        """
+        price, stderr = self.scenarios(S0, T, r, **params)
+        return float(price), float(stderr)
+
+    def scenarios(self, S0, T: float, r, **axes) -> tuple:
+        """
+        Prices on the grid of spots and bumped model parameters.
+
+        Args:
+            S0 (float or array-like): Spot price(s), e.g. a spot ladder.
+            T (float): Time to maturity.
+            r (float or array-like): Risk-free rate(s); each rate is used
+                as the model's drift and for discounting.
+            **axes: Model parameter name -> value or values, e.g.
+                sigma=np.linspace(0.1, 0.3, 21). Unspecified parameters
+                keep the base model's values.
+
+        Returns:
+            prices (np.ndarray): Discounted prices of shape
+                np.shape(S0) + np.shape(r) + the shapes of the axes.
+            stderr (np.ndarray): Standard errors, same shape.
+        """
+        spots = np.asarray(S0, dtype=float)
+        axes = {"r": r, **axes}
+        names = self._parameter_names()
+        for name in axes:
+            if name not in names:
+                raise ValueError(f"unknown parameter {name!r}; expected one of {names}")
+        values = {name: np.asarray(v, dtype=float) for name, v in axes.items()}
+        grid_shape = sum((v.shape for v in values.values()), ())
+        prices = np.empty(spots.shape + grid_shape)
+        stderr = np.empty_like(prices)
+
+        base = {name: getattr(self.model, name) for name in names}
+        for index in itertools.product(*(np.ndindex(v.shape) for v in values.values())):
+            params = {name: v[i].item() for (name, v), i in zip(values.items(), index)}
+            model = type(self.model)(**{**base, **params})
+            stats = self._reprice(model, spots.ravel(), T)
+            disc = np.exp(-params["r"] * T)
+            grid_index = (...,) + sum(index, ())
+            prices[grid_index] = disc * stats.mean.reshape(spots.shape)
+            stderr[grid_index] = disc * stats.stderr.reshape(spots.shape)
+        return prices, stderr
+
+    def _parameter_names(self) -> tuple:
+        """Constructor arguments of the model, which it keeps as attributes."""
+        return tuple(inspect.signature(type(self.model)).parameters)
+
+    def _reprice(self, model, spots: np.ndarray, T: float) -> RunningStats:
+        """Undiscounted payoff statistics at each spot for one parameter set."""
+        payoff = self.payoff
+        terminal_only = getattr(payoff, "terminal_only", True)
+        statistics = None if terminal_only else getattr(payoff, "statistics", None)
+        dt = T / self.n_steps
+
+        def blocks(S0):
+            for stream in self._streams:
+                stream.rewind()
+            for n in chunk_sizes(self.n_paths, self.chunk_size):
+                if statistics:
+                    yield model._statistics_block(S0, dt, n, self.n_steps,
+                                                  self._streams, statistics)
+                elif terminal_only:
+                    yield model._terminal_block(S0, T, n, self.n_steps, self._streams)
+                else:
+                    block = np.empty((n, self.n_steps + 1), dtype=model.dtype)
+                    model._fill_block(S0, dt, self._streams, block)
+                    yield block
+
+        if statistics:
+            # path statistics are not homogeneous in S0: one run per spot
+            columns = [np.concatenate([payoff.from_statistics(*b) for b in blocks(S)])
+                       for S in spots]
+            payoffs = np.column_stack(columns)
+        else:
+            payoffs = np.concatenate([
+                np.column_stack([payoff(S * b) for S in spots]) for b in blocks(1.0)
+            ])
+        if model.antithetic:
+            payoffs = payoffs.reshape(-1, 2, len(spots)).mean(axis=1)
+        return RunningStats().update(payoffs)
@@ -1,6 +1,72 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 import numpy as np
 
 
 def discount_factor(r: float, T: float) -> float:
     """Compute discount factor exp(-r*T)."""
-    return np.exp(-r * T)
\ No newline at end of file
+    return np.exp(-r * T)
+
+
+def call_mask(option_type) -> np.ndarray:
+    """
+    Boolean array that is True where option_type denotes a call.
+
+    option_type may be 'call'/'put', an array of such strings, or a boolean
+    array (True for calls), which is returned unchanged.
+    """
+    option_type = np.asarray(option_type)
+    if option_type.dtype == bool:
+        return option_type
+    is_call = option_type == "call"
+    if not np.all(is_call | (option_type == "put")):
+        raise ValueError("option_type must be 'call' or 'put'")
+    return is_call
+
+
+def split_paths(n_paths: int, n_parts: int) -> list:
+    """Split n_paths into n_parts near-equal counts (larger counts first)."""
+    base, rest = divmod(n_paths, n_parts)
+    return [base + (i < rest) for i in range(n_parts)]
+
+
+def worker_pool(n_workers: int, backend: str = "process"):
+    """
+    Executor for n_workers workers, to be used as a context manager.
+
+    Args:
+        n_workers (int): Number of workers.
+        backend (str): 'process' (ProcessPoolExecutor) or 'thread'
+            (ThreadPoolExecutor; NumPy releases the GIL in its kernels).
+
+    Returns:
+        concurrent.futures.Executor: The worker pool.
+    """
+    if backend == "process":
+        return ProcessPoolExecutor(max_workers=n_workers)
+    if backend == "thread":
+        return ThreadPoolExecutor(max_workers=n_workers)
+    raise ValueError("backend must be 'process' or 'thread'")
+
+
+def parallel_map(func, args: list, n_workers: int, backend: str = "process",
+                 executor=None) -> list:
+    """
+    Apply func to each argument tuple in a worker pool, preserving order.
+
+    Args:
+        func (callable): Function to call as func(*a) for a in args; must be
+            picklable (module-level) for the process backend.
+        args (list): Argument tuples.
+        n_workers (int): Number of workers.
+        backend (str): 'process' or 'thread' (see worker_pool).
+        executor (concurrent.futures.Executor, optional): Running pool to
+            reuse across calls; a new pool is created and shut down if None.
+
+    Returns:
+        list: Results in the order of args.
+    """
+    if executor is not None:
+        return list(executor.map(func, *zip(*args)))
+    with worker_pool(n_workers, backend) as executor:
+        return list(executor.map(func, *zip(*args)))
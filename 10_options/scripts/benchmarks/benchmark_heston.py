@@ -32,10 +32,12 @@ def main():
     parser.add_argument("--n_steps", type=int, default=50, help="Number of time steps per path")
     parser.add_argument("--seed", type=int, default=42, help="Random seed")
     parser.add_argument("--q", type=float, default=0.0, help="Dividend yield")
+    parser.add_argument("--scheme", choices=["euler", "qe", "exact"], default="euler",
+                        help="Variance discretization scheme")
     args = parser.parse_args()
 
     model = Heston(
-        args.r, args.kappa, args.theta, args.xi, args.rho, args.v0, q=args.q
+        args.r, args.kappa, args.theta, args.xi, args.rho, args.v0, q=args.q, scheme=args.scheme
     )
     moneyness = 0.10
     scenarios = []
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from mcdxa.bsm import bsm_price, bsm_price_vec, bsm_greeks_vec, implied_vol_vec
+
+
+def test_bsm_price_vec_matches_scalar_surface():
+    S0, r, sigma, q = 100.0, 0.03, 0.25, 0.01
+    K = np.linspace(60.0, 140.0, 9)
+    T = np.array([0.1, 0.5, 1.0, 2.0])[:, None]
+    for opt_type in ["call", "put"]:
+        prices = bsm_price_vec(S0, K, T, r, sigma, q=q, option_type=opt_type)
+        assert prices.shape == (4, 9)
+        expected = [[bsm_price(S0, k, t, r, sigma, q=q, option_type=opt_type)
+                     for k in K] for t in T[:, 0]]
+        assert np.allclose(prices, expected, rtol=1e-12, atol=1e-12)
+
+
+def test_bsm_price_vec_option_type_mask():
+    K = np.array([90.0, 100.0, 110.0])
+    types = np.array(["call", "put", "call"])
+    prices = bsm_price_vec(100.0, K, 1.0, 0.05, 0.2, option_type=types)
+    masked = bsm_price_vec(100.0, K, 1.0, 0.05, 0.2, option_type=types == "call")
+    expected = [bsm_price(100.0, k, 1.0, 0.05, 0.2, option_type=t) for k, t in zip(K, types)]
+    assert np.allclose(prices, expected)
+    assert np.allclose(masked, expected)
+
+
+def test_bsm_price_vec_degenerate_entries():
+    sigma = np.array([0.0, 0.2, 0.2])
+    T = np.array([1.0, 0.0, 1.0])
+    for opt_type in ["call", "put"]:
+        prices = bsm_price_vec(100.0, 95.0, T, 0.05, sigma, option_type=opt_type)
+        expected = [bsm_price(100.0, 95.0, t, 0.05, s, option_type=opt_type)
+                    for t, s in zip(T, sigma)]
+        assert np.all(np.isfinite(prices))
+        assert np.allclose(prices, expected)
+
+
+def test_bsm_price_vec_scalar_and_invalid_type():
+    price = bsm_price_vec(100.0, 100.0, 1.0, 0.05, 0.2)
+    assert isinstance(price, float)
+    assert price == pytest.approx(bsm_price(100.0, 100.0, 1.0, 0.05, 0.2))
+    with pytest.raises(ValueError):
+        bsm_price_vec(100.0, 100.0, 1.0, 0.05, 0.2, option_type="straddle")
+
+
+def test_bsm_greeks_vec_match_finite_differences():
+    S0, r, q = 100.0, 0.03, 0.01
+    K = np.array([80.0, 100.0, 120.0])[:, None]
+    T = np.array([0.25, 1.0])
+    sigma = 0.3
+    for opt_type in ["call", "put"]:
+        greeks = bsm_greeks_vec(S0, K, T, r, sigma, q, opt_type)
+
+        def price(s=S0, t=T, rate=r, vol=sigma):
+            return bsm_price_vec(s, K, t, rate, vol, q, opt_type)
+
+        h = 1e-4
+        assert np.allclose(greeks["delta"], (price(s=S0 + h) - price(s=S0 - h)) / (2 * h), atol=1e-7)
+        assert np.allclose(greeks["gamma"], (price(s=S0 + 0.01) - 2 * price() + price(s=S0 - 0.01)) / 1e-4,
+                           atol=1e-6)
+        assert np.allclose(greeks["vega"], (price(vol=sigma + h) - price(vol=sigma - h)) / (2 * h), atol=1e-6)
+        assert np.allclose(greeks["rho"], (price(rate=r + h) - price(rate=r - h)) / (2 * h), atol=1e-6)
+        assert np.allclose(greeks["theta"], -(price(t=T + h) - price(t=T - h)) / (2 * h), atol=1e-5)
+
+
+def test_bsm_greeks_vec_degenerate_and_scalar():
+    greeks = bsm_greeks_vec(100.0, 90.0, 1.0, 0.05, 0.0)
+    assert isinstance(greeks["delta"], float)
+    assert greeks["delta"] == pytest.approx(1.0)
+    assert greeks["gamma"] == 0.0 and greeks["vega"] == 0.0
+    assert greeks["rho"] == pytest.approx(90.0 * np.exp(-0.05))
+
+
+def test_implied_vol_vec_round_trip():
+    rng = np.random.Generator(np.random.PCG64(0))
+    n = 2000
+    K = rng.uniform(70.0, 140.0, n)
+    T = rng.uniform(0.05, 3.0, n)
+    sigma = rng.uniform(0.05, 1.0, n)
+    types = np.where(rng.random(n) < 0.5, "call", "put")
+    prices = bsm_price_vec(100.0, K, T, 0.03, sigma, 0.01, types)
+    iv = implied_vol_vec(prices, 100.0, K, T, 0.03, 0.01, types)
+    # identifiable quotes recover sigma; all recover the price
+    identifiable = bsm_greeks_vec(100.0, K, T, 0.03, sigma, 0.01, types)["vega"] > 1e-3
+    assert np.allclose(iv[identifiable], sigma[identifiable], atol=1e-8)
+    assert np.allclose(bsm_price_vec(100.0, K, T, 0.03, iv, 0.01, types), prices, atol=1e-9)
+
+
+def test_implied_vol_vec_arbitrage_bounds():
+    iv = implied_vol_vec([5.0, 0.5, 120.0, 10.0], 100.0, 95.0, [1.0, 1.0, 1.0, 0.0], 0.0)
+    assert np.isnan(iv[[1, 2, 3]]).all()
+    assert iv[0] == pytest.approx(implied_vol_vec(5.0, 100.0, 95.0, 1.0, 0.0))
+    assert bsm_price(100.0, 95.0, 1.0, 0.0, iv[0]) == pytest.approx(5.0)
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from mcdxa.bates import bates_price
+from mcdxa.bsm import implied_vol_vec
+from mcdxa.calibration import calibrate, calibrate_bates, calibrate_heston, maturity_prices
+from mcdxa.heston import heston_price
+
+S0, r, q = 100.0, 0.02, 0.01
+K, T = np.broadcast_arrays(np.linspace(70.0, 130.0, 9), np.array([0.1, 0.5, 1.0, 2.0])[:, None])
+TYPES = np.where(K < S0, "put", "call")
+HESTON = dict(kappa=1.8, theta=0.05, xi=0.6, rho=-0.7, v0=0.03)
+BATES = dict(HESTON, lam=0.4, mu_j=-0.15, sigma_j=0.2)
+
+
+@pytest.mark.parametrize("model, params", [("heston", HESTON), ("bates", BATES)])
+def test_maturity_prices_jacobian(model, params):
+    x = np.array(list(params.values()))
+    price = heston_price if model == "heston" else bates_price
+    call, jac = maturity_prices(model, x, S0, K[1], 0.5, r, q)
+    assert np.allclose(call, price(S0, K[1], 0.5, r, **params, q=q), atol=1e-10)
+    for i in range(len(x)):
+        h = 1e-5
+        up, down = x.copy(), x.copy()
+        up[i] += h
+        down[i] -= h
+        fd = (maturity_prices(model, up, S0, K[1], 0.5, r, q)[0]
+              - maturity_prices(model, down, S0, K[1], 0.5, r, q)[0]) / (2 * h)
+        assert np.allclose(jac[:, i], fd, atol=1e-5)
+
+
+def test_calibrate_heston_recovers_parameters():
+    iv = implied_vol_vec(heston_price(S0, K, T, r, **HESTON, q=q, option_type=TYPES),
+                         S0, K, T, r, q, TYPES)
+    params, result = calibrate_heston(S0, K, T, r, iv, q=q, option_type=TYPES)
+    assert result.success
+    assert np.abs(result.fun).max() < 1e-5
+    for name, value in HESTON.items():
+        assert params[name] == pytest.approx(value, rel=1e-3)
+
+    threaded, _ = calibrate_heston(S0, K, T, r, iv, q=q, option_type=TYPES,
+                                   n_workers=2, backend="thread")
+    assert threaded == params
+
+
+def test_calibrate_bates_recovers_parameters():
+    iv = implied_vol_vec(bates_price(S0, K, T, r, **BATES, q=q), S0, K, T, r, q)
+    params, result = calibrate_bates(S0, K, T, r, iv, q=q)
+    assert np.abs(result.fun).max() < 1e-5
+    for name, value in BATES.items():
+        assert params[name] == pytest.approx(value, rel=1e-2, abs=1e-3)
+
+
+def test_calibrate_invalid_model():
+    with pytest.raises(ValueError):
+        calibrate("sabr", S0, K, T, r, 0.2)
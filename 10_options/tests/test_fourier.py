@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from mcdxa.bsm import bsm_price_vec
+from mcdxa.fourier import (
+    heston_char_func, bates_char_func, lewis_price,
+    carr_madan_grid, carr_madan_price, cos_price, CFCache, CF_CACHE,
+)
+from mcdxa.analytics import heston_price, merton_price, bates_price
+
+HESTON = dict(kappa=2.0, theta=0.04, xi=0.3, rho=-0.7, v0=0.03)
+
+
+def test_merton_without_jumps_matches_bsm_chain():
+    K = np.linspace(60.0, 140.0, 41)
+    for opt_type in ["call", "put"]:
+        prices = merton_price(100.0, K, 0.75, 0.03, 0.25, q=0.01, option_type=opt_type)
+        expected = bsm_price_vec(100.0, K, 0.75, 0.03, 0.25, q=0.01, option_type=opt_type)
+        assert np.allclose(prices, expected, atol=1e-8)
+
+
+def test_heston_chain_matches_per_strike_calls():
+    K = np.linspace(70.0, 130.0, 13)
+    chain = heston_price(100.0, K, 1.0, 0.05, **HESTON)
+    single = [heston_price(100.0, k, 1.0, 0.05, **HESTON) for k in K]
+    assert chain.shape == K.shape
+    assert np.allclose(chain, single, rtol=1e-12)
+
+
+def test_lewis_price_shares_cf_per_maturity():
+    calls = []
+
+    def cf(u, t):
+        calls.append(t)
+        return heston_char_func(u, t, 0.05, **HESTON)
+
+    K = np.array([90.0, 100.0, 110.0, 90.0, 100.0, 110.0])
+    T = np.array([0.5, 0.5, 0.5, 1.0, 1.0, 1.0])
+    prices = lewis_price(cf, 100.0, K, T, 0.05)
+    assert sorted(calls) == [0.5, 1.0]
+    expected = [heston_price(100.0, k, t, 0.05, **HESTON) for k, t in zip(K, T)]
+    assert np.allclose(prices, expected, rtol=1e-12)
+
+
+def test_bates_chain_put_call_parity():
+    K = np.linspace(80.0, 120.0, 5)
+    params = dict(HESTON, lam=0.2, mu_j=-0.05, sigma_j=0.15)
+    call = bates_price(100.0, K, 1.0, 0.03, **params, option_type="call")
+    put = bates_price(100.0, K, 1.0, 0.03, **params, option_type="put")
+    assert np.allclose(call - put, 100.0 - K * np.exp(-0.03))
+
+
+def test_invalid_option_type():
+    with pytest.raises(ValueError):
+        heston_price(100.0, 100.0, 1.0, 0.05, **HESTON, option_type="digital")
+
+
+@pytest.mark.parametrize("pricer", [carr_madan_price, cos_price])
+@pytest.mark.parametrize("opt_type", ["call", "put"])
+def test_chain_pricers_match_lewis(pricer, opt_type):
+    params = dict(HESTON, lam=0.3, mu_j=-0.1, sigma_j=0.2)
+    K = np.linspace(60.0, 150.0, 31)
+    T = np.repeat([0.25, 1.0], 31)
+    K = np.tile(K, 2)
+
+    def cf(u, t):
+        return bates_char_func(u, t, 0.03, **params, q=0.01)
+
+    expected = lewis_price(cf, 100.0, K, T, 0.03, q=0.01, option_type=opt_type)
+    prices = pricer(cf, 100.0, K, T, 0.03, q=0.01, option_type=opt_type)
+    assert np.allclose(prices, expected, atol=1e-5)
+
+
+def test_carr_madan_grid_is_centred_log_moneyness():
+    k, calls = carr_madan_grid(
+        lambda u, t: heston_char_func(u, t, 0.05, **HESTON), 1.0, 0.05, n_fft=1024)
+    assert k.shape == calls.shape == (1024,)
+    atm = np.argmin(np.abs(k))
+    assert k[atm] == pytest.approx(0.0)
+    assert calls[atm] * 100.0 == pytest.approx(heston_price(100.0, 100.0, 1.0, 0.05, **HESTON), abs=1e-4)
+
+
+def test_cf_cache_hits_on_strike_and_spot_bumps():
+    CF_CACHE.clear()
+    params = dict(HESTON)
+    base = heston_price(100.0, [90.0, 100.0], [0.5, 1.0], 0.02, **params)
+    assert CF_CACHE.info()["misses"] == 2
+    heston_price(100.0, 110.0, 0.5, 0.02, **params)
+    bumped = heston_price(101.0, [90.0, 100.0], [0.5, 1.0], 0.02, **params)
+    info = CF_CACHE.info()
+    assert (info["hits"], info["misses"], info["size"]) == (3, 2, 2)
+    assert not np.allclose(bumped, base)
+    # a parameter bump is a different characteristic function
+    heston_price(100.0, 100.0, 0.5, 0.02, **dict(params, v0=params["v0"] * 1.01))
+    assert CF_CACHE.info()["misses"] == 3
+
+
+def test_cf_cache_eviction_and_identical_prices():
+    cache = CFCache(maxsize=2)
+    for key in ["a", "b", "a", "c"]:
+        value = cache.get(key, lambda: np.arange(3.0))
+    assert not value.flags.writeable
+    assert cache.info() == {"hits": 1, "misses": 3, "evictions": 1, "size": 2, "maxsize": 2}
+    cache.get("b", lambda: np.zeros(1))
+    assert cache.misses == 4
+
+    CF_CACHE.clear()
+    cf = lambda u, t: heston_char_func(u, t, 0.02, **HESTON)
+    cached = lewis_price(cf, 100.0, 95.0, 1.0, 0.02, cache_key="h")
+    assert lewis_price(cf, 100.0, 95.0, 1.0, 0.02, cache_key="h") == cached
+    assert lewis_price(cf, 100.0, 95.0, 1.0, 0.02) == cached
+    assert CF_CACHE.hits == 1
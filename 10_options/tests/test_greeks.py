@@ -0,0 +1,85 @@
+import math
+
+import numpy as np
+import pytest
+
+from mcdxa.greeks import mc_greeks
+from mcdxa.models import BSM, Merton, Heston
+from mcdxa.payoffs import CallPayoff, PutPayoff, CustomPayoff
+from mcdxa.pricers.european import EuropeanPricer
+
+S0, K, T, r = 100.0, 105.0, 1.0, 0.03
+
+
+def _central(f, x, h):
+    return (f(x + h) - f(x - h)) / (2 * h), (f(x + h) - 2 * f(x) + f(x - h)) / h ** 2
+
+
+def _reference(make_model, vol):
+    """Finite-difference Greeks of the model's analytic call price."""
+    def price(s0=S0, v=vol, rate=r):
+        return make_model(v, rate).vanilla_price(s0, K, T)
+    delta, gamma = _central(lambda s: price(s0=s), S0, 0.5)
+    vega, _ = _central(lambda v: price(v=v), vol, 1e-4)
+    rho, _ = _central(lambda x: price(rate=x), r, 1e-4)
+    return {"price": price(), "delta": delta, "gamma": gamma, "vega": vega, "rho": rho}
+
+
+MODELS = {
+    "bsm": (lambda v, rate: BSM(rate, v), 0.2, 1),
+    "merton": (lambda v, rate: Merton(rate, v, 1.0, -0.1, 0.15), 0.2, 1),
+    "heston": (lambda v, rate: Heston(rate, 1.5, 0.04, 0.3, -0.6, v ** 2), 0.2, 25),
+}
+
+
+@pytest.mark.parametrize("name", MODELS)
+@pytest.mark.parametrize("method", ["pathwise", "likelihood_ratio"])
+def test_mc_greeks_match_analytic(name, method):
+    make_model, vol, n_steps = MODELS[name]
+    greeks = mc_greeks(CallPayoff(K), make_model(vol, r), S0, T, r, 100_000, n_steps,
+                       rng=np.random.Generator(np.random.PCG64(4)), method=method)
+    reference = _reference(make_model, vol)
+    for greek, (value, stderr) in greeks.items():
+        assert value == pytest.approx(reference[greek], abs=4 * stderr + 1e-3), greek
+
+
+def test_likelihood_ratio_digital_delta():
+    model = BSM(r, 0.2)
+    digital = CustomPayoff(lambda s: (s > K).astype(float))
+    greeks = mc_greeks(digital, model, S0, T, r, 200_000,
+                       rng=np.random.Generator(np.random.PCG64(2)),
+                       method="likelihood_ratio")
+    d2 = (math.log(S0 / K) + (r - 0.5 * 0.2 ** 2) * T) / (0.2 * math.sqrt(T))
+    delta = math.exp(-r * T) * math.exp(-0.5 * d2 ** 2) / math.sqrt(2 * math.pi) / (S0 * 0.2)
+    value, stderr = greeks["delta"]
+    assert value == pytest.approx(delta, abs=4 * stderr)
+    with pytest.raises(ValueError):
+        mc_greeks(digital, model, S0, T, r, 100, method="pathwise")
+
+
+def test_european_pricer_greeks_put():
+    pricer = EuropeanPricer(BSM(r, 0.2), PutPayoff(K), n_paths=50_000, chunk_size=8_000)
+    pricer.rng = np.random.Generator(np.random.PCG64(1))
+    greeks = pricer.greeks(S0, T, r)
+    assert set(greeks) == {"price", "delta", "gamma", "vega", "rho"}
+    assert -1.0 < greeks["delta"][0] < 0.0
+    assert greeks["rho"][0] < 0.0 < greeks["vega"][0]
+    with pytest.raises(ValueError):
+        pricer.greeks(S0, T, r, method="bump")
+
+
+def test_mc_greeks_antithetic_pairs_and_invalid_models():
+    plain = mc_greeks(CallPayoff(K), BSM(r, 0.2), S0, T, r, 50_000,
+                      rng=np.random.Generator(np.random.PCG64(6)))
+    paired = mc_greeks(CallPayoff(K), BSM(r, 0.2, antithetic=True), S0, T, r, 50_000,
+                       rng=np.random.Generator(np.random.PCG64(6)))
+    reference = _reference(MODELS["bsm"][0], 0.2)
+    for greek, (value, stderr) in paired.items():
+        assert value == pytest.approx(reference[greek], abs=4 * stderr + 1e-3), greek
+    # pair averages: the delta stderr reflects the variance reduction
+    assert paired["delta"][1] < plain["delta"][1]
+    with pytest.raises(ValueError, match="qmc"):
+        mc_greeks(CallPayoff(K), BSM(r, 0.2, qmc=True), S0, T, r, 1024)
+    for model in (Heston(r, 1.5, 0.04, 0.3, -0.6, 0.0), Heston(r, 1.5, 0.04, 0.3, 1.0, 0.04)):
+        with pytest.raises(ValueError, match="v0 > 0"):
+            mc_greeks(CallPayoff(K), model, S0, T, r, 100, 10)
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from mcdxa.bsm import bsm_price_vec
+from mcdxa.merton import merton_price, merton_series_price, series_terms
+
+K = np.linspace(60.0, 140.0, 17)
+T = np.array([0.05, 0.5, 2.0])[:, None]
+
+
+@pytest.mark.parametrize("lam, mu_j, sigma_j", [(0.5, -0.1, 0.2), (3.0, 0.05, 0.1), (0.1, -0.5, 0.4)])
+@pytest.mark.parametrize("opt_type", ["call", "put"])
+def test_series_matches_lewis(lam, mu_j, sigma_j, opt_type):
+    args = (100.0, K, T, 0.03, 0.2, lam, mu_j, sigma_j, 0.01, opt_type)
+    series = merton_price(*args)
+    assert series.shape == (3, 17)
+    assert np.allclose(series, merton_price(*args, method="lewis"), atol=1e-7)
+
+
+def test_series_without_jumps_is_bsm():
+    prices = merton_series_price(100.0, K, T, 0.03, 0.2, 0.0, -0.1, 0.2, q=0.01, n_terms=5)
+    assert np.allclose(prices, bsm_price_vec(100.0, K, T, 0.03, 0.2, 0.01), atol=1e-13)
+    assert series_terms(0.0, -0.1, 0.2, 1.0) == 0
+
+
+def test_auto_falls_back_to_lewis_for_many_jumps():
+    args = (100.0, 100.0, 1.0, 0.03, 0.2, 80.0, -0.01, 0.02)
+    assert series_terms(80.0, -0.01, 0.02, 1.0) > 100
+    assert merton_price(*args) == merton_price(*args, method="lewis")
+    assert merton_price(*args, method="series") == pytest.approx(merton_price(*args), abs=1e-7)
+    with pytest.raises(ValueError):
+        merton_price(*args, method="quad")
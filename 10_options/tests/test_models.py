@@ -2,7 +2,9 @@ import numpy as np
 import math
 import pytest
 
-from mcdxa.models import BSM, Heston, Merton
+from mcdxa.kernels import numba_available
+from mcdxa.models import BSM, Heston, Merton, Bates
+from mcdxa.payoffs import RunningMax
 
 
 def test_bsm_deterministic_growth():
@@ -29,3 +31,239 @@ def test_mjd_jump_effect():
     # With zero jump size variance and mu_j=0, jumps yield Y=1, so S should equal S0
     assert paths.shape == (1000, 2)
     assert np.allclose(paths[:, -1], 1.0)
+
+
+@pytest.mark.parametrize("model, n_steps", [
+    (BSM(r=0.05, sigma=0.2), 4),
+    (Merton(r=0.05, sigma=0.2, lam=2.0, mu_j=-0.1, sigma_j=0.2), 4),
+    (Heston(r=0.03, kappa=1.5, theta=0.04, xi=0.3, rho=-0.6, v0=0.04), 6),
+    (Bates(r=0.03, kappa=1.5, theta=0.04, xi=0.3, rho=-0.6, v0=0.04,
+           lam=2.0, mu_j=-0.1, sigma_j=0.2), 6),
+])
+def test_simulate_chunks_matches_monolithic(model, n_steps):
+    def rng():
+        return np.random.Generator(np.random.PCG64(2024))
+
+    paths = model.simulate(100.0, 1.0, 103, n_steps, rng=rng())
+    blocks = list(model.simulate_chunks(100.0, 1.0, 103, n_steps, chunk_size=25, rng=rng()))
+    assert [len(b) for b in blocks] == [25, 25, 25, 25, 3]
+    assert np.array_equal(np.concatenate(blocks), paths)
+
+
+def test_simulate_chunks_invalid_chunk_size():
+    model = BSM(r=0.05, sigma=0.2)
+    with pytest.raises(ValueError):
+        next(model.simulate_chunks(100.0, 1.0, 10, 1, chunk_size=0))
+
+
+def test_simulate_terminal_heston_matches_path_end():
+    model = Heston(r=0.03, kappa=1.5, theta=0.04, xi=0.3, rho=-0.6, v0=0.04)
+    paths = model.simulate(100.0, 1.0, 50, 8, rng=np.random.Generator(np.random.PCG64(1)))
+    ST = model.simulate_terminal(100.0, 1.0, 50, 8, rng=np.random.Generator(np.random.PCG64(1)))
+    assert ST.shape == (50,)
+    assert np.array_equal(ST, paths[:, -1])
+
+
+@pytest.mark.parametrize("model", [
+    BSM(r=0.05, sigma=0.2, q=0.01),
+    Merton(r=0.05, sigma=0.2, lam=0.5, mu_j=-0.1, sigma_j=0.2, q=0.01),
+])
+def test_simulate_terminal_exact_martingale(model):
+    ST = model.simulate_terminal(100.0, 2.0, 200_000, n_steps=50,
+                                 rng=np.random.Generator(np.random.PCG64(5)))
+    forward = 100.0 * math.exp((0.05 - 0.01) * 2.0)
+    assert ST.mean() == pytest.approx(forward, abs=4 * ST.std() / math.sqrt(len(ST)))
+    chunks = model.simulate_chunks(100.0, 2.0, 200_000, 50, chunk_size=30_000,
+                                   rng=np.random.Generator(np.random.PCG64(5)),
+                                   store_path=False)
+    assert np.array_equal(np.concatenate(list(chunks)), ST)
+
+
+@pytest.mark.parametrize("model", [
+    BSM(r=0.05, sigma=0.2, antithetic=True),
+    Bates(r=0.03, kappa=1.5, theta=0.04, xi=0.3, rho=-0.6, v0=0.04,
+          lam=2.0, mu_j=-0.1, sigma_j=0.2, antithetic=True),
+])
+def test_antithetic_chunks_match_monolithic(model):
+    def rng():
+        return np.random.Generator(np.random.PCG64(11))
+
+    paths = model.simulate(100.0, 1.0, 40, 4, rng=rng())
+    blocks = model.simulate_chunks(100.0, 1.0, 40, 4, chunk_size=10, rng=rng())
+    assert np.array_equal(np.concatenate(list(blocks)), paths)
+    with pytest.raises(ValueError):
+        model.simulate(100.0, 1.0, 41, 4, rng=rng())
+
+
+def test_antithetic_bsm_paths_mirrored():
+    model = BSM(r=0.05, sigma=0.2, antithetic=True)
+    paths = model.simulate(100.0, 1.0, 10, 3, rng=np.random.Generator(np.random.PCG64(3)))
+    drift = (0.05 - 0.5 * 0.2 ** 2) / 3
+    log_inc = np.diff(np.log(paths), axis=1) - drift
+    assert np.allclose(log_inc[0::2], -log_inc[1::2])
+
+
+@pytest.mark.parametrize("model", [
+    BSM(r=0.05, sigma=0.2, dtype=np.float32),
+    Merton(r=0.05, sigma=0.2, lam=2.0, mu_j=-0.1, sigma_j=0.2, dtype=np.float32),
+    Heston(r=0.03, kappa=1.5, theta=0.04, xi=0.3, rho=-0.6, v0=0.04, dtype=np.float32),
+    Bates(r=0.03, kappa=1.5, theta=0.04, xi=0.3, rho=-0.6, v0=0.04,
+          lam=2.0, mu_j=-0.1, sigma_j=0.2, dtype=np.float32),
+])
+def test_float32_paths(model):
+    def rng():
+        return np.random.Generator(np.random.PCG64(8))
+
+    paths = model.simulate(100.0, 1.0, 60, 5, rng=rng())
+    assert paths.dtype == np.float32
+    blocks = model.simulate_chunks(100.0, 1.0, 60, 5, chunk_size=16, rng=rng())
+    assert np.array_equal(np.concatenate(list(blocks)), paths)
+    ST = model.simulate_terminal(100.0, 1.0, 200_000, 5, rng=rng())
+    assert ST.dtype == np.float32
+    call = math.exp(-model.r) * np.maximum(ST - 100.0, 0).mean()
+    assert call == pytest.approx(model.vanilla_price(100.0, 100.0, 1.0), abs=0.1)
+
+
+def test_heston_inplace_steps_match_euler_reference():
+    model = Heston(r=0.03, kappa=1.5, theta=0.04, xi=0.9, rho=-0.6, v0=0.04, q=0.01)
+    n, n_steps, dt = 500, 20, 1.0 / 20
+    paths = model.simulate(100.0, 1.0, n, n_steps, rng=np.random.Generator(np.random.PCG64(4)))
+    z = np.random.Generator(np.random.PCG64(4)).standard_normal((n, n_steps, 2))
+    S = np.full(n, 100.0)
+    v = np.full(n, 0.04)
+    for t in range(n_steps):
+        w2 = -0.6 * z[:, t, 0] + math.sqrt(1 - 0.36) * z[:, t, 1]
+        v_pos = np.maximum(v, 0)
+        S = S * np.exp((0.03 - 0.01 - 0.5 * v_pos) * dt + np.sqrt(v_pos * dt) * z[:, t, 0])
+        v = v + 1.5 * (0.04 - v) * dt + 0.9 * np.sqrt(v_pos * dt) * w2
+    assert np.allclose(paths[:, -1], S, rtol=1e-12)
+
+
+def test_invalid_dtype():
+    with pytest.raises(ValueError):
+        BSM(r=0.05, sigma=0.2, dtype=np.int64)
+
+
+@pytest.mark.parametrize("scheme", ["qe", "exact"])
+@pytest.mark.parametrize("model_cls, jumps", [
+    (Heston, {}),
+    (Bates, dict(lam=0.5, mu_j=-0.1, sigma_j=0.2)),
+])
+@pytest.mark.parametrize("xi", [0.3, 1.0])
+def test_few_step_schemes_match_fourier(scheme, model_cls, jumps, xi):
+    # xi = 1.0 violates the Feller condition (4 kappa theta / xi**2 < 1)
+    model = model_cls(r=0.03, kappa=1.5, theta=0.04, xi=xi, rho=-0.7, v0=0.04,
+                      scheme=scheme, **jumps)
+    ST = model.simulate_terminal(100.0, 1.0, 200_000, 4,
+                                 rng=np.random.Generator(np.random.PCG64(12)))
+    payoff = math.exp(-0.03) * np.maximum(ST - 100.0, 0)
+    stderr = payoff.std() / math.sqrt(len(payoff))
+    assert payoff.mean() == pytest.approx(model.vanilla_price(100.0, 100.0, 1.0),
+                                          abs=4 * stderr + 0.03)
+    assert ST.mean() == pytest.approx(100.0 * math.exp(0.03), rel=3e-3)
+
+
+@pytest.mark.parametrize("scheme", ["qe", "exact"])
+def test_schemes_chunks_antithetic_and_float32(scheme):
+    def rng():
+        return np.random.Generator(np.random.PCG64(6))
+
+    for xi in (0.3, 1.0):
+        model = Bates(r=0.03, kappa=1.5, theta=0.04, xi=xi, rho=-0.7, v0=0.04,
+                      lam=0.5, mu_j=-0.1, sigma_j=0.2, antithetic=True, scheme=scheme)
+        paths = model.simulate(100.0, 1.0, 40, 3, rng=rng())
+        assert np.all(np.isfinite(paths)) and np.all(paths > 0)
+        blocks = model.simulate_chunks(100.0, 1.0, 40, 3, chunk_size=12, rng=rng())
+        assert np.array_equal(np.concatenate(list(blocks)), paths)
+    model = Heston(r=0.03, kappa=1.5, theta=0.04, xi=0.3, rho=-0.7, v0=0.04,
+                   scheme=scheme, dtype=np.float32)
+    assert model.simulate(100.0, 1.0, 10, 3, rng=rng()).dtype == np.float32
+
+
+def test_qe_without_martingale_correction_stays_finite():
+    # large xi, rho > 0 and long steps: 2 A a >= 1 on some paths, where the
+    # martingale-corrected drift does not exist
+    model = Heston(r=0.0, kappa=1.0, theta=0.3, xi=1.0, rho=0.9, v0=0.3, scheme="qe")
+    dt = 20.0
+    K2 = 0.5 * dt * (model.kappa * model.rho / model.xi - 0.5) + model.rho / model.xi
+    A = K2 + 0.25 * dt * (1 - model.rho ** 2)
+    assert 2 * A * model.v0 > 1
+    with np.errstate(all="raise"):
+        ST = model.simulate_terminal(100.0, dt, 2_000, 1,
+                                     rng=np.random.Generator(np.random.PCG64(1)))
+    assert np.all(np.isfinite(ST)) and np.all(ST > 0)
+
+
+def test_invalid_scheme():
+    with pytest.raises(ValueError):
+        Heston(r=0.03, kappa=1.5, theta=0.04, xi=0.3, rho=-0.7, v0=0.04, scheme="milstein")
+
+
+def test_jump_log_draws_normals_only_for_jumps():
+    model = Merton(r=0.05, sigma=0.2, lam=1.0, mu_j=-0.1, sigma_j=0.2)
+    nj = np.random.Generator(np.random.PCG64(0)).poisson(0.05, size=(1000, 20))
+    jump_log = model._jump_log(np.random.Generator(np.random.PCG64(1)), nj)
+    z = np.random.Generator(np.random.PCG64(1)).standard_normal(np.count_nonzero(nj))
+    assert np.array_equal(jump_log == 0, nj == 0)
+    assert np.allclose(jump_log[nj > 0], nj[nj > 0] * -0.1 + np.sqrt(nj[nj > 0]) * 0.2 * z)
+
+
+@pytest.mark.parametrize("model", [
+    Merton(r=0.05, sigma=0.2, lam=2.0, mu_j=-0.1, sigma_j=0.2,
+           antithetic=True, presample_jumps=True),
+    Bates(r=0.03, kappa=1.5, theta=0.04, xi=0.3, rho=-0.6, v0=0.04, lam=2.0,
+          mu_j=-0.1, sigma_j=0.2, antithetic=True, scheme="exact", presample_jumps=True),
+])
+def test_presampled_jumps_chunks_and_pairs(model):
+    def rng():
+        return np.random.Generator(np.random.PCG64(9))
+
+    paths = model.simulate(100.0, 1.0, 60, 8, rng=rng())
+    blocks = model.simulate_chunks(100.0, 1.0, 60, 8, chunk_size=14, rng=rng())
+    assert np.array_equal(np.concatenate(list(blocks)), paths)
+    counts = model._jump_counts(model._streams(rng()), 0.01, (20_000, 100))
+    assert np.array_equal(counts[0::2], counts[1::2])
+    assert counts.mean() == pytest.approx(0.02, rel=0.05)
+    assert counts.sum(axis=1).var() == pytest.approx(2.0, rel=0.1)
+
+
+def test_presampled_jumps_price_merton():
+    model = Merton(r=0.05, sigma=0.2, lam=1.5, mu_j=-0.1, sigma_j=0.2, presample_jumps=True)
+    paths = model.simulate(100.0, 1.0, 100_000, 50, rng=np.random.Generator(np.random.PCG64(2)))
+    payoff = math.exp(-0.05) * np.maximum(paths[:, -1] - 100.0, 0)
+    stderr = payoff.std() / math.sqrt(len(payoff))
+    assert payoff.mean() == pytest.approx(model.vanilla_price(100.0, 100.0, 1.0), abs=4 * stderr)
+
+
+@pytest.mark.parametrize("model_cls, jumps", [
+    (Heston, {}),
+    (Bates, dict(lam=2.0, mu_j=-0.1, sigma_j=0.2, antithetic=True)),
+])
+def test_numba_backend_matches_numpy(model_cls, jumps):
+    pytest.importorskip("numba")
+
+    def rng():
+        return np.random.Generator(np.random.PCG64(13))
+
+    params = dict(r=0.03, kappa=1.5, theta=0.04, xi=0.9, rho=-0.7, v0=0.04, **jumps)
+    numpy_model = model_cls(**params)
+    numba_model = model_cls(**params, backend="numba")
+    paths = numpy_model.simulate(100.0, 1.0, 200, 12, rng=rng())
+    assert np.allclose(numba_model.simulate(100.0, 1.0, 200, 12, rng=rng()), paths, rtol=1e-12)
+    ST = numba_model.simulate_terminal(100.0, 1.0, 200, 12, rng=rng())
+    assert np.allclose(ST, paths[:, -1], rtol=1e-12)
+    blocks = numba_model.simulate_chunks(100.0, 1.0, 200, 12, chunk_size=64, rng=rng(),
+                                         statistics={"high": RunningMax()})
+    high = np.concatenate([values["high"] for _, values in blocks])
+    assert np.allclose(high, paths.max(axis=1), rtol=1e-12)
+    with pytest.raises(ValueError):
+        model_cls(**params, backend="numba", scheme="qe")
+
+
+def test_backend_validation():
+    params = dict(r=0.03, kappa=1.5, theta=0.04, xi=0.3, rho=-0.7, v0=0.04)
+    with pytest.raises(ValueError):
+        Heston(**params, backend="cython")
+    if not numba_available():
+        with pytest.raises(ImportError):
+            Heston(**params, backend="numba")
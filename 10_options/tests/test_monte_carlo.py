@@ -2,9 +2,9 @@
 import numpy as np
 import pytest
 
-from mcdxa.monte_carlo import price_mc
-from mcdxa.models import BSM
-from mcdxa.payoffs import CallPayoff
+from mcdxa.monte_carlo import price_mc, price_mc_adaptive, RunningStats
+from mcdxa.models import BSM, Heston
+from mcdxa.payoffs import CallPayoff, AsianCallPayoff
 
 
 def test_price_mc_zero_volatility():
@@ -25,3 +25,119 @@ def test_price_mc_in_the_money():
     # deterministic S=100, payoff=50, no discount
     assert stderr == 0.0
     assert price == pytest.approx(50.0)
+
+
+def test_running_stats_matches_numpy():
+    values = np.random.default_rng(7).normal(3.0, 2.0, size=1000)
+    stats = RunningStats()
+    for batch in np.array_split(values, 7):
+        stats.update(batch)
+    other = RunningStats().update(values[:300])
+    merged = other.merge(RunningStats().update(values[300:]))
+    for s in (stats, merged):
+        assert s.count == 1000
+        assert s.mean == pytest.approx(values.mean(), rel=1e-12)
+        assert s.variance == pytest.approx(values.var(ddof=1), rel=1e-12)
+        assert s.stderr == pytest.approx(values.std(ddof=1) / np.sqrt(1000), rel=1e-12)
+
+
+def test_price_mc_chunked_matches_monolithic():
+    model = Heston(r=0.03, kappa=1.5, theta=0.04, xi=0.3, rho=-0.6, v0=0.04)
+    payoff = CallPayoff(strike=100.0)
+    kwargs = dict(S0=100.0, T=1.0, r=0.03, n_paths=1001, n_steps=10)
+    full = price_mc(payoff, model, rng=np.random.Generator(np.random.PCG64(3)), **kwargs)
+    chunked = price_mc(payoff, model, rng=np.random.Generator(np.random.PCG64(3)),
+                       chunk_size=128, **kwargs)
+    assert chunked[0] == pytest.approx(full[0], rel=1e-12)
+    assert chunked[1] == pytest.approx(full[1], rel=1e-12)
+
+
+def test_price_mc_path_dependent_payoff_gets_full_paths():
+    # zero volatility: the Asian average is the mean of S0 * exp(r t) on the grid
+    model = BSM(r=0.05, sigma=0.0, q=0.0)
+    payoff = AsianCallPayoff(strike=100.0)
+    price, stderr = price_mc(payoff, model, S0=100.0, T=1.0, r=0.05, n_paths=10, n_steps=4)
+    average = (100.0 * np.exp(0.05 * np.linspace(0.0, 1.0, 5))).mean()
+    assert stderr == pytest.approx(0.0, abs=1e-12)
+    assert price == pytest.approx(np.exp(-0.05) * (average - 100.0))
+
+
+def test_price_mc_statistics_chunked_matches_monolithic():
+    model = BSM(r=0.05, sigma=0.25, q=0.0)
+    payoff = AsianCallPayoff(strike=100.0)
+    kwargs = dict(S0=100.0, T=1.0, r=0.05, n_paths=2000, n_steps=12)
+    full = price_mc(payoff, model, rng=np.random.Generator(np.random.PCG64(4)), **kwargs)
+    chunked = price_mc(payoff, model, rng=np.random.Generator(np.random.PCG64(4)),
+                       chunk_size=300, **kwargs)
+    paths = model.simulate(100.0, 1.0, 2000, 12, rng=np.random.Generator(np.random.PCG64(4)))
+    direct = np.exp(-0.05) * payoff(paths)
+    assert full[0] == pytest.approx(direct.mean(), rel=1e-12)
+    assert chunked[0] == pytest.approx(direct.mean(), rel=1e-12)
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_price_mc_parallel_reproducible(backend):
+    model = BSM(r=0.05, sigma=0.2, q=0.0)
+    payoff = CallPayoff(strike=100.0)
+    kwargs = dict(S0=100.0, T=1.0, r=0.05, n_paths=20_001, n_workers=3, backend=backend)
+    first = price_mc(payoff, model, rng=np.random.Generator(np.random.PCG64(11)), **kwargs)
+    second = price_mc(payoff, model, rng=np.random.Generator(np.random.PCG64(11)), **kwargs)
+    assert first == second
+    from mcdxa.analytics import bsm_price
+    assert first[0] == pytest.approx(bsm_price(100.0, 100.0, 1.0, 0.05, 0.2), abs=4 * first[1])
+
+
+def test_price_mc_parallel_merges_worker_shares():
+    # the merged estimate equals the pooled statistics of the workers' paths
+    model = BSM(r=0.05, sigma=0.2, q=0.0)
+    payoff = CallPayoff(strike=100.0)
+    price, stderr = price_mc(payoff, model, S0=100.0, T=1.0, r=0.05, n_paths=1001,
+                             rng=np.random.Generator(np.random.PCG64(8)),
+                             n_workers=2, backend="thread")
+    children = np.random.Generator(np.random.PCG64(8)).spawn(2)
+    pooled = np.concatenate([
+        np.exp(-0.05) * payoff(model.simulate_terminal(100.0, 1.0, n, rng=child))
+        for n, child in zip([501, 500], children)
+    ])
+    assert price == pytest.approx(pooled.mean(), rel=1e-12)
+    assert stderr == pytest.approx(pooled.std(ddof=1) / np.sqrt(1001), rel=1e-12)
+
+
+def test_price_mc_adaptive_stops_at_tolerance():
+    model = BSM(r=0.05, sigma=0.2)
+    rng = np.random.Generator(np.random.PCG64(13))
+    price, stderr, n_paths, elapsed = price_mc_adaptive(
+        CallPayoff(100.0), model, 100.0, 1.0, 0.05, abs_tol=0.05,
+        batch_size=5_000, rng=rng)
+    assert stderr <= 0.05
+    assert n_paths % 5_000 == 0 and n_paths < 100_000
+    assert elapsed > 0.0
+    assert price == pytest.approx(model.vanilla_price(100.0, 100.0, 1.0), abs=4 * stderr)
+
+    # a relative target needs more paths out of the money
+    runs = {}
+    for K in (100.0, 140.0, 200.0):
+        price, stderr, n_paths, _ = price_mc_adaptive(
+            CallPayoff(K), model, 100.0, 1.0, 0.05, rel_tol=0.05,
+            batch_size=5_000, max_paths=50_000, rng=rng)
+        assert n_paths <= 50_000
+        # either the stopping rule held or the path cap was hit
+        assert stderr <= 0.05 * price or n_paths == 50_000
+        runs[K] = stderr <= 0.05 * price, n_paths
+    assert runs[100.0][0] and runs[140.0][0]
+    assert runs[100.0][1] < runs[140.0][1] <= runs[200.0][1]
+
+
+def test_price_mc_adaptive_limits():
+    model = BSM(r=0.05, sigma=0.2)
+    rng = np.random.Generator(np.random.PCG64(14))
+    _, _, n_paths, _ = price_mc_adaptive(CallPayoff(100.0), model, 100.0, 1.0, 0.05,
+                                         abs_tol=1e-9, max_paths=12_000,
+                                         batch_size=5_000, rng=rng)
+    assert n_paths == 12_000
+    _, _, n_paths, _ = price_mc_adaptive(CallPayoff(100.0), model, 100.0, 1.0, 0.05,
+                                         abs_tol=1e-9, time_budget=0.0,
+                                         batch_size=1_000, rng=rng)
+    assert n_paths == 1_000
+    with pytest.raises(ValueError):
+        price_mc_adaptive(CallPayoff(100.0), BSM(0.05, 0.2, qmc=True), 100.0, 1.0, 0.05)
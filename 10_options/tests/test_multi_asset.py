@@ -0,0 +1,90 @@
+import math
+
+import numpy as np
+import pytest
+
+from mcdxa.bsm import bsm_price, norm_cdf
+from mcdxa.models import MultiAssetBSM
+from mcdxa.monte_carlo import price_mc
+from mcdxa.payoffs import BarrierPayoff, BasketPayoff, RainbowPayoff
+from mcdxa.pricers.european import EuropeanPricer
+from mcdxa.risk import RiskEngine
+
+
+def rng(seed=4):
+    return np.random.Generator(np.random.PCG64(seed))
+
+
+CORR = [[1.0, 0.5, 0.2], [0.5, 1.0, -0.3], [0.2, -0.3, 1.0]]
+
+
+def test_shapes_chunks_and_correlation():
+    model = MultiAssetBSM(r=0.05, sigma=[0.2, 0.3, 0.25], corr=CORR)
+    S0 = np.array([100.0, 50.0, 80.0])
+    paths = model.simulate(S0, 1.0, 50_000, 4, rng=rng())
+    assert paths.shape == (50_000, 5, 3)
+    assert np.array_equal(paths[:, 0], np.broadcast_to(S0, (50_000, 3)))
+    blocks = model.simulate_chunks(S0, 1.0, 50_000, 4, chunk_size=7_000, rng=rng())
+    assert np.array_equal(np.concatenate(list(blocks)), paths)
+    log_returns = np.diff(np.log(paths), axis=1).reshape(-1, 3)
+    assert np.allclose(np.corrcoef(log_returns.T), CORR, atol=0.01)
+    assert np.allclose(log_returns.std(axis=0), np.array([0.2, 0.3, 0.25]) / 2, rtol=0.01)
+    ST = model.simulate_terminal(S0, 1.0, 200_000, 4, rng=rng())
+    assert ST.shape == (200_000, 3)
+    assert np.allclose(ST.mean(axis=0), S0 * math.exp(0.05), rtol=5e-3)
+
+
+def test_one_asset_matches_bsm():
+    model = MultiAssetBSM(r=0.05, sigma=[0.2], corr=[[1.0]])
+    price, stderr = price_mc(BasketPayoff(100.0, [1.0], "put"), model, 100.0, 1.0, 0.05,
+                             200_000, rng=rng())
+    assert price == pytest.approx(bsm_price(100.0, 100.0, 1.0, 0.05, 0.2, option_type="put"),
+                                  abs=4 * stderr)
+
+
+def test_spread_option_matches_margrabe():
+    rho, s1, s2 = 0.4, 0.3, 0.2
+    model = MultiAssetBSM(r=0.05, sigma=[s1, s2], corr=[[1.0, rho], [rho, 1.0]],
+                          q=[0.01, 0.02], antithetic=True)
+    pricer = EuropeanPricer(model, BasketPayoff(0.0, [1.0, -1.0]), n_paths=200_000,
+                            n_steps=3, seed=1)
+    price, stderr = pricer.price(np.array([100.0, 95.0]), 1.0, 0.05)
+    vol = math.sqrt(s1 ** 2 + s2 ** 2 - 2 * rho * s1 * s2)
+    d1 = (math.log(100.0 / 95.0) + (0.02 - 0.01 + 0.5 * vol ** 2)) / vol
+    exact = (100.0 * math.exp(-0.01) * norm_cdf(d1)
+             - 95.0 * math.exp(-0.02) * norm_cdf(d1 - vol))
+    assert price == pytest.approx(exact, abs=4 * stderr)
+
+
+def test_rainbow_best_plus_worst_is_basket():
+    model = MultiAssetBSM(r=0.03, sigma=[0.2, 0.4], corr=[[1.0, 0.3], [0.3, 1.0]], qmc=True)
+    S0 = np.array([100.0, 100.0])
+    best, _ = price_mc(RainbowPayoff(0.0, "call", "best"), model, S0, 1.0, 0.03, 2 ** 14, rng=rng())
+    worst, _ = price_mc(RainbowPayoff(0.0, "call", "worst"), model, S0, 1.0, 0.03, 2 ** 14, rng=rng())
+    assert best + worst == pytest.approx(200.0, rel=2e-3)
+    paths = model.simulate(S0, 1.0, 8, 2, rng=rng())
+    payoff = RainbowPayoff(100.0, "put", "worst")
+    assert np.allclose(payoff(paths), np.maximum(100.0 - paths[:, -1].min(axis=1), 0))
+
+
+def test_risk_engine_needs_single_asset():
+    model = MultiAssetBSM(r=0.03, sigma=[0.2, 0.4], corr=[[1.0, 0.3], [0.3, 1.0]])
+    for payoff in (BasketPayoff(0.0, [1.0, -1.0]), RainbowPayoff(100.0, "call", "best")):
+        with pytest.raises(ValueError, match="single-asset"):
+            RiskEngine(model, payoff, 1_000, 4)
+
+
+def test_path_statistics_need_single_asset():
+    model = MultiAssetBSM(r=0.03, sigma=[0.2, 0.4], corr=[[1.0, 0.3], [0.3, 1.0]])
+    barrier = BarrierPayoff(100.0, 120.0, "call", direction="up")
+    with pytest.raises(ValueError, match="single-asset"):
+        model.simulate_statistics(100.0, 1.0, 1_000, 4, barrier.statistics)
+
+
+def test_invalid_inputs():
+    with pytest.raises(ValueError):
+        MultiAssetBSM(r=0.05, sigma=[0.2, 0.3], corr=[[1.0, 1.2], [1.2, 1.0]])
+    with pytest.raises(ValueError):
+        MultiAssetBSM(r=0.05, sigma=[0.2, 0.3], corr=[[1.0, 0.5], [0.4, 1.0]])
+    with pytest.raises(ValueError):
+        RainbowPayoff(100.0, rank="median")
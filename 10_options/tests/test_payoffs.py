@@ -5,7 +5,9 @@ from mcdxa.payoffs import (
     CallPayoff, PutPayoff,
     AsianCallPayoff, AsianPutPayoff,
     LookbackCallPayoff, LookbackPutPayoff,
+    BarrierPayoff,
 )
+from mcdxa.models import Heston
 
 
 @pytest.mark.parametrize("payoff_cls, spot, strike, expected", [
@@ -29,3 +31,30 @@ def test_path_payoff(payoff_cls, path, expected):
     payoff = payoff_cls(strike)
     result = payoff(path)
     assert np.allclose(result, expected)
+
+
+@pytest.mark.parametrize("payoff", [
+    AsianCallPayoff(100.0),
+    AsianPutPayoff(100.0, steps=[2, 4, 6, 8]),
+    LookbackCallPayoff(100.0),
+    LookbackPutPayoff(100.0),
+    BarrierPayoff(100.0, 90.0, "call", direction="down", knock="out"),
+    BarrierPayoff(100.0, 115.0, "put", direction="up", knock="in", steps=[4, -1]),
+])
+def test_running_statistics_match_full_paths(payoff):
+    model = Heston(r=0.03, kappa=1.5, theta=0.04, xi=0.3, rho=-0.6, v0=0.04)
+    paths = model.simulate(100.0, 1.0, 500, 8, rng=np.random.Generator(np.random.PCG64(9)))
+    ST, values = model.simulate_statistics(100.0, 1.0, 500, 8, payoff.statistics,
+                                           rng=np.random.Generator(np.random.PCG64(9)))
+    assert np.array_equal(ST, paths[:, -1])
+    assert np.allclose(payoff.from_statistics(ST, values), payoff(paths))
+
+
+def test_barrier_payoff_on_paths():
+    paths = np.array([[100, 85, 120], [100, 105, 120], [100, 95, 80]])
+    down_out_call = BarrierPayoff(100, 90, "call", direction="down", knock="out")
+    down_in_put = BarrierPayoff(100, 90, "put", direction="down", knock="in")
+    assert np.allclose(down_out_call(paths), [0, 20, 0])
+    assert np.allclose(down_in_put(paths), [0, 0, 20])
+    with pytest.raises(ValueError):
+        BarrierPayoff(100, 90, knock="sideways")
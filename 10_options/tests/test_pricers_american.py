@@ -3,7 +3,9 @@ import numpy as np
 
 from mcdxa.models import BSM
 from mcdxa.payoffs import CallPayoff, PutPayoff
-from mcdxa.pricers.american import AmericanBinomialPricer, LongstaffSchwartzPricer
+from mcdxa.pricers.american import (
+    AmericanBinomialPricer, LongstaffSchwartzPricer, ExercisePolicy, binomial_price_batch,
+)
 from mcdxa.payoffs import CustomPayoff
 
 
@@ -57,3 +59,101 @@ def test_lsm_custom_put_no_volatility_exercise():
     # Zero vol: always exercise immediately, price equals intrinsic
     assert stderr == pytest.approx(0.0)
     assert price == pytest.approx(K - S0)
+
+
+def test_lsm_parallel_simulation_reproducible():
+    model = BSM(r=0.05, sigma=0.2, q=0.0)
+    payoff = PutPayoff(100.0)
+    results = []
+    for _ in range(2):
+        pricer = LongstaffSchwartzPricer(model, payoff, n_paths=4000, n_steps=10,
+                                         n_workers=2, backend="thread")
+        pricer.rng = np.random.Generator(np.random.PCG64(21))
+        results.append(pricer.price(100.0, 1.0, r=0.05))
+    assert results[0] == results[1]
+    assert results[0][0] > 0.0
+
+
+def _crr_reference(S0, K, T, r, sigma, n):
+    """Node-by-node CRR backward induction for an American put."""
+    dt = T / n
+    u = np.exp(sigma * np.sqrt(dt))
+    d = 1 / u
+    p = (np.exp(r * dt) - d) / (u - d)
+    values = [max(K - S0 * u ** (n - j) * d ** j, 0.0) for j in range(n + 1)]
+    for i in range(n - 1, -1, -1):
+        for j in range(i + 1):
+            cont = np.exp(-r * dt) * (p * values[j] + (1 - p) * values[j + 1])
+            values[j] = max(K - S0 * u ** (i - j) * d ** j, cont)
+    return values[0]
+
+
+@pytest.mark.parametrize("S0", [80.0, 100.0, 120.0])
+def test_crr_vectorized_matches_reference(S0):
+    model = BSM(r=0.05, sigma=0.25)
+    pricer = AmericanBinomialPricer(model, PutPayoff(100.0), n_steps=150)
+    assert pricer.price(S0, 1.0, r=0.05) == pytest.approx(
+        _crr_reference(S0, 100.0, 1.0, 0.05, 0.25, 150), rel=1e-10)
+
+
+def test_crr_large_tree_converges():
+    # American put benchmark (S0=36, K=40, T=1, r=0.06, sigma=0.2): 4.4867
+    pricer = AmericanBinomialPricer(BSM(r=0.06, sigma=0.2), PutPayoff(40.0), n_steps=5000)
+    assert pricer.price(36.0, 1.0, r=0.06) == pytest.approx(4.4867, abs=1e-3)
+
+
+def test_crr_price_batch_matches_single_prices():
+    model = BSM(r=0.05, sigma=0.25, q=0.02)
+    S0 = np.array([90.0, 100.0, 110.0, 100.0, 100.0])
+    K = np.array([100.0, 100.0, 100.0, 95.0, 105.0])
+    T = np.array([0.5, 1.0, 0.5, 1.0, 0.0])
+    types = np.array(["put", "call", "call", "put", "put"])
+    batch = binomial_price_batch(model, S0, K, T, 0.05, types, n_steps=200)
+    for i in range(len(S0)):
+        payoff = CallPayoff(K[i]) if types[i] == "call" else PutPayoff(K[i])
+        single = AmericanBinomialPricer(model, payoff, n_steps=200).price(S0[i], T[i], 0.05)
+        assert batch[i] == pytest.approx(single, rel=1e-12)
+
+
+def test_crr_price_batch_scalar_inputs():
+    model = BSM(r=0.05, sigma=0.25, q=0.02)
+    batch = binomial_price_batch(model, 100.0, 105.0, 1.0, 0.05, "put", n_steps=200)
+    single = AmericanBinomialPricer(model, PutPayoff(105.0), n_steps=200).price(100.0, 1.0, 0.05)
+    assert np.ndim(batch) == 0
+    assert batch == pytest.approx(single, rel=1e-12)
+    assert binomial_price_batch(model, 100.0, 95.0, 0.0, 0.05, "call") == 5.0
+
+
+@pytest.mark.parametrize("basis", ["monomial", "laguerre", "hermite"])
+def test_lsm_put_benchmark_bases(basis):
+    # Longstaff-Schwartz (2001) put: S0=36, K=40, T=1, r=0.06, sigma=0.2
+    pricer = LongstaffSchwartzPricer(BSM(r=0.06, sigma=0.2), PutPayoff(40.0),
+                                     n_paths=50_000, n_steps=50, basis=basis, degree=3)
+    pricer.rng = np.random.Generator(np.random.PCG64(8))
+    price, stderr = pricer.price(36.0, 1.0, r=0.06)
+    assert price == pytest.approx(4.4867, abs=4 * stderr + 0.02)
+
+
+def test_lsm_fitted_policy_out_of_sample():
+    model = BSM(r=0.06, sigma=0.2)
+    pricer = LongstaffSchwartzPricer(model, PutPayoff(40.0), n_paths=40_000,
+                                     n_steps=50, degree=3, chunk_size=7_000)
+    pricer.rng = np.random.Generator(np.random.PCG64(5))
+    policy = pricer.fit(36.0, 1.0, r=0.06)
+    assert isinstance(policy, ExercisePolicy)
+    assert set(policy.rules) <= set(range(1, 50))
+
+    def price(S0, chunk_size):
+        pricer.chunk_size = chunk_size
+        pricer.rng = np.random.Generator(np.random.PCG64(6))
+        return pricer.price(S0, 1.0, r=0.06, policy=policy)
+
+    price_oos, stderr = price(36.0, 7_000)
+    assert price_oos == pytest.approx(4.4867, abs=4 * stderr + 0.02)
+    assert price(36.0, None) == pytest.approx((price_oos, stderr), rel=1e-12)
+    # the same policy reprices bumped spots without refitting
+    assert price(35.0, 7_000)[0] > price_oos > price(37.0, 7_000)[0]
+
+    pricer.n_steps = 25
+    with pytest.raises(ValueError):
+        pricer.price(36.0, 1.0, r=0.06, policy=policy)
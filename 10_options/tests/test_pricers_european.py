@@ -1,7 +1,7 @@
 import pytest
 import numpy as np
-from mcdxa.models import BSM
-from mcdxa.payoffs import CallPayoff, PutPayoff, CustomPayoff
+from mcdxa.models import BSM, Heston
+from mcdxa.payoffs import CallPayoff, PutPayoff, CustomPayoff, AsianCallPayoff
 from mcdxa.pricers.european import EuropeanPricer
 from mcdxa.analytics import bsm_price
 
@@ -42,3 +42,50 @@ def test_european_pricer_custom_plain_vanilla(opt_type, S0, K):
     price_bs = bsm_price(S0, K, T, r, sigma, option_type=opt_type)
     assert stderr == pytest.approx(0.0)
     assert price_mc == pytest.approx(price_bs)
+
+
+@pytest.mark.parametrize("model", [
+    BSM(r=0.05, sigma=0.2),
+    Heston(r=0.05, kappa=1.5, theta=0.04, xi=0.3, rho=-0.6, v0=0.04),
+])
+def test_european_pricer_antithetic(model):
+    S0, K, T, r = 100.0, 105.0, 1.0, 0.05
+    exact = model.vanilla_price(S0, K, T, "put")
+    _, plain_err = EuropeanPricer(model, PutPayoff(K), n_paths=20_000,
+                                  n_steps=20, seed=1).price(S0, T, r)
+    model.antithetic = True
+    price, stderr = EuropeanPricer(model, PutPayoff(K), n_paths=20_000,
+                                   n_steps=20, seed=1).price(S0, T, r)
+    model.antithetic = False
+    assert stderr < plain_err
+    assert price == pytest.approx(exact, abs=4 * stderr)
+
+
+@pytest.mark.parametrize("model", [
+    BSM(r=0.05, sigma=0.2),
+    Heston(r=0.05, kappa=1.5, theta=0.04, xi=0.3, rho=-0.6, v0=0.04),
+])
+def test_european_pricer_control_variate(model):
+    S0, K, T, r = 100.0, 100.0, 1.0, 0.05
+    # the vanilla call itself is priced exactly
+    price, stderr = EuropeanPricer(model, CallPayoff(K), n_paths=5_000,
+                                   n_steps=20, seed=1, control_variate=True).price(S0, T, r)
+    assert stderr == pytest.approx(0.0, abs=1e-10)
+    assert price == pytest.approx(model.vanilla_price(S0, K, T), rel=1e-10)
+
+    payoff = AsianCallPayoff(K)
+    plain_price, plain_err = EuropeanPricer(model, payoff, n_paths=20_000,
+                                            n_steps=20, seed=1).price(S0, T, r)
+    cv_price, cv_err = EuropeanPricer(model, payoff, n_paths=20_000, n_steps=20,
+                                      seed=2, control_variate=True).price(S0, T, r)
+    assert cv_err < plain_err / 1.5
+    assert cv_price == pytest.approx(plain_price, abs=4 * plain_err)
+
+
+def test_european_pricer_price_adaptive():
+    model = BSM(0.05, 0.2)
+    pricer = EuropeanPricer(model, PutPayoff(100.0), n_paths=200_000, chunk_size=10_000)
+    pricer.rng = np.random.Generator(np.random.PCG64(3))
+    price, stderr, n_paths, _ = pricer.price_adaptive(100.0, 1.0, 0.05, rel_tol=5e-3)
+    assert stderr <= 5e-3 * price
+    assert 10_000 <= n_paths < 200_000
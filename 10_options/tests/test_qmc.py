@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from mcdxa.qmc import bridge_schedule, brownian_bridge, SobolNormals
+from mcdxa.models import BSM, Heston
+from mcdxa.monte_carlo import price_mc
+from mcdxa.payoffs import CallPayoff, AsianCallPayoff
+
+
+@pytest.mark.parametrize("n_steps", [1, 5, 8])
+def test_bridge_schedule_covers_grid(n_steps):
+    indices = [point[0] for point in bridge_schedule(n_steps)]
+    assert indices[0] == n_steps
+    assert sorted(indices) == list(range(1, n_steps + 1))
+
+
+def test_brownian_bridge_increments_standard():
+    z = np.random.Generator(np.random.PCG64(0)).standard_normal((200_000, 6))
+    dW = brownian_bridge(z)
+    assert np.allclose(np.cov(dW, rowvar=False), np.eye(6), atol=0.02)
+    # the first input alone determines the terminal value
+    assert np.allclose(dW.sum(axis=1), np.sqrt(6) * z[:, 0])
+
+
+def test_sobol_normals_blocks_match_single_draw():
+    def stream():
+        return SobolNormals(np.random.Generator(np.random.PCG64(4)))
+
+    z = stream().normals((64, 4, 2))
+    s = stream()
+    blocks = np.concatenate([s.normals((16, 4, 2)), s.normals((48, 4, 2))])
+    assert np.array_equal(blocks, z)
+    with pytest.raises(ValueError):
+        s.normals((8, 3))
+
+
+def test_qmc_chunks_match_monolithic():
+    model = Heston(r=0.03, kappa=1.5, theta=0.04, xi=0.3, rho=-0.6, v0=0.04, qmc=True)
+    paths = model.simulate(100.0, 1.0, 64, 8, rng=np.random.Generator(np.random.PCG64(2)))
+    chunks = model.simulate_chunks(100.0, 1.0, 64, 8, chunk_size=20,
+                                   rng=np.random.Generator(np.random.PCG64(2)))
+    assert np.array_equal(np.concatenate(list(chunks)), paths)
+
+
+@pytest.mark.parametrize("payoff, n_steps", [
+    (CallPayoff(100.0), 1),
+    (AsianCallPayoff(100.0), 16),
+])
+def test_qmc_price_mc_beats_plain_mc(payoff, n_steps):
+    def price(qmc):
+        return price_mc(payoff, BSM(r=0.05, sigma=0.2, qmc=qmc), 100.0, 1.0, 0.05,
+                        n_paths=16 * 1024, n_steps=n_steps,
+                        rng=np.random.Generator(np.random.PCG64(9)))
+
+    mc_price, mc_err = price(False)
+    qmc_price, qmc_err = price(True)
+    assert qmc_err < mc_err / 10
+    assert qmc_price == pytest.approx(mc_price, abs=4 * mc_err)
+
+
+def test_qmc_price_mc_matches_analytic_and_checks_replications():
+    model = BSM(r=0.05, sigma=0.2, qmc=True)
+    price, stderr = price_mc(CallPayoff(100.0), model, 100.0, 1.0, 0.05,
+                             n_paths=8 * 1024, n_replications=8,
+                             rng=np.random.Generator(np.random.PCG64(1)))
+    assert price == pytest.approx(model.vanilla_price(100.0, 100.0, 1.0), abs=5 * stderr + 1e-4)
+    with pytest.raises(ValueError):
+        price_mc(CallPayoff(100.0), model, 100.0, 1.0, 0.05, n_paths=1000,
+                 n_replications=16)
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from mcdxa.regression import design_matrix, least_squares
+
+
+def test_design_matrix_known_polynomials():
+    x = np.array([-1.0, 0.0, 0.5, 2.0])
+    assert np.allclose(design_matrix(x, "monomial", 3), np.vander(x, 4, increasing=True))
+    laguerre = design_matrix(x, "laguerre", 2)
+    assert np.allclose(laguerre[:, 2], 0.5 * (x ** 2 - 4 * x + 2))
+    hermite = design_matrix(x, "hermite", 3)
+    assert np.allclose(hermite[:, 3], x ** 3 - 3 * x)
+    with pytest.raises(ValueError):
+        design_matrix(x, "chebyshev")
+
+
+@pytest.mark.parametrize("basis", ["monomial", "laguerre", "hermite"])
+def test_least_squares_fit_independent_of_basis(basis):
+    rng = np.random.Generator(np.random.PCG64(3))
+    x = rng.standard_normal(500)
+    y = 1.0 + 2.0 * x - 0.5 * x ** 2 + 0.1 * rng.standard_normal(500)
+    A = design_matrix(x, basis, 2)
+    fitted = A @ least_squares(A, y)
+    reference = np.polyval(np.polyfit(x, y, 2), x)
+    assert np.allclose(fitted, reference, atol=1e-10)
+
+
+def test_least_squares_singular_falls_back():
+    A = design_matrix(np.full(10, 3.0), "monomial", 2)
+    coeffs = least_squares(A, np.full(10, 2.0))
+    assert np.allclose(A @ coeffs, 2.0)
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from mcdxa.bsm import bsm_greeks_vec, bsm_price
+from mcdxa.models import BSM, Heston, Merton
+from mcdxa.monte_carlo import price_mc
+from mcdxa.payoffs import BarrierPayoff, CallPayoff, PutPayoff
+from mcdxa.pricers.european import EuropeanPricer
+from mcdxa.risk import RiskEngine
+
+
+def rng(seed=7):
+    return np.random.Generator(np.random.PCG64(seed))
+
+
+def test_spot_ladder_smooth_and_unbiased():
+    engine = RiskEngine(BSM(r=0.05, sigma=0.2), CallPayoff(100.0), 100_000, rng=rng())
+    spots = np.linspace(80.0, 120.0, 41)
+    prices, stderr = engine.scenarios(spots, 1.0, 0.05)
+    assert prices.shape == stderr.shape == (41,)
+    assert np.all(np.diff(prices) > 0) and np.all(np.diff(prices, 2) > -1e-9)
+    exact = np.array([bsm_price(S, 100.0, 1.0, 0.05, 0.2) for S in spots])
+    assert np.all(np.abs(prices - exact) < 4 * stderr)
+
+
+def test_finite_difference_vega_matches_analytic():
+    engine = RiskEngine(BSM(r=0.05, sigma=0.2), CallPayoff(100.0), 200_000, rng=rng())
+    prices, _ = engine.scenarios(100.0, 1.0, 0.05, sigma=[0.199, 0.201])
+    vega = (prices[1] - prices[0]) / 0.002
+    exact = bsm_greeks_vec(100.0, 100.0, 1.0, 0.05, 0.2)["vega"]
+    assert vega == pytest.approx(exact, rel=0.02)
+
+
+def test_scenario_grid_shape_and_replay():
+    model = Heston(r=0.03, kappa=1.5, theta=0.04, xi=0.3, rho=-0.6, v0=0.04)
+    engine = RiskEngine(model, PutPayoff(100.0), 4_000, n_steps=10, rng=rng(), chunk_size=1_500)
+    prices, stderr = engine.scenarios([90.0, 100.0], 1.0, [0.02, 0.03, 0.04],
+                                      xi=[0.2, 0.4], v0=[0.03, 0.04, 0.05, 0.06])
+    assert prices.shape == (2, 3, 2, 4)
+    assert np.all(np.diff(prices, axis=3) > 0)
+    assert engine.price(100.0, 1.0, 0.03) == engine.price(100.0, 1.0, 0.03)
+    # the base scenario replays exactly the paths of a plain run
+    reference = price_mc(PutPayoff(100.0), model, 100.0, 1.0, 0.03, 4_000, 10,
+                         rng=rng(), chunk_size=1_500)
+    assert engine.price(100.0, 1.0, 0.03) == pytest.approx(reference, rel=1e-12)
+
+
+def test_barrier_spot_ladder_and_jump_intensity_bump():
+    payoff = BarrierPayoff(100.0, 120.0, "call", "up", "out")
+    model = Merton(r=0.05, sigma=0.2, lam=0.5, mu_j=-0.1, sigma_j=0.2)
+    engine = RiskEngine(model, payoff, 20_000, n_steps=20, rng=rng())
+    prices, _ = engine.scenarios([95.0, 100.0], 1.0, 0.05)
+    for S0, price in zip([95.0, 100.0], prices):
+        reference, _ = price_mc(payoff, model, S0, 1.0, 0.05, 20_000, 20, rng=rng())
+        assert price == pytest.approx(reference, rel=1e-12)
+    vanilla = RiskEngine(model, CallPayoff(100.0), 100_000, rng=rng())
+    price, stderr = vanilla.price(100.0, 1.0, 0.05, lam=1.0)
+    exact = Merton(r=0.05, sigma=0.2, lam=1.0, mu_j=-0.1, sigma_j=0.2).vanilla_price(
+        100.0, 100.0, 1.0)
+    assert price == pytest.approx(exact, abs=4 * stderr)
+
+
+def test_pricer_risk_engine_and_errors():
+    pricer = EuropeanPricer(BSM(r=0.05, sigma=0.2), CallPayoff(100.0), n_paths=10_000, seed=1)
+    engine = pricer.risk_engine()
+    price, stderr = engine.price(100.0, 1.0, 0.05)
+    assert price == pytest.approx(bsm_price(100.0, 100.0, 1.0, 0.05, 0.2), abs=4 * stderr)
+    with pytest.raises(ValueError):
+        engine.scenarios(100.0, 1.0, 0.05, vol=[0.2])
+    with pytest.raises(ValueError):
+        RiskEngine(BSM(r=0.05, sigma=0.2, qmc=True), CallPayoff(100.0), 1_000)
+
+
+def test_exact_scheme_replay_matches_plain_run():
+    model = Heston(r=0.03, kappa=1.5, theta=0.04, xi=1.0, rho=-0.7, v0=0.04, scheme="exact")
+    engine = RiskEngine(model, CallPayoff(100.0), 5_000, n_steps=4, rng=rng())
+    reference = price_mc(CallPayoff(100.0), model, 100.0, 1.0, 0.03, 5_000, 4, rng=rng())
+    assert engine.price(100.0, 1.0, 0.03) == pytest.approx(reference, rel=1e-12)
+    prices, _ = engine.scenarios(100.0, 1.0, 0.03, xi=[0.9, 1.1])
+    assert np.all(np.isfinite(prices))